@@ -6,6 +6,7 @@ from configargparse import ArgumentParser, Namespace
 
 from cabocha2ud.bd import BunsetsuDependencies
 from cabocha2ud.lib.logger import Logger
+from cabocha2ud.lib.text_object import TextObject
 from cabocha2ud.lib.yaml_dict import YamlDict
 from cabocha2ud.pipeline import PIPE_FUNCS_NAMES, RunnerPipeline
 from cabocha2ud.ud import UniversalDependencies
@@ -49,7 +50,13 @@ def _get_argparser() -> ArgumentParser:
     parser.add_argument("--dep-rule-file", default="conf/dep_suw_rule.yaml",
                         help="file for fit rule")
     parser.add_argument("--debug", action="store_true")
+    parser.add_argument("--verify-dep-rule", action="store_true",
+                        help="絞り込んだルールでのUD labelを全ルールを調べた結果と照合する")
     parser.add_argument("-t", "--temporary-file", action="store_true")
+    parser.add_argument("--stream", action="store_true",
+                        help="文書ごとに変換して書き出す（メモリを抑える）")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="文書ごとに並列で変換するプロセス数（2以上で --stream と同様に書き出す）")
     parser.add_argument("-w", "--writer", type=str, default="-")
     return parser
 
@@ -65,14 +72,35 @@ def get_args_and_options(arg_str: Optional[list[str]]=None) -> tuple[Namespace,
         "logger": logger, "rep_multi_root_mode": args.rep_multi_root_mode,
         "patch_file": args.patch_file, "sp_file": args.sp_file,
         "pos_rule_file": args.pos_rule_file, "dep_rule_file": args.dep_rule_file,
-        "temporary_file": args.temporary_file
+        "temporary_file": args.temporary_file, "verify_dep_rule": args.verify_dep_rule
     })
     return args, options
 
 
+def stream_main(args: Namespace, options: YamlDict) -> None:
+    """Convert document by document (in parallel if `--jobs`) and write immediately."""
+    bobj = BunsetsuDependencies(options=options)
+    uobj = UniversalDependencies(options=options)
+    runner = RunnerPipeline(
+        _bd=bobj, _ud=uobj, pipe=args.pipeline, options=options
+    )
+    writer = TextObject(file_name=args.writer, mode="w")
+    if args.jobs > 1:
+        writer.write(runner.parallel_pipeline(
+            bobj.iterate_cabocha_file(args.base_file, header_only=True), args.jobs
+        ))
+        return
+    writer.write(
+        str(sent) for sent in runner.iterate_pipeline(bobj.iterate_cabocha_file(args.base_file))
+    )
+
+
 def main() -> None:
     """For Convertion."""
     args, options = get_args_and_options()
+    if args.stream or args.jobs > 1:
+        stream_main(args, options)
+        return
     bobj = BunsetsuDependencies(file_name=args.base_file, options=options)
     uobj = UniversalDependencies(options=options)
     runner = RunnerPipeline(
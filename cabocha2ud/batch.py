@@ -0,0 +1,142 @@
+"""Batch converter for `WORK_DIR/cabocha/*/*.cabocha`.
+
+`scripts/convert_ud.sh` の代わりに、ルールを一度だけ読み込んだワーカーで一括変換する.
+
+```
+python -m cabocha2ud.batch WORK_DIR -c conf/bccwj_suw_args.yaml -j 4
+```
+
+`WORK_DIR/ud/(suw|luw)/[SPLIT]/[NAME].conllu` にファイルごとの変換結果を、
+`WORK_DIR/ud/(suw|luw)/ja_[WORK_DIR]-ud-[SPLIT].conllu` （長単位は `ja_[WORK_DIR]luw-ud-...`）に
+SPLITごとに連結したものを書き出す.
+"""
+
+import argparse
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from cabocha2ud.__main__ import get_args_and_options
+from cabocha2ud.bd import BunsetsuDependencies
+from cabocha2ud.lib.logger import Logger
+from cabocha2ud.pipeline import RunnerPipeline
+from cabocha2ud.ud import UniversalDependencies
+
+_WORKER_RUNNER: Optional[RunnerPipeline] = None
+
+
+def detect_word_unit(pipeline: list[str]) -> str:
+    """短単位か長単位かをパイプラインから判定する."""
+    if "build_luw" in pipeline:
+        return "luw"
+    return "suw"
+
+
+def load_order(order_file: Optional[str]) -> list[str]:
+    """書き出す順番（cabochaファイル名、拡張子なし）を読み込む."""
+    if order_file is None:
+        return []
+    with Path(order_file).open(encoding="utf-8") as rdr:
+        return [line.strip() for line in rdr if line.strip() != ""]
+
+
+def sort_cabocha_files(files: list[Path], order: list[str]) -> list[Path]:
+    """指定オーダーで並べる（指定にないものはファイル名順で後ろに並べる）."""
+    order_pos = {name: pos for pos, name in enumerate(order)}
+    return sorted(files, key=lambda p: (order_pos.get(p.stem, len(order_pos)), p.name))
+
+
+def collect_cabocha_files(cab_dir: Path, order: list[str]) -> dict[str, list[Path]]:
+    """SPLIT（`cabocha` 以下のフォルダ）ごとに cabocha ファイルを集める."""
+    return {
+        split_dir.name: sort_cabocha_files(list(split_dir.glob("*.cabocha")), order)
+        for split_dir in sorted(cab_dir.iterdir()) if split_dir.is_dir()
+    }
+
+
+def _init_worker(conv_args: list[str]) -> None:
+    """ワーカーを準備する（ルールの読み込みはワーカーごとに一度だけ）."""
+    global _WORKER_RUNNER  # noqa: PLW0603
+    args, options = get_args_and_options(conv_args)
+    _WORKER_RUNNER = RunnerPipeline(
+        _bd=BunsetsuDependencies(options=options), _ud=UniversalDependencies(options=options),
+        pipe=args.pipeline, options=options
+    )
+
+
+def _convert_file(cabocha_file: str, conllu_file: str) -> str:
+    """ワーカー側で1ファイルを変換する."""
+    assert _WORKER_RUNNER is not None
+    bobj = _WORKER_RUNNER.get_bd()
+    uobj = _WORKER_RUNNER.get_ud()
+    bobj.clear()
+    bobj.read_cabocha_file(cabocha_file)
+    uobj.set_sentences([])
+    _WORKER_RUNNER.do_pipeline()
+    uobj.write_ud_file(conllu_file)
+    return conllu_file
+
+
+def concat_files(files: list[Path], output_file: Path) -> None:
+    """ファイルを順番に連結する."""
+    with output_file.open("wb") as wrt:
+        for file_path in files:
+            with file_path.open("rb") as rdr:
+                shutil.copyfileobj(rdr, wrt)
+
+
+def _get_argparser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("work_dir", type=Path, help="`cabocha` フォルダを含む作業フォルダ")
+    parser.add_argument("-c", "--conf-file", required=True, help="cabocha2ud の設定ファイル")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="ワーカーのプロセス数")
+    parser.add_argument("--order-file", default=None,
+                        help="連結する順番（cabochaファイル名を1行ずつ、指定がなければファイル名順）")
+    parser.add_argument("--debug", action="store_true")
+    return parser
+
+
+def main(arg_str: Optional[list[str]]=None) -> None:
+    """Convert all cabocha files in `WORK_DIR`."""
+    args = _get_argparser().parse_args(arg_str)
+    logger = Logger(debug=args.debug)
+    work_dir: Path = args.work_dir
+    cab_dir = work_dir / "cabocha"
+    if not work_dir.is_dir():
+        msg = f"Please set WORK_DIR: you set --> {work_dir}"
+        raise FileNotFoundError(msg)
+    if not cab_dir.is_dir():
+        msg = f"Please create 'cabocha' in WORK_DIR: {work_dir}"
+        raise FileNotFoundError(msg)
+    conv_args = ["-", "-c", args.conf_file] + (["--debug"] if args.debug else [])
+    conv_opts, _ = get_args_and_options(conv_args)
+    word_unit = detect_word_unit(conv_opts.pipeline)
+    output_ud_dir = work_dir / "ud" / word_unit
+    split_files = collect_cabocha_files(cab_dir, load_order(args.order_file))
+    conllu_files: dict[str, list[Path]] = {}
+    for split, files in split_files.items():
+        (output_ud_dir / split).mkdir(parents=True, exist_ok=True)
+        conllu_files[split] = [output_ud_dir / split / f"{fpath.stem}.conllu" for fpath in files]
+    with ProcessPoolExecutor(
+        max_workers=args.jobs, initializer=_init_worker, initargs=(conv_args, )
+    ) as executor:
+        futures = [
+            executor.submit(_convert_file, str(cab_file), str(conllu_file))
+            for split, files in split_files.items()
+            for cab_file, conllu_file in zip(files, conllu_files[split])
+        ]
+        for future in futures:
+            logger.debug("converted %s", future.result())
+    unit_suffix = "luw" if word_unit == "luw" else ""
+    dir_name = work_dir.resolve().name.lower()
+    for split, files in conllu_files.items():
+        output_file = output_ud_dir / f"ja_{dir_name}{unit_suffix}-ud-{split}.conllu"
+        concat_files(files, output_file)
+        logger.info("saved %s", output_file)
+
+
+if __name__ == "__main__":
+    main()
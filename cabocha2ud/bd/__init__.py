@@ -2,9 +2,10 @@
 
 import collections
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from cabocha2ud.bd.document import Document
+from cabocha2ud.bd.index import CabochaIndex
 from cabocha2ud.bd.sentence import Sentence
 from cabocha2ud.lib.iterate_function import iterate_document
 from cabocha2ud.lib.logger import Logger
@@ -62,6 +63,18 @@ class BunsetsuDependencies(collections.UserList[Document]):
 
     def read_cabocha_file(self, file_name: Optional[str]=None) -> bool:
         """Read cabocha file."""
+        for doc in self.iterate_cabocha_file(file_name=file_name):
+            self.append(doc)
+        return True
+
+    def iterate_cabocha_file(
+        self, file_name: Optional[str]=None, header_only: bool=False
+    ) -> Iterator[Document]:
+        """Iterate documents of cabocha file.
+
+        文書ごとに読み込んでパースした `Document` を返す（selfには追加しない）.
+        `header_only` の場合は文書の属性のみパースする（文は `text` のまま）.
+        """
         if file_name is not None:
             self.file_name = file_name
             self.file_obj = TextObject(file_name=self.file_name)
@@ -69,20 +82,45 @@ class BunsetsuDependencies(collections.UserList[Document]):
         if self.file_name and self.file_name not in {"-"}:
             doc_name = Path(self.file_name).name or "doc"
         for text in iterate_document(
-            list(self.file_obj.read()), separate_info=True,
+            self.file_obj.read(), separate_info=True,
             default_doc_name=doc_name,
         ):
             prefix, ddoc, suffix = text
-            doc: Document = Document(
-                text=ddoc, prefix=prefix, suffix=suffix, base_file_name=self.file_name,
-                space_marker=self.options.get("space_marker", "　"),
-                debug=self.options.get("debug", False),
-                word_unit_mode=self.options.get("word_unit", "suw"),
-                logger=self.logger
-            )
-            doc.parse()
-            self.append(doc)
-        return True
+            doc = self.build_document(ddoc, prefix, suffix)
+            if header_only:
+                doc.parse_header()
+            else:
+                doc.parse()
+            yield doc
+
+    def read_indexed_document(self, index: CabochaIndex, doc_pos: int) -> Document:
+        """Read one document by `index` (ファイル全体は読まない).
+
+        文書は全体を読み込んだ場合と同じようにパースされ、selfに追加される.
+        """
+        self.file_name = index.file_name
+        self.file_obj = TextObject(file_name=self.file_name)
+        prefix, ddoc, suffix = next(iterate_document(
+            index.read_document_lines(doc_pos), separate_info=True,
+            strip_end=index.is_last(doc_pos),
+            default_doc_name=Path(self.file_name).name or "doc",
+        ))
+        doc = self.build_document(ddoc, prefix, suffix)
+        doc.parse()
+        self.append(doc)
+        return doc
+
+    def build_document(
+        self, text: list[str], prefix: Optional[list[str]], suffix: Optional[list[str]]
+    ) -> Document:
+        """Build (not parsed) document with options."""
+        return Document(
+            text=text, prefix=prefix, suffix=suffix, base_file_name=self.file_name,
+            space_marker=self.options.get("space_marker", "　"),
+            debug=self.options.get("debug", False),
+            word_unit_mode=self.options.get("word_unit", "suw"),
+            logger=self.logger
+        )
 
     def write_cabocha_file(self, file_name: str="-") -> None:
         """Write Cabocha file."""
@@ -9,6 +9,7 @@ import sys
 import configargparse
 
 from cabocha2ud.bd import BunsetsuDependencies
+from cabocha2ud.bd.index import CabochaIndex
 from cabocha2ud.lib.yaml_dict import YamlDict
 
 
@@ -19,6 +20,10 @@ def _get_argparser() -> configargparse.ArgumentParser:
     parser.add_argument("-s", "--skip-space", default=False, action="store_true")
     parser.add_argument("-m", "--space-marker",
                         choices=["zenkaku", "hankaku"], default="zenkaku", help="スペースに何を使うか")
+    parser.add_argument("--doc-id", type=str, default=None, help="指定した文書IDの文書のみ読む（索引を使う）")
+    parser.add_argument("--sent-id", type=str, default=None, help="指定した文IDを含む文書のみ読む（索引を使う）")
+    parser.add_argument("--save-index", action="store_true",
+                        help="--doc-id/--sent-id の索引を[FILE].idxに保存して次から使う")
     parser.add_argument("--debug", action="store_true")
     parser.add_argument("-w", "--writer", type=str, default="-")
     return parser
@@ -36,7 +41,15 @@ def main() -> None:
         "space_marker": args.space_marker,
         "debug": args.debug, "skip_space": args.skip_space
     })
-    bobj = BunsetsuDependencies(file_name=args.base_file, options=options)
+    if args.doc_id is not None or args.sent_id is not None:
+        index = CabochaIndex.load(args.base_file, save=args.save_index)
+        bobj = BunsetsuDependencies(options=options)
+        bobj.read_indexed_document(index, (
+            index.find_doc_id(args.doc_id) if args.doc_id is not None
+            else index.find_sent_id(args.sent_id)
+        ))
+    else:
+        bobj = BunsetsuDependencies(file_name=args.base_file, options=options)
     bobj.write_cabocha_file(args.writer)
 
 
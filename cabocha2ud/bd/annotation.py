@@ -2,6 +2,7 @@
 """BCCWJ DepParaPAS Annotation class."""
 
 import copy
+from bisect import insort
 from dataclasses import dataclass
 from itertools import permutations
 from typing import Literal, NamedTuple, Optional, Union
@@ -314,7 +315,11 @@ class Group(Annotation):
 
 
 class AnnotationList:
-    """Annotation list Object."""
+    """Annotation list Object.
+
+    セグメントは位置 `(start, end)` ごとにリスト上の番号を持つ（同じ位置なら後のものを返す）.
+    リンクはセグメント番号の組、グループはタグ名ごとに1つめのセグメントが含む文字位置で引く.
+    """
 
     def __init__(self, annotation_list: Optional[list[Annotation]]) -> None:
         """Init."""
@@ -324,21 +329,34 @@ class AnnotationList:
         self._segments: list[Segment] = [
             seg for seg in self._annotation_list if isinstance(seg, Segment)
         ]
-        self._seg_dict: dict[AnnoPosition, int] = {
-            s.pos: p for p, s in enumerate(self._segments)
-        }
+        self._seg_index: dict[tuple[int, int], list[int]] = {}
+        self._rebuild_seg_index()
         self._link_dict: dict[tuple[int, int], tuple[Annotation, Segment, Segment]] = {
             (seg.pos.pos1, seg.pos.pos2): (
                 seg, self._segments[seg.pos.pos1], self._segments[seg.pos.pos2]
             ) for seg in self._annotation_list
             if seg.get_identifier() in ["LINK_S", "LINK"]
         }
-        self._group_dict: dict[tuple[AnnoPosition, AnnoPosition], Group] = {}
+        group_dict: dict[tuple[AnnoPosition, AnnoPosition], Group] = {}
         for seg in self._annotation_list:
             if isinstance(seg, Group):
                 for sid1, sid2 in permutations(seg.groups_ids, 2):
                     seg1, seg2 = self._segments[sid1], self._segments[sid2]
-                    self._group_dict[(seg1.pos, seg2.pos)] = seg
+                    group_dict[(seg1.pos, seg2.pos)] = seg
+        # タグ名 -> [(seg1_start, seg1_end, seg2_start, seg2_end, group), ...]
+        self._group_index: dict[str, list[tuple[int, int, int, int, Group]]] = {}
+        for (seg1_pos, seg2_pos), group in group_dict.items():
+            self._group_index.setdefault(group.name, []).append(
+                (seg1_pos.pos1, seg1_pos.pos2, seg2_pos.pos1, seg2_pos.pos2, group)
+            )
+        # タグ名 -> 文字位置 -> その位置を含む1つめのセグメントの組（`get_group` で必要になったら作る）
+        self._group_pos_index: dict[str, dict[int, list[tuple[int, int, int, int, Group]]]] = {}
+
+    def _rebuild_seg_index(self) -> None:
+        """Rebuild position -> segment number index."""
+        self._seg_index = {}
+        for spos, seg in enumerate(self._segments):
+            self._seg_index.setdefault((seg.pos.pos1, seg.pos.pos2), []).append(spos)
 
     def __len__(self) -> int:
         """Get Lengh."""
@@ -356,16 +374,21 @@ class AnnotationList:
         self, anno: str, word1_pos: tuple[int, int], word2_pos: tuple[int, int]
     ) -> Union[Literal[-1], Group]:
         """Get anno for the two words."""
-        for seg_key, seg in list(self._group_dict.items()):
-            if seg.name != anno:
-                continue
-            seg1_key, seg2_key = seg_key
-            seg1_start_pos, seg1_end_pos = seg1_key
-            seg2_start_pos, seg2_end_pos = seg2_key
-            ff1 = seg1_start_pos <= word1_pos[0] and word1_pos[1] <= seg1_end_pos
-            ff2 = seg2_start_pos <= word2_pos[0] and word2_pos[1] <= seg2_end_pos
-            if ff1 and ff2:
-                return seg
+        if anno not in self._group_index:
+            return -1
+        if anno not in self._group_pos_index:
+            pos_index: dict[int, list[tuple[int, int, int, int, Group]]] = {}
+            for entry in self._group_index[anno]:
+                for cpos in range(entry[0], entry[1] + 1):
+                    pos_index.setdefault(cpos, []).append(entry)
+            self._group_pos_index[anno] = pos_index
+        word1_start, word1_end = word1_pos
+        word2_start, word2_end = word2_pos
+        for seg1_start, seg1_end, seg2_start, seg2_end, group in \
+                self._group_pos_index[anno].get(word1_start, []):
+            if (seg1_start <= word1_start and word1_end <= seg1_end
+                    and seg2_start <= word2_start and word2_end <= seg2_end):
+                return group
         return -1
 
     def get_link(
@@ -373,6 +396,8 @@ class AnnotationList:
         end_word_pos: Union[tuple[int, int], AnnoPosition]
     ) -> Union[Literal[-1], tuple[Annotation, Segment, Segment]]:
         """Get link."""
+        if len(self._link_dict) == 0:
+            return -1
         start, end = self.get_segment_pos(start_word_pos), self.get_segment_pos(end_word_pos)
         if start == -1 or end == -1:
             return -1
@@ -405,11 +430,10 @@ class AnnotationList:
 
     def get_segment_pos(self, pos: Union[tuple[int, int], AnnoPosition]) -> int:
         """Get segument."""
-        if isinstance(pos, tuple):
-            pos = AnnoPosition(pos[0], pos[1])
-        if pos not in self._seg_dict:
+        spos_list = self._seg_index.get((pos[0], pos[1]))
+        if spos_list is None:
             return -1
-        return self._seg_dict[pos]
+        return spos_list[-1]
 
     def get_annotations(self) -> list[Annotation]:
         """Get full annotations."""
@@ -421,12 +445,15 @@ class AnnotationList:
 
     def update_segment(self, seg: Segment, nseg: Segment) -> None:
         """Segment `seg`を `nseg`に入れ替える."""
-        assert seg in self._segments
-        sind = self._segments.index(seg)
+        # 同じセグメントは同じ位置にあるので、その位置の番号だけ確認する（`list.index` と同じ）
+        spos_list = self._seg_index.get((seg.pos.pos1, seg.pos.pos2), [])
+        sind = next((spos for spos in spos_list if self._segments[spos] == seg), None)
+        assert sind is not None
         self._segments[sind] = nseg
-        self._seg_dict: dict[AnnoPosition, int] = {
-            s.pos: p for p, s in enumerate(self._segments)
-        }
+        spos_list.remove(sind)
+        if len(spos_list) == 0:
+            del self._seg_index[(seg.pos.pos1, seg.pos.pos2)]
+        insort(self._seg_index.setdefault((nseg.pos.pos1, nseg.pos.pos2), []), sind)
 
     def append_segment(self, seg: Union[Segment, list[list[str]]]) -> None:
         """Append segment."""
@@ -434,15 +461,16 @@ class AnnotationList:
             seg = Segment(seg)
         self._annotation_list.append(seg)
         self._segments.append(seg)
-        self._seg_dict = {s.pos: p for p, s in enumerate(self._segments)}
+        self._seg_index.setdefault((seg.pos.pos1, seg.pos.pos2), []).append(len(self._segments) - 1)
 
     def remove_segment(self, seg: Segment) -> None:
         """Remove segment."""
-        assert self._seg_dict.get(seg.pos) is not None
-        npos = self._seg_dict[seg.pos]
+        npos = self.get_segment_pos(seg.pos)
+        assert npos != -1
         self._annotation_list.remove(self._segments[npos])
         self._segments.remove(self._segments[npos])
-        self._seg_dict = {s.pos: p for p, s in enumerate(self._segments)}
+        # 後ろの番号がずれるので作り直す
+        self._rebuild_seg_index()
 
 
 def get_annotation_object(seg: list[list[str]]) -> Annotation:
@@ -5,12 +5,13 @@ from __future__ import annotations
 import bisect
 import copy
 import re
-from typing import TYPE_CHECKING, Any, Pattern, cast
+from typing import TYPE_CHECKING, Any, Iterable, Pattern, SupportsIndex, cast
 
 if TYPE_CHECKING:
     from .sentence import Sentence
     from .word import Word
 
+from cabocha2ud.bd.util import FeatureTables
 from cabocha2ud.bd.word import Word
 from cabocha2ud.lib.logger import Logger
 from cabocha2ud.rule.bunsetu_rule import detect_bunsetu_pos
@@ -27,7 +28,7 @@ class Bunsetu(list["Word"]):
         base_file_name: str | None=None, debug:bool=False,
         prev_bunsetu: Bunsetu|None=None, parent_sent: Sentence|None=None,
         logger: Logger | None=None,
-        word_unit_mode: str="suw"
+        word_unit_mode: str="suw", feature_tables: FeatureTables | None=None
     ) -> None:
         """Init."""
         super().__init__()
@@ -35,6 +36,7 @@ class Bunsetu(list["Word"]):
         self.debug: bool = debug
         self.logger: Logger = logger or Logger()
         self.word_unit_mode = word_unit_mode
+        self.feature_tables: FeatureTables = feature_tables or FeatureTables()
 
         self.sent_pos = sent_pos
         self.bunsetu_pos: int | None = None
@@ -71,6 +73,46 @@ class Bunsetu(list["Word"]):
         """Get words."""
         return list(self)
 
+    def _invalidate_sent_words(self) -> None:
+        """単語が増減したので、文の単語リストのキャッシュを破棄する."""
+        if self.parent_sent is not None:
+            self.parent_sent.invalidate_words()
+
+    def append(self, wrd: Word) -> None:
+        """Append word."""
+        super().append(wrd)
+        self._invalidate_sent_words()
+
+    def extend(self, wrds: Iterable[Word]) -> None:
+        """Extend word list."""
+        super().extend(wrds)
+        self._invalidate_sent_words()
+
+    def insert(self, index: SupportsIndex, wrd: Word) -> None:
+        """Insert word."""
+        super().insert(index, wrd)
+        self._invalidate_sent_words()
+
+    def pop(self, index: SupportsIndex=-1) -> Word:
+        """Pop word."""
+        self._invalidate_sent_words()
+        return super().pop(index)
+
+    def clear(self) -> None:
+        """Clear word list."""
+        super().clear()
+        self._invalidate_sent_words()
+
+    def __setitem__(self, index: Any, wrd: Any) -> None:
+        """Set word."""
+        super().__setitem__(index, wrd)
+        self._invalidate_sent_words()
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        """Delete word."""
+        super().__delitem__(index)
+        self._invalidate_sent_words()
+
     def is_inner_brank_word(self, pos: int) -> bool:
         """文節のなかで位置tはカッコ内部かどうか.
 
@@ -131,7 +173,8 @@ class Bunsetu(list["Word"]):
                 "bunsetu_pos": self.bunsetu_pos,
                 "word_pos": pos, "token": token,
                 "word_unit_mode": self.word_unit_mode,
-                "bunsetu": self, "logger": self.logger
+                "bunsetu": self, "logger": self.logger,
+                "feature_tables": self.feature_tables
             }
             self.append(Word(**_ddd))
 
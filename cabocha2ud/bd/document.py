@@ -20,6 +20,7 @@ from cabocha2ud.rule.remove_space import skip_jsp_token_from_sentence
 
 from .annotation import AnnotationList, DocAnnotation, generate_docannotation, get_annotation_object
 from .sentence import Sentence
+from .util import FeatureTables
 
 RE_SAHEN_MATCH = re.compile("^名詞.*サ変.*")
 
@@ -96,6 +97,8 @@ class Document(list["Sentence"]):
     ) -> None:
         """Init."""
         self.base_file_name: Optional[str] = base_file_name
+        # 素性列の表（同じ素性列の単語でタプルと派生値を共有する）. 文書と一緒に捨てられる
+        self.feature_tables: FeatureTables = FeatureTables()
         self.debug: bool = debug
         self.logger: Logger = logger or Logger()
         # モードオプション   suw or luw
@@ -120,11 +123,37 @@ class Document(list["Sentence"]):
         else:
             raise NotImplementedError
 
+    def parse_header(self) -> None:
+        """Parse only document attributes (`#! DOC` の行のみ)."""
+        if self.prefix is None:
+            raise NotImplementedError
+        self.doc_attributes = generate_docannotation(self.prefix)
+        # パース後に取得
+        self.logger.debug("debug: doc_attr = %s", self.doc_attributes.attrib)
+        if self.doc_attributes.attrib is not None:
+            doc_attrs = self.doc_attributes.attrib
+            if doc_attrs is not None:
+                self.doc_attrib_xml = ET.fromstring(
+                    # ruff: noqa: S314
+                    "<root>" + doc_attrs.replace("&", "&amp;") + "</root>"
+                )
+        self.doc_id = get_doc_id(self)
+
     def convert_ud(
         self, pos_rule: list, dep_rule: list[tuple[list[SubRule], str]],
         skip_space: bool=True, sep: str="\n"
     ) -> list[str]:
         """Convert to UD format."""
+        self.prepare_ud(pos_rule, dep_rule, skip_space=skip_space)
+        return [
+            sent.convert() + sep for sent in self.sentences()
+        ]
+
+    def prepare_ud(
+        self, pos_rule: list, dep_rule: list[tuple[list[SubRule], str]],
+        skip_space: bool=True
+    ) -> None:
+        """UD の品詞・係り先・ラベルを確定させる（文字列にはしない）."""
         self.detect_ud_dependencies()
         # UD掛かり先ラベルを付与
         for sent in self.sentences():
@@ -134,9 +163,6 @@ class Document(list["Sentence"]):
             skip_jsp_token_from_sentence(self)
         # UD確定の後処理
         post_proceeing_function(self, dep_rule)
-        return [
-            sent.convert() + sep for sent in self.sentences()
-        ]
 
     def __str__(self) -> str:
         """Str."""
@@ -175,17 +201,8 @@ class Document(list["Sentence"]):
                     self[nspos][bpos][wpos].sent_pos = nspos
 
     def __parse(self, text: list[str], prefix: list[str], suffix: list[str]) -> None:
-        self.doc_attributes = generate_docannotation(prefix)
-        # パース後に取得
-        self.logger.debug("debug: doc_attr = %s", self.doc_attributes.attrib)
-        if self.doc_attributes.attrib is not None:
-            doc_attrs = self.doc_attributes.attrib
-            if doc_attrs is not None:
-                self.doc_attrib_xml = ET.fromstring(
-                    # ruff: noqa: S314
-                    "<root>" + doc_attrs.replace("&", "&amp;") + "</root>"
-                )
-        self.doc_id = get_doc_id(self)
+        self.prefix = prefix
+        self.parse_header()
         doc_annotation = suffix
         self.doc_annotation = AnnotationList([
             get_annotation_object(seg)
@@ -199,7 +216,8 @@ class Document(list["Sentence"]):
                     base_file_name=self.base_file_name,
                     space_marker=self.space_marker,
                     word_unit_mode=self.word_unit_mode,
-                    debug=self.debug, logger=self.logger
+                    debug=self.debug, logger=self.logger,
+                    feature_tables=self.feature_tables
                 )
             )
             self[-1].set_document(self)
@@ -0,0 +1,236 @@
+"""Offset index of cabocha file (random access to documents).
+
+ファイルを一度だけ（mmapで）走査して、文書（`#! DOC`）と文（`EOS`）の
+バイト位置と文書ID・文IDを記録する. `save=True` のときは索引をファイルの隣（`[FILE].idx`）に
+保存し、ファイルが変わっていなければ次からはそれを読む.
+
+```
+index = CabochaIndex.load("corpus.cabocha", save=True)
+bobj = BunsetsuDependencies()
+bobj.read_indexed_document(index, index.find_sent_id("DOC0001-3"))
+```
+"""
+
+import io
+import json
+import mmap
+import re
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from cabocha2ud.bd.annotation import AnnotationList, get_annotation_object
+from cabocha2ud.bd.document import Document
+from cabocha2ud.lib.iterate_function import iterate_seg_and_link
+from cabocha2ud.lib.logger import Logger, LogLevel, get_shared_logger
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".idx"
+ENCODING = "utf-8"
+
+
+class SentenceEntry(NamedTuple):
+    """文の位置（`EOS` の行末まで）と文ID."""
+
+    start: int
+    end: int
+    sent_id: str
+
+
+class DocumentEntry(NamedTuple):
+    """文書の位置と文書ID、文の一覧."""
+
+    start: int
+    end: int
+    doc_id: str
+    sentences: list[SentenceEntry]
+
+
+def _decode_lines(data: bytes) -> list[str]:
+    """`TextObject.read` と同じように行に分ける."""
+    with io.TextIOWrapper(io.BytesIO(data), encoding=ENCODING) as rdr:
+        return [line.rstrip("\n") for line in rdr]
+
+
+def _get_boundary_re(head: bytes) -> re.Pattern[bytes]:
+    """文書の区切り（`iterate_document` と同じ）と `EOS` にマッチする正規表現."""
+    doc_header = rb"#! DOCID\s" if head.startswith(b"#! DOCID") else rb"#! DOC\s"
+    return re.compile(rb"^(?:(?P<doc>" + doc_header + rb")|EOS)", re.MULTILINE)
+
+
+class CabochaIndex:
+    """Cabocha file index.
+
+    Attributes:
+        file_name (str): cabocha file name
+        documents (list[DocumentEntry]): 文書ごとの位置
+
+    """
+
+    def __init__(
+        self, file_name: str, documents: list[DocumentEntry],
+        size: int, mtime_ns: int, logger: Optional[Logger]=None
+    ) -> None:
+        """Init."""
+        self.file_name: str = file_name
+        self.documents: list[DocumentEntry] = documents
+        self.size: int = size
+        self.mtime_ns: int = mtime_ns
+        self.logger: Logger = logger or get_shared_logger()
+        self._doc_ids: Optional[dict[str, int]] = None
+        self._sent_ids: Optional[dict[str, int]] = None
+
+    def __len__(self) -> int:
+        """Return the number of documents."""
+        return len(self.documents)
+
+    @staticmethod
+    def get_index_file_name(file_name: str) -> str:
+        """Return index file name for `file_name`."""
+        return file_name + INDEX_SUFFIX
+
+    @classmethod
+    def build(cls, file_name: str, logger: Optional[Logger]=None) -> "CabochaIndex":
+        """Build index by scanning `file_name` once."""
+        stat = Path(file_name).stat()
+        doc_name = Path(file_name).name or "doc"
+        documents: list[DocumentEntry] = []
+        if stat.st_size == 0:
+            return cls(file_name, documents, stat.st_size, stat.st_mtime_ns, logger=logger)
+        with Path(file_name).open("rb") as rdr, \
+                mmap.mmap(rdr.fileno(), 0, access=mmap.ACCESS_READ) as mem:
+            has_header = mem[:6] == b"#! DOC"
+            doc_start = 0
+            eos_ends: list[int] = []
+            for mobj in _get_boundary_re(mem[:8]).finditer(mem):
+                if mobj.group("doc") is not None:
+                    if mobj.start() > doc_start:
+                        documents.append(_build_entry(
+                            mem, doc_start, mobj.start(), eos_ends,
+                            None if has_header or len(documents) > 0 else doc_name, file_name
+                        ))
+                    doc_start, eos_ends = mobj.start(), []
+                    continue
+                line_end = mem.find(b"\n", mobj.end())
+                eos_ends.append(len(mem) if line_end < 0 else line_end + 1)
+            documents.append(_build_entry(
+                mem, doc_start, len(mem), eos_ends,
+                None if has_header or len(documents) > 0 else doc_name, file_name
+            ))
+        return cls(file_name, documents, stat.st_size, stat.st_mtime_ns, logger=logger)
+
+    @classmethod
+    def load(
+        cls, file_name: str, save: bool=False, logger: Optional[Logger]=None
+    ) -> "CabochaIndex":
+        """Load index file next to `file_name` (ファイルが更新されていれば作り直す).
+
+        作り直した索引は `save` が True のときのみ `[FILE].idx` に書き出す.
+        """
+        index_file = Path(cls.get_index_file_name(file_name))
+        stat = Path(file_name).stat()
+        if index_file.exists():
+            with index_file.open(encoding=ENCODING) as rdr:
+                data = json.load(rdr)
+            if (data.get("version") == INDEX_VERSION and data.get("size") == stat.st_size
+                    and data.get("mtime_ns") == stat.st_mtime_ns):
+                return cls(file_name, [
+                    DocumentEntry(start, end, doc_id, [SentenceEntry(*sent) for sent in sents])
+                    for start, end, doc_id, sents in data["documents"]
+                ], stat.st_size, stat.st_mtime_ns, logger=logger)
+        index = cls.build(file_name, logger=logger)
+        if save:
+            try:
+                index.save()
+            except OSError as err:
+                index.logger.message("cannot save index file: %s", err, mode=LogLevel.WARN)
+        return index
+
+    def save(self, index_file: Optional[str]=None) -> None:
+        """Save index (JSON)."""
+        index_file = index_file or self.get_index_file_name(self.file_name)
+        with Path(index_file).open("w", encoding=ENCODING) as wrt:
+            json.dump({
+                "version": INDEX_VERSION, "size": self.size, "mtime_ns": self.mtime_ns,
+                "documents": self.documents
+            }, wrt, ensure_ascii=False)
+
+    def find_doc_id(self, doc_id: str) -> int:
+        """Return document position of `doc_id`."""
+        if self._doc_ids is None:
+            self._doc_ids = {}
+            for pos, doc in enumerate(self.documents):
+                self._doc_ids.setdefault(doc.doc_id, pos)
+        if doc_id not in self._doc_ids:
+            msg = f"doc_id `{doc_id}` is not found in {self.file_name}"
+            raise KeyError(msg)
+        return self._doc_ids[doc_id]
+
+    def find_sent_id(self, sent_id: str) -> int:
+        """Return document position which has `sent_id`."""
+        if self._sent_ids is None:
+            self._sent_ids = {}
+            for pos, doc in enumerate(self.documents):
+                for sent in doc.sentences:
+                    self._sent_ids.setdefault(sent.sent_id, pos)
+        if sent_id not in self._sent_ids:
+            msg = f"sent_id `{sent_id}` is not found in {self.file_name}"
+            raise KeyError(msg)
+        return self._sent_ids[sent_id]
+
+    def read_document_lines(self, doc_pos: int) -> list[str]:
+        """Read lines of the document (ファイル全体は読まない)."""
+        entry = self.documents[doc_pos]
+        with Path(self.file_name).open("rb") as rdr:
+            rdr.seek(entry.start)
+            return _decode_lines(rdr.read(entry.end - entry.start))
+
+    def is_last(self, doc_pos: int) -> bool:
+        """Return whether the document is the last one."""
+        return doc_pos == len(self.documents) - 1 or doc_pos == -1
+
+
+def _build_entry(
+    mem: mmap.mmap, start: int, end: int, eos_ends: list[int],
+    default_doc_name: Optional[str], file_name: str
+) -> DocumentEntry:
+    """文書の位置から文書IDと文IDを求める（文書の属性と文のIDの注釈だけ読む）."""
+    prefix: list[str] = []
+    body_start = start
+    while body_start < end and mem[body_start:body_start + 3] == b"#! ":
+        line_end = mem.find(b"\n", body_start, end)
+        line_end = end if line_end < 0 else line_end + 1
+        prefix.extend(_decode_lines(mem[body_start:line_end]))
+        body_start = line_end
+    if default_doc_name is not None:
+        # `iterate_document` と同じ（DOCのないファイル）
+        prefix = ["#! DOC 0", f"#! DOCID\t1\t{default_doc_name}", *prefix]
+    doc = Document(
+        text=[], prefix=prefix, suffix=[], base_file_name=file_name, logger=get_shared_logger()
+    )
+    doc.parse_header()
+    assert doc.doc_id is not None
+    sentences: list[SentenceEntry] = []
+    sent_start = body_start
+    for pos, sent_end in enumerate(eos_ends):
+        sent_id = doc.doc_id + "-" + str(pos + 1) if len(eos_ends) > 1 else doc.doc_id
+        if mem.find(b"sent-id", sent_start, sent_end) >= 0:
+            sent_id = _get_annotated_sent_id(_decode_lines(mem[sent_start:sent_end])) or sent_id
+        sentences.append(SentenceEntry(sent_start, sent_end, sent_id))
+        sent_start = sent_end
+    return DocumentEntry(start, end, doc.doc_id, sentences)
+
+
+def _get_annotated_sent_id(lines: list[str]) -> Optional[str]:
+    """文末（`EOS` の前）の注釈から `sent-id` を取り出す."""
+    suffix: list[str] = []
+    for line in reversed(lines[:-1]):
+        if not line.startswith("#! "):
+            break
+        suffix.insert(0, line)
+    annotation_list = AnnotationList([
+        get_annotation_object(seg) for seg in iterate_seg_and_link(suffix)
+    ])
+    annotations = annotation_list.find_key_annotations("sent-id")
+    if len(annotations) == 0:
+        return None
+    return annotations[0].get_attr_value("sent-id")
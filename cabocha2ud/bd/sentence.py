@@ -2,7 +2,7 @@
 
 import xml.etree.ElementTree as ET
 from collections import deque
-from typing import TYPE_CHECKING, Optional, cast
+from typing import TYPE_CHECKING, Any, Iterable, Optional, SupportsIndex, cast
 
 if TYPE_CHECKING:
     from .bunsetu import Bunsetu
@@ -10,8 +10,9 @@ if TYPE_CHECKING:
 
 from cabocha2ud.bd.annotation import AnnotationList, Segment, get_annotation_object
 from cabocha2ud.bd.bunsetu import Bunsetu
+from cabocha2ud.bd.util import FeatureTables
 from cabocha2ud.bd.word import Word
-from cabocha2ud.lib.dependency import get_caused_nonprojectivities
+from cabocha2ud.lib.dependency import get_all_caused_nonprojectivities
 from cabocha2ud.lib.iterate_function import iterate_bunsetu, iterate_seg_and_link
 from cabocha2ud.lib.logger import Logger
 
@@ -24,7 +25,8 @@ class Sentence(list["Bunsetu"]):
         self, sent_pos: int, sentence_lines: list[str], suffix: list[str] | None,
         doc: "Document", base_file_name: str|None=None,
         word_unit_mode: str="suw",
-        space_marker: str="　", debug: bool=False, logger: Optional[Logger]=None
+        space_marker: str="　", debug: bool=False, logger: Optional[Logger]=None,
+        feature_tables: Optional[FeatureTables]=None
     ) -> None:
         """Init Sentence."""
         self.base_file_name: str|None = base_file_name
@@ -36,10 +38,13 @@ class Sentence(list["Bunsetu"]):
         self.sent_id: str|None = None
         self.annotation_list: AnnotationList
         self.word_dep_child: Optional[dict[int, set[int]]] = None
+        # words() のキャッシュ（文節・単語の増減で破棄する）
+        self._words: Optional[list[Word]] = None
         # abs_pos_* represent abstract position (begin1, end1), (begin2, end2), ...
         self.abs_pos_list: list[tuple[int, int]] = []
         self.abs_pos_dict: dict[tuple[int, int], int] = {}
         self.space_marker: str = space_marker
+        self.feature_tables: FeatureTables = feature_tables or FeatureTables()
         self.__parse(sentence_lines, [] if suffix is None else suffix)
 
     def __str__(self) -> str:
@@ -63,12 +68,15 @@ class Sentence(list["Bunsetu"]):
         ])
 
     def get_ud_children(self, word: Word, is_reconst: bool=False) -> set[int]:
-        """Get UD child position."""
+        """Get UD child position.
+
+        子リストは `Word.dep_num` の変更で更新されるため、`is_reconst` は作り直したい場合のみ.
+        """
         if self.word_dep_child is None or is_reconst:
             self._update_ud_children()
         assert self.word_dep_child is not None
         if word.token_pos in self.word_dep_child:
-            return self.word_dep_child[word.token_pos]
+            return set(self.word_dep_child[word.token_pos])
         return set({})
 
     def _update_ud_children(self) -> None:
@@ -79,12 +87,70 @@ class Sentence(list["Bunsetu"]):
             if tword.dep_num not in word_dep_child:
                 word_dep_child[tword.dep_num] = set({})
             word_dep_child[tword.dep_num].add(tword.token_pos)
-        self.word_dep_child = word_dep_child.copy()
+        self.word_dep_child = word_dep_child
+
+    def move_ud_child(self, tok_pos: int, old_dep_num: int | None, dep_num: int | None) -> None:
+        """`tok_pos` の単語の掛かり先の変更を子リストに反映する."""
+        if self.word_dep_child is None:
+            return
+        if old_dep_num in self.word_dep_child:
+            self.word_dep_child[old_dep_num].discard(tok_pos)
+        if dep_num is None:
+            # 掛かり先のない単語があれば作り直す
+            self.word_dep_child = None
+            return
+        if dep_num not in self.word_dep_child:
+            self.word_dep_child[dep_num] = set({})
+        self.word_dep_child[dep_num].add(tok_pos)
+
+    def reset_ud_children(self) -> None:
+        """子リストを破棄する（次に使うときに作り直す）."""
+        self.word_dep_child = None
 
     def bunsetues(self) -> list[Bunsetu]:
         """Return bunsetu list."""
         return list(self)
 
+    def invalidate_words(self) -> None:
+        """単語リストのキャッシュを破棄する."""
+        self._words = None
+        self.word_dep_child = None
+
+    def append(self, bun: Bunsetu) -> None:
+        """Append bunsetu."""
+        super().append(bun)
+        self.invalidate_words()
+
+    def extend(self, buns: Iterable[Bunsetu]) -> None:
+        """Extend bunsetu list."""
+        super().extend(buns)
+        self.invalidate_words()
+
+    def insert(self, index: SupportsIndex, bun: Bunsetu) -> None:
+        """Insert bunsetu."""
+        super().insert(index, bun)
+        self.invalidate_words()
+
+    def pop(self, index: SupportsIndex=-1) -> Bunsetu:
+        """Pop bunsetu."""
+        self.invalidate_words()
+        return super().pop(index)
+
+    def clear(self) -> None:
+        """Clear bunsetu list."""
+        super().clear()
+        self.invalidate_words()
+
+    def __setitem__(self, index: Any, bun: Any) -> None:
+        """Set bunsetu."""
+        super().__setitem__(index, bun)
+        self.invalidate_words()
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        """Delete bunsetu."""
+        super().__delitem__(index)
+        self.invalidate_words()
+
     def update_bunsetu(self, position: int, bun: Bunsetu) -> None:
         """Update bunsetu."""
         assert 0 <= position < len(self)
@@ -109,7 +175,9 @@ class Sentence(list["Bunsetu"]):
         """Extract word by token pos."""
         if tok_pos < 0:
             return None
-        assert all(len(bun) > 0 for bun in self)
+        if self._words is None:
+            # 文節・単語が変更されていなければ確認済み
+            assert all(len(bun) > 0 for bun in self)
         return self.words()[tok_pos]
 
     def iterate_word_tree(self) -> list[Word]:
@@ -142,11 +210,13 @@ class Sentence(list["Bunsetu"]):
         return [self.words()[n] for n in norder]
 
     def words(self) -> list[Word]:
-        """Get word's list."""
-        return [
-            word for bunsetu in self.bunsetues()
-            for word in bunsetu.words()
-        ]
+        """Get word's list.
+
+        文節・単語が変更されるまでは同じリストを返すため、返り値は変更しないこと.
+        """
+        if self._words is None:
+            self._words = [word for bunsetu in self for word in bunsetu]
+        return self._words
 
     def __parse(self, sentence_lines: list[str], annotation_list: list[str]) ->  None:
         self.annotation_list = AnnotationList([
@@ -160,7 +230,8 @@ class Sentence(list["Bunsetu"]):
                     self.sent_pos, bunsetu,
                     base_file_name=self.base_file_name, debug=self.debug,
                     prev_bunsetu=prev_bunsetu, parent_sent=self,
-                    logger=self.logger, word_unit_mode=self.word_unit_mode
+                    logger=self.logger, word_unit_mode=self.word_unit_mode,
+                    feature_tables=self.feature_tables
                 )
             )
             prev_bunsetu = self[-1]
@@ -196,12 +267,11 @@ class Sentence(list["Bunsetu"]):
             return True
         # 文節間で交差があるか確認をする
         nonprojectives = {}
+        all_nonprojectivities = get_all_caused_nonprojectivities(_bunsetu_dep)
         for bunsetu in self.bunsetues():
             assert isinstance(bunsetu.bunsetu_pos, int)
             assert isinstance(bunsetu.dep_pos, int)
-            res = [
-                r - 1 for r in get_caused_nonprojectivities(bunsetu.bunsetu_pos+1, _bunsetu_dep)
-            ]
+            res = [r - 1 for r in all_nonprojectivities[bunsetu.bunsetu_pos+1]]
             if len(res) > 0:
                 # 部分並列になるものはDXと表現されるため、そのものは除外
                 if bunsetu.dep_type == "DX":
@@ -252,6 +322,7 @@ class Sentence(list["Bunsetu"]):
 
     def update_word_pos(self) -> None:
         """単語の位置を決める."""
+        self.invalidate_words()
         self.abs_pos_list = []
         for pos, word in enumerate(self.words()):
             word.sent_pos = self.sent_pos
@@ -285,6 +356,10 @@ class Sentence(list["Bunsetu"]):
 
     def get_ud_header(self) -> str:
         """Get header for sent."""
+        return "\n".join([f"# {t} = {i}" for t, i in self.get_ud_header_items()]) + "\n"
+
+    def get_ud_header_items(self) -> list[tuple[str, str]]:
+        """Get header (key, value) list for sent."""
         self.set_sent_id()
         header: list = [("sent_id", self.sent_id)]
         header.append(("text", self.get_text().strip(self.space_marker)))
@@ -293,7 +368,7 @@ class Sentence(list["Bunsetu"]):
             txt = self.doc.doc_attrib_xml.find("english_text")
             eng_txt = cast(str, cast(ET.Element, txt).text).replace("# english_text = ", "")
             header.append(("text_en", eng_txt))
-        return "\n".join([f"# {t} = {i}" for t, i in header]) + "\n"
+        return header
 
     def convert(self, sep: str="\t") -> str:
         """ww.convert() ``update ud_misc``, so code order do not changed."""
@@ -1,10 +1,15 @@
 """Util function or module for Bunsetu Depenedencies."""
 
 import csv
+import sys
+from collections import Counter
+from collections.abc import Callable, Hashable
 from enum import IntEnum
 from io import StringIO
 from typing import Any
 
+FeatureRow = tuple[str, ...]
+
 
 class DoNotExceptSizeError(Exception):
     """Exception raised for errors in the input size."""
@@ -112,19 +117,23 @@ class LUWFeaField(IntEnum):
 def csv_split(
     csv_str: str, delimiter: str=",", expect_size: int|None=None
 ) -> list[str]:
-    """Csv split."""
+    """Csv split.
+
+    引用符や改行を含まない場合は `str.split` で分割し、含む場合のみ csv モジュールを使う.
+    """
     # ruff: noqa: RUF001
     if csv_str == "補助記号,読点,*,*,,,,，,,,,,,,記号,,,,,,,,,,,,,,,13752552530432,50":
         # GSDの例外
         csv_str = '補助記号,読点,*,*,,,,，,",",,",",,記号,,,,,,,,,,,,,,,13752552530432,50'
-    splited =  next(iter(csv.reader(StringIO(csv_str), delimiter=delimiter)))
-    if expect_size is not None:
-        try:
-            assert len(splited) == expect_size, csv_str
-        except AssertionError as e:
-            msg = f"期待通りのサイズではありません: {expect_size} 「{csv_str}」"
-            raise DoNotExceptSizeError(msg) from e
-    return next(iter(csv.reader(StringIO(csv_str), delimiter=delimiter)))
+    splited: list[str]
+    if csv_str != "" and '"' not in csv_str and "\n" not in csv_str and "\r" not in csv_str:
+        splited = csv_str.split(delimiter)
+    else:
+        splited = next(iter(csv.reader(StringIO(csv_str), delimiter=delimiter)))
+    if expect_size is not None and len(splited) != expect_size:
+        msg = f"期待通りのサイズではありません: {expect_size} 「{csv_str}」"
+        raise DoNotExceptSizeError(msg)
+    return splited
 
 
 def csv_join(cols: list[str], delimiter: str=",") -> str:
@@ -133,3 +142,92 @@ def csv_join(cols: list[str], delimiter: str=",") -> str:
     joiner = csv.writer(gstr, delimiter=delimiter, lineterminator="\n")
     joiner.writerow(cols)
     return gstr.getvalue().rstrip("\n")
+
+
+# 素性列の表の派生値の (名前, hit) ごとの回数（`enable_derive_stats` のあとのみ数える）
+DERIVE_COUNTER: Counter[tuple[str, bool]] | None = None
+
+
+def enable_derive_stats() -> None:
+    """素性列の表の派生値キャッシュの hit/miss を数え始める（--debug のときのみ使う）."""
+    global DERIVE_COUNTER  # noqa: PLW0603
+    if DERIVE_COUNTER is None:
+        DERIVE_COUNTER = Counter()
+
+
+def get_derive_stats() -> dict[str, tuple[int, int]]:
+    """素性列の表の派生値キャッシュの (hit, miss) を派生値ごとに返す."""
+    if DERIVE_COUNTER is None:
+        return {}
+    names = sorted({name for name, _ in DERIVE_COUNTER})
+    return {name: (DERIVE_COUNTER[(name, True)], DERIVE_COUNTER[(name, False)]) for name in names}
+
+
+class FeatureRowTable:
+    """素性列の文字列から分割済みの素性（タプル）を引く表.
+
+    同じ解析結果（素性列）の単語は同じタプルを共有するので、
+    タプルの同一性（id）で派生値（xposなど）もキャッシュできる.
+    """
+
+    def __init__(self) -> None:
+        """Init."""
+        self._rows: dict[str, FeatureRow] = {}
+        self._row_ids: set[int] = set()
+        self._derived: dict[tuple[int, str, Hashable], Any] = {}
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self._rows)
+
+    def intern(self, csv_str: str, split_func: Callable[[str], list[str]]) -> FeatureRow:
+        """`csv_str` を `split_func` で分割したタプルを返す（同じ文字列なら同じタプル）."""
+        row = self._rows.get(csv_str)
+        if row is None:
+            row = tuple(sys.intern(fes) for fes in split_func(csv_str))
+            self._rows[csv_str] = row
+            self._row_ids.add(id(row))
+        return row
+
+    def derive(
+        self, row: FeatureRow | list[str], name: str, func: Callable[[], Any],
+        extra: Hashable=None
+    ) -> Any:
+        """`row` から求めた派生値 `name` を返す（表にある行ならキャッシュする）.
+
+        `row` 以外の値にもよる派生値は、その値をすべて `extra` に渡す（キャッシュのキーに含める）.
+        """
+        key = (id(row), name, extra)
+        if key in self._derived:
+            if DERIVE_COUNTER is not None:
+                DERIVE_COUNTER[(name, True)] += 1
+            return self._derived[key]
+        if DERIVE_COUNTER is not None:
+            DERIVE_COUNTER[(name, False)] += 1
+        value = func()
+        if id(row) in self._row_ids:
+            self._derived[key] = value
+        return value
+
+    def clear(self) -> None:
+        """Clear the table."""
+        self._rows.clear()
+        self._row_ids.clear()
+        self._derived.clear()
+
+
+class FeatureTables:
+    """短単位と長単位の素性列の表（文書ごとに持つ）.
+
+    Attributes:
+        suw (FeatureRowTable): 短単位の素性列の表
+        luw (FeatureRowTable): 長単位の素性列の表
+
+    """
+
+    __slots__ = ("luw", "suw")
+
+    def __init__(self) -> None:
+        """Init."""
+        self.suw: FeatureRowTable = FeatureRowTable()
+        self.luw: FeatureRowTable = FeatureRowTable()
@@ -4,10 +4,19 @@ from __future__ import annotations
 
 import re
 import string
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Union, cast
 
-from cabocha2ud.bd.util import DoNotExceptSizeError, LUWFeaField, SUWFeaField, csv_join, csv_split
-from cabocha2ud.lib.logger import Logger
+from cabocha2ud.bd.util import (
+    DoNotExceptSizeError,
+    FeatureRow,
+    FeatureTables,
+    LUWFeaField,
+    SUWFeaField,
+    csv_join,
+    csv_split,
+)
+from cabocha2ud.lib.logger import Logger, get_shared_logger
 
 if TYPE_CHECKING:
     # ruff: noqa: TCH004
@@ -58,7 +67,7 @@ UNIDIC_ORIGIN_CONV = {
 
 
 def conv_v29_lemma(
-    origin: str, features: list[str], pos1_pos: int, lemma_pos: int, orthbase_pos: int
+    origin: str, features: Sequence[str], pos1_pos: int, lemma_pos: int, orthbase_pos: int
 ) -> str:
     """Convert old lemma."""
     lemma_dic = {"ぽい": "ぽい", "臭い": "臭い", "辛い": "辛い"}
@@ -76,14 +85,54 @@ def conv_v29_lemma(
     return origin
 
 
+def split_suw_features(csv_str: str) -> list[str]:
+    """短単位の素性列を分割する（要素数が違う場合は補う）."""
+    try:
+        return csv_split(csv_str, expect_size=len(SUWFeaField))
+    except DoNotExceptSizeError:
+        features = csv_split(csv_str)
+    full_size = len(SUWFeaField)
+    if len(features) < full_size:
+        min_trusted_size = SUWFeaField.goshu + 1
+        if len(features) < min_trusted_size:
+            features.extend([""] * (min_trusted_size - len(features)))
+        if len(features) < full_size:
+            features.extend([""] * (full_size - len(features)))
+    else:
+        trusted_limit = SUWFeaField.iConType + 1
+        if len(features) > trusted_limit:
+            features = features[:trusted_limit]
+        if len(features) < full_size:
+            features.extend([""] * (full_size - len(features)))
+    return features[:len(SUWFeaField)]
+
+
+def split_luw_features(csv_str: str) -> list[str]:
+    """長単位の素性列を分割する（要素数が違う場合は空にする）."""
+    try:
+        return csv_split(csv_str, expect_size=len(LUWFeaField))
+    except DoNotExceptSizeError:
+        return ["" for _ in range(len(LUWFeaField))]
+
+
+def _join_pos(features: Sequence[str], start: int, end: int) -> str:
+    """品詞（`start` から `end` の手前まで）を `-` でつなげる."""
+    return "-".join(f for f in features[start:end] if f not in ["*", ""])
+
+
 class Property:
     """Base Object."""
 
+    # 属性のスロットは Word にまとめて定義する
+    __slots__ = ()
+
     attr_property: list[str]
+    # 素性列の表（Word で設定する）
+    feature_tables: FeatureTables
 
     def __init__(self, **kwargs: dict[str, object]) -> None:
         """Init."""
-        self.logger: Logger = cast(Logger, kwargs.get("logger")) or Logger()
+        self.logger: Logger = cast(Logger, kwargs.get("logger")) or get_shared_logger()
 
     def __str__(self) -> str:
         """Get String."""
@@ -93,6 +142,8 @@ class Property:
 class Reference(Property):
     """Implementation of Reference object."""
 
+    __slots__ = ()
+
     attr_property: ClassVar[list[str]] = ["doc", "bunsetu", "sent_pos", "bunsetu_pos"]
 
     def __init__(self, **kwargs: dict[str, object]) -> None:
@@ -188,6 +239,8 @@ class Reference(Property):
 class SUW(Property):
     """Implementation of SUW."""
 
+    __slots__ = ()
+
     attr_property: ClassVar[list[str]] = [
         "word_pos", "surface", "features", "jp_pos", "origin", "usage",
         "yomi", "katuyo"
@@ -211,7 +264,7 @@ class SUW(Property):
         # 活用形
         self.katuyo: str = cast(str, kwargs.get("katuyo"))
         # 特徴(2列目)
-        self.features: list[str] = cast(list[str], kwargs.get("features", []))
+        self.features: FeatureRow = tuple(cast(list[str], kwargs.get("features", ())))
 
     def __str__(self) -> str:
         """Get string."""
@@ -220,24 +273,7 @@ class SUW(Property):
     def parse_suw_part(self, token: list[str]) -> None:
         """Parse SUW part."""
         self.surface = token[0]
-        try:
-            self.features = csv_split(token[1], expect_size=len(SUWFeaField))
-        except DoNotExceptSizeError:
-            features = csv_split(token[1])
-            full_size = len(SUWFeaField)
-            if len(features) < full_size:
-                min_trusted_size = SUWFeaField.goshu + 1
-                if len(features) < min_trusted_size:
-                    features.extend([""] * (min_trusted_size - len(features)))
-                if len(features) < full_size:
-                    features.extend([""] * (full_size - len(features)))
-            else:
-                trusted_limit = SUWFeaField.iConType + 1
-                if len(features) > trusted_limit:
-                    features = features[:trusted_limit]
-                if len(features) < full_size:
-                    features.extend([""] * (full_size - len(features)))
-            self.features = features[:len(SUWFeaField)]
+        self.features = self.feature_tables.suw.intern(token[1], split_suw_features)
         assert len(self.features) == len(SUWFeaField)
         self.jp_pos = self.features[SUWFeaField.pos1]
         self.origin = self.features[SUWFeaField.lemma]
@@ -259,11 +295,12 @@ class SUW(Property):
 
     def get_xpos(self) -> str:
         """Get xpos."""
-        return "-".join(
-            f for f in self.features[SUWFeaField.pos1:SUWFeaField.cForm] if f not in ["*", ""]
-        )
+        return cast(str, self.feature_tables.suw.derive(
+            self.features, "xpos",
+            lambda: _join_pos(self.features, SUWFeaField.pos1, SUWFeaField.cForm)
+        ))
 
-    def get_features(self) -> list[str]:
+    def get_features(self) -> FeatureRow:
         """Get Features."""
         return self.features
 
@@ -272,10 +309,18 @@ class SUW(Property):
         return self.origin
 
     def get_origin(self, do_conv29:bool=False) -> str:
-        """Get origin."""
-        if RE_PROP_MATH.match(self.get_xpos()) or RE_ASCII_MATH.match(self.get_surface()):
+        """Get origin (素性列の表に xpos・表層形・原形ごとにキャッシュする)."""
+        xpos, surface = self.get_xpos(), self.get_surface()
+        return cast(str, self.feature_tables.suw.derive(
+            self.features, "origin",
+            lambda: self._get_suw_origin(xpos, surface, do_conv29=do_conv29),
+            extra=(xpos, surface, self.origin, do_conv29)
+        ))
+
+    def _get_suw_origin(self, xpos: str, surface: str, do_conv29:bool=False) -> str:
+        if RE_PROP_MATH.match(xpos) or RE_ASCII_MATH.match(surface):
             # 「固有名詞」か「英数字文字列」は表層を返す
-            return self.get_surface()
+            return surface
         if self.origin == "":
             return "_"
         if self.origin == "　":
@@ -301,7 +346,6 @@ class SUW(Property):
             「formBase  語形基本形」
 
         """
-        usize = 8
         unidic_info: list[str] = [
             SUW.get_features(self)[SUWFeaField.lForm],
             SUW.get_features(self)[SUWFeaField.lemma],
@@ -312,14 +356,14 @@ class SUW(Property):
             SUW.get_features(self)[SUWFeaField.form],
             SUW.get_features(self)[SUWFeaField.formBase]
         ]
-        res = csv_join(unidic_info, delimiter=delimiter)
-        csv_split(res, expect_size=usize)  # サイズチェック
-        return res
+        return csv_join(unidic_info, delimiter=delimiter)
 
 
 class LUW(Property):
     """LUW property."""
 
+    __slots__ = ()
+
     attr_property: ClassVar[list[str]] = [
         "luw_pos", "luw_label", "luw_origin", "luw_yomi", "luw_katuyo",
         "luw_form", "luw_features"
@@ -341,7 +385,7 @@ class LUW(Property):
         # 長単位表層
         self.luw_form: str = cast(str, kwargs.get("luw_form"))
         # 長単位品詞特徴
-        self.luw_features: list[str] = cast(list[str], kwargs.get("luw_features", []))
+        self.luw_features: FeatureRow = tuple(cast(list[str], kwargs.get("luw_features", ())))
         # 前の単語
         self.l_bunsetu: Bunsetu | None = None
 
@@ -354,10 +398,18 @@ class LUW(Property):
         return self.luw_form
 
     def get_origin(self, do_conv29:bool=False) -> str:
-        """Get Origin."""
-        if RE_PROP_MATH.match(self.get_xpos()) or RE_ASCII_MATH.match(self.get_surface()):
+        """Get Origin (素性列の表に xpos・表層形・原形ごとにキャッシュする)."""
+        xpos, surface = self.get_xpos(), self.get_surface()
+        return cast(str, self.feature_tables.luw.derive(
+            self.luw_features, "luw_origin",
+            lambda: self._get_luw_origin(xpos, surface, do_conv29=do_conv29),
+            extra=(xpos, surface, self.luw_origin, do_conv29)
+        ))
+
+    def _get_luw_origin(self, xpos: str, surface: str, do_conv29:bool=False) -> str:
+        if RE_PROP_MATH.match(xpos) or RE_ASCII_MATH.match(surface):
             # 「固有名詞」か「英数字文字列」は表層を返す
-            return self.get_surface()
+            return surface
         if self.luw_origin == "":
             return "_"
         if self.luw_origin == "　":
@@ -376,7 +428,6 @@ class LUW(Property):
             str: UniDic情報、語彙素（l_lemma） 読み（l_reading）
 
         """
-        lsize = 2
         luw_features = LUW.get_features(self)
         if len(luw_features) == 0:
             return "_"
@@ -384,9 +435,7 @@ class LUW(Property):
             LUW.get_features(self)[LUWFeaField.l_reading],
             LUW.get_features(self)[LUWFeaField.l_lemma]
         ]
-        res = csv_join(unidic_info, delimiter=delimiter)
-        csv_split(res, expect_size=lsize)  # サイズチェック
-        return res
+        return csv_join(unidic_info, delimiter=delimiter)
 
     def get_katuyo(self) -> str:
         """活用形を返す."""
@@ -396,10 +445,16 @@ class LUW(Property):
         """Get XPOS for LUW POS."""
         return self.luw_pos
 
-    def get_features(self) -> list[str]:
+    def get_features(self) -> FeatureRow:
         """Get LUW features."""
         return self.luw_features
 
+    def _get_luw_pos_from_features(self) -> str:
+        return cast(str, self.feature_tables.luw.derive(
+            self.luw_features, "pos",
+            lambda: _join_pos(self.luw_features, LUWFeaField.l_pos1, LUWFeaField.l_cForm)
+        ))
+
     def parse_luw_part(self, token: list[str], luw_info: Word | None, bunsetu: Bunsetu) -> None:
         """Parse LUW Part."""
         self.l_bunsetu = bunsetu
@@ -411,10 +466,7 @@ class LUW(Property):
                 self.luw_features = luw_info.luw_features
                 self.luw_origin = luw_info.luw_features[LUWFeaField.l_lemma]
                 self.luw_yomi = luw_info.luw_features[LUWFeaField.l_reading]
-                self.luw_pos = "-".join(
-                    f for f in self.luw_features[LUWFeaField.l_pos1:LUWFeaField.l_cForm]
-                    if f not in ["*", ""]
-                )
+                self.luw_pos = self._get_luw_pos_from_features()
                 self.luw_katuyo = luw_info.luw_features[LUWFeaField.l_cForm]
                 return
             if len(self.l_bunsetu) > 0:
@@ -433,24 +485,20 @@ class LUW(Property):
             self.luw_features = target.luw_features
         else:
             self.luw_label = "B"
-            try:
-                self.luw_features = csv_split(token[3], expect_size=len(LUWFeaField))
-            except DoNotExceptSizeError:
-                self.luw_features = ["" for _ in range(len(LUWFeaField))]
+            self.luw_features = self.feature_tables.luw.intern(token[3], split_luw_features)
             assert len(self.luw_features) == len(LUWFeaField)
             self.luw_form = token[2]
             self.luw_origin = self.luw_features[LUWFeaField.l_lemma]
             self.luw_yomi = self.luw_features[LUWFeaField.l_reading]
-            self.luw_pos = "-".join(
-                f for f in self.luw_features[LUWFeaField.l_pos1:LUWFeaField.l_cForm]
-                if f not in ["*", ""]
-            )
+            self.luw_pos = self._get_luw_pos_from_features()
             self.luw_katuyo = self.luw_features[LUWFeaField.l_cForm]
 
 
 class BunDepInfo(Property):
     """Bunsetu Dependencies Info."""
 
+    __slots__ = ()
+
     attr_property: ClassVar[list[str]] = [
         "dep_num", "is_subj_val", "is_func_val", "link_label", "case_set",
         "parent_word", "child_words", "sem_head_word", "syn_head_word", "bunsetu_position_type"
@@ -459,7 +507,7 @@ class BunDepInfo(Property):
     def __init__(self, **kwargs: dict[str, object]) -> None:
         """Init."""
         super().__init__(**kwargs)
-        self.dep_num: int | None = cast(int, kwargs.get("dep_num"))
+        self.__dep_num: int | None = cast(int, kwargs.get("dep_num"))
         self.is_subj_val: bool | None = cast(bool, kwargs.get("is_subj_val"))  # 主辞か？ None
         self.is_func_val: bool | None = cast(bool, kwargs.get("is_func_val")) # 機能語か？ None
         self.link_label: None | int | str = cast(int|str, kwargs.get("link_label"))
@@ -474,6 +522,22 @@ class BunDepInfo(Property):
         """Get string, but not implemented."""
         raise NotImplementedError
 
+    @property
+    def dep_num(self) -> int | None:
+        """Getter dep num."""
+        return self.__dep_num
+
+    @dep_num.setter
+    def dep_num(self, dep_num: int | None) -> None:
+        """Setter dep num (文の子リストも更新する)."""
+        old_dep_num = self.__dep_num
+        self.__dep_num = dep_num
+        if old_dep_num != dep_num:
+            self.update_ud_child(old_dep_num, dep_num)
+
+    def update_ud_child(self, old_dep_num: int | None, dep_num: int | None) -> None:
+        """掛かり先が変わったことを文に知らせる."""
+
     def set_bunsetsu_info(self, subj: bool | None, func: bool | None) -> None:
         """Set bunsetu info."""
         self.is_func_val = func
@@ -491,13 +555,15 @@ class BunDepInfo(Property):
 class UD(Property):
     """UD property object class."""
 
+    __slots__ = ()
+
     attr_property: ClassVar[list[str]] = ["token_pos", "ud_misc", "ud_feat", "en_pos", "dep_label"]
 
     def __init__(self, **kwargs: dict[str, object]) -> None:
         """Init."""
         super().__init__(**kwargs)
         # UDでの単語位置
-        self.token_pos: int = cast(int, kwargs.get("token_pos"))
+        self.__token_pos: int = cast(int, kwargs.get("token_pos"))
         # MISC
         self.ud_misc: dict[str, str] = cast(dict, kwargs.get("ud_misc", {"SpaceAfter": "No"}))
         # FEAT
@@ -511,6 +577,21 @@ class UD(Property):
         """Get string."""
         raise NotImplementedError
 
+    @property
+    def token_pos(self) -> int:
+        """Getter token pos."""
+        return self.__token_pos
+
+    @token_pos.setter
+    def token_pos(self, token_pos: int) -> None:
+        """Setter token pos (位置が変わると文の子リストは作り直す)."""
+        if self.__token_pos != token_pos:
+            self.__token_pos = token_pos
+            self.reset_ud_children()
+
+    def reset_ud_children(self) -> None:
+        """単語の位置が変わったことを文に知らせる."""
+
     def get_udfeat(self) -> str:
         """Return ud feat text."""
         if len(self.ud_feat) == 0:
@@ -535,13 +616,28 @@ class UD(Property):
 class Word(Reference, SUW, LUW, BunDepInfo, UD):
     """Word class."""
 
+    # 各 Property の属性もここでまとめて定義する（多重継承のため）
+    __slots__ = (
+        "_BunDepInfo__dep_num", "_Reference__bunsetu", "_Reference__bunsetu_pos", "_Reference__doc",
+        "_Reference__sent_pos", "_UD__token_pos", "_token", "base_file_name",
+        "bunsetu_position_type", "case_set", "child_words", "debug", "dep_label", "en_pos",
+        "feature_tables", "features", "is_func_val", "is_subj_val", "jp_pos", "katuyo", "l_bunsetu",
+        "link_label", "logger", "luw_features", "luw_form", "luw_katuyo", "luw_label", "luw_origin",
+        "luw_pos", "luw_yomi", "origin", "parent_word", "sem_head_word", "surface", "syn_head_word",
+        "ud_feat", "ud_misc", "usage", "word_pos", "word_unit_mode", "yomi"
+    )
+
     def __init__(self, **kwargs: dict[str, Any]) -> None:
         """機能的なものは通常定義."""
-        self.logger: Logger = cast(Logger, kwargs.get("logger")) or Logger()
+        self.logger: Logger = cast(Logger, kwargs.get("logger")) or get_shared_logger()
         self.base_file_name: str | None = cast(str, kwargs.get("base_file_name"))
         self.debug: bool = cast(bool, kwargs.get("debug", True))
         self.word_unit_mode: str = cast(str, kwargs.get("word_unit_mode", "suw"))
         self._token: list[str] = []
+        # 素性列の表（文書のものを共有する）
+        self.feature_tables: FeatureTables = (
+            cast(FeatureTables, kwargs.get("feature_tables")) or FeatureTables()
+        )
 
         super().__init__(**kwargs)
 
@@ -579,6 +675,24 @@ class Word(Reference, SUW, LUW, BunDepInfo, UD):
         assert pos <= len(self._token)
         self._token[pos] = token_s
 
+    def _get_parent_sent(self) -> Sentence | None:
+        """文節から所属する文を返す（構築中は None）."""
+        if self.bunsetu is None:
+            return None
+        return self.bunsetu.parent_sent
+
+    def update_ud_child(self, old_dep_num: int | None, dep_num: int | None) -> None:
+        """掛かり先が変わったことを文に知らせる."""
+        sent = self._get_parent_sent()
+        if sent is not None:
+            sent.move_ud_child(self.token_pos, old_dep_num, dep_num)
+
+    def reset_ud_children(self) -> None:
+        """単語の位置が変わったことを文に知らせる."""
+        sent = self._get_parent_sent()
+        if sent is not None:
+            sent.reset_ud_children()
+
     def get_instance_for_pos(self) -> dict[str, str]:
         """Instance for POS."""
         assert isinstance(self.dep_num, int)
@@ -614,7 +728,7 @@ class Word(Reference, SUW, LUW, BunDepInfo, UD):
         """Get surface case (表層格)."""
         assert self.doc is not None
         self.case_set = {}
-        for child_pos in self.doc[self.sent_pos].get_ud_children(self, is_reconst=True):
+        for child_pos in self.doc[self.sent_pos].get_ud_children(self):
             cword = self.doc[self.sent_pos].get_word_from_tokpos(child_pos - 1)
             if cword is None:
                 raise ValueError
@@ -685,6 +799,12 @@ class Word(Reference, SUW, LUW, BunDepInfo, UD):
 
     def get_udmisc(self, add_unidic_info:bool=True) -> str:
         """Return ud misc text."""
+        return "|".join([
+            f"{k}={v}" for k, v in self.get_udmisc_items(add_unidic_info=add_unidic_info)
+        ])
+
+    def get_udmisc_items(self, add_unidic_info:bool=True) -> list[tuple[str, str]]:
+        """Return ud misc (key, value) list sorted by key."""
         self.ud_misc["BunsetuBILabel"] = "B" if self.word_pos == 0 else "I"
         if self.luw_label is not None:
             self.ud_misc["LUWBILabel"] = self.luw_label
@@ -709,12 +829,12 @@ class Word(Reference, SUW, LUW, BunDepInfo, UD):
                 self.ud_misc["PrevUDLemma"] = self.get_origin(do_conv29=True)
             #  lexemes, forms, and orth forms
             self.ud_misc["UnidicInfo"] = self.get_unidic_info()
-        return "|".join([
-            f"{k}={v}" for k, v in sorted(self.ud_misc.items())
+        return [
+            (k, v) for k, v in sorted(self.ud_misc.items())
             if self.word_unit_mode == "suw" or (
                 self.word_unit_mode == "luw" and k not in ["LUWPOS", "LUWBILabel"]
             )
-        ])
+        ]
 
     def get_unidic_info(self, delimiter: str=",") -> str:
         """Get Unidic info."""
@@ -734,18 +854,20 @@ class Word(Reference, SUW, LUW, BunDepInfo, UD):
 
     def convert(self, sep: str="\t") -> str:
         """Convert word line."""
-        templace: str = sep.join([
-            "{id}", "{form}", "{lemma}", "{upos}", "{xpos}",
-            "{feats}", "{head}", "{deprel}", "{deps}", "{misc}"
-        ])
-        return templace.format(
-            id=self.token_pos, form=self.get_surface(),
-            lemma=self.get_origin(),
-            upos=self.get_ud_pos(), xpos=self.get_xpos(),
-            feats=self.get_udfeat(),
-            head=self.dep_num, deprel=self.dep_label,
-            deps="_", misc=self.get_udmisc()
-        )
+        columns, misc_items = self.get_ud_columns()
+        return sep.join([*columns, "|".join([f"{k}={v}" for k, v in misc_items])])
+
+    def get_ud_columns(self) -> tuple[list[str], list[tuple[str, str]]]:
+        """Return UD columns (ID ~ DEPS) and MISC items.
+
+        ``update ud_misc`` (MISCは最後に計算する).
+        """
+        columns = [
+            str(self.token_pos), self.get_surface(), self.get_origin(),
+            self.get_ud_pos(), self.get_xpos(), self.get_udfeat(),
+            str(self.dep_num), self.dep_label, "_"
+        ]
+        return columns, self.get_udmisc_items()
 
     def build_luw_unit(self, luw_unit: list[Word], suw_delimter: str=";") -> None:
         """Build LUW Unit."""
@@ -758,7 +880,7 @@ class Word(Reference, SUW, LUW, BunDepInfo, UD):
                 suw_delimter.join([f.replace(suw_delimter, "\\"+suw_delimter) for f in fes])
                 for fes in zip(*[SUW.get_features(suw) for suw in luw_unit])
             ])
-            self.features = self._token[1].split(",")
+            self.features = tuple(self._token[1].split(","))
 
     def get_surface(self) -> str:
         """Get Surface."""
@@ -785,7 +907,11 @@ class Word(Reference, SUW, LUW, BunDepInfo, UD):
         raise NotImplementedError
 
     def get_luw_pos(self) -> str:
-        """Get LUW POS."""
+        """Get LUW POS.
+
+        `luw_pos` はパース時に（素性列の表で）求めた値で、ないときの `get_xpos` も素性列の表が
+        キャッシュするので、ここではキャッシュしない.
+        """
         if self.luw_pos is not None:
             return self.luw_pos
         return self.get_xpos()
@@ -798,7 +924,7 @@ class Word(Reference, SUW, LUW, BunDepInfo, UD):
             return SUW.get_katuyo(self)
         raise NotImplementedError
 
-    def get_features(self) -> list[str]:
+    def get_features(self) -> FeatureRow:
         """Get features."""
         if self.word_unit_mode == "luw":
             return LUW.get_features(self)
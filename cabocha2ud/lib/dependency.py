@@ -1,5 +1,8 @@
 """Functions for checking Dependencies."""
 
+from collections.abc import Iterable
+from typing import Optional
+
 
 def collect_ancestors(_id: int, tree: list[int], ancestors: list[int]) -> list[int]:
     """指定したノードから祖先ノードを再帰的に収集します。
@@ -44,3 +47,67 @@ def get_caused_nonprojectivities(iid: int, tree: list[int]) -> list[int]:
     else:
         leftcross = [x for x in leftcross if tree[x] < pid]
     return sorted(leftcross + rightcross)
+
+
+def _visit_order(tree: list[int], children: list[list[int]]) -> tuple[list[int], list[int]]:
+    """根 (0) からたどった行きがけ・帰りがけの順番を返します (根からたどれないノードは -1)."""
+    enter, leave = [-1] * len(tree), [-1] * len(tree)
+    count = 0
+    stack = [0]
+    while stack:
+        nid = stack.pop()
+        if nid < 0:
+            leave[~nid] = count
+            continue
+        enter[nid] = count
+        count += 1
+        stack.append(~nid)
+        stack.extend(children[nid])
+    return enter, leave
+
+
+def get_all_caused_nonprojectivities(
+    tree: list[int], nodes: Optional[Iterable[int]]=None
+) -> dict[int, list[int]]:
+    """`nodes` (指定しない場合は全ノード) の `get_caused_nonprojectivities` をまとめて返します.
+
+    木を一度たどって祖先の判定を O(1) にし、交差する係り受けは各ノードの係り受けの範囲と
+    子のリストから探します. 根にたどりつかないノード (ループなど) は `get_caused_nonprojectivities` を使います.
+
+    `tree` format is [-1] + [child1, child2, child3, ...], root is 0
+    """
+    size = len(tree)
+    children: list[list[int]] = [[] for _ in range(size)]
+    for nid in range(1, size):
+        if 0 <= tree[nid] < size:
+            children[tree[nid]].append(nid)
+    enter, leave = _visit_order(tree, children)
+
+    def is_ancestor(pid: int, iid: int) -> bool:
+        return 0 <= pid < size and enter[pid] != -1 \
+            and enter[pid] < enter[iid] and leave[iid] <= leave[pid]
+
+    result: dict[int, list[int]] = {}
+    for iid in (range(1, size) if nodes is None else nodes):
+        if not 0 < iid < size or enter[iid] == -1:
+            result[iid] = get_caused_nonprojectivities(iid, tree)
+            continue
+        pid = tree[iid]
+        if pid < iid:
+            leftcross = [
+                x for x in range(pid + 1, iid) if tree[x] > iid and not is_ancestor(tree[x], iid)
+            ]
+            rightcross = sorted(
+                x for hid in range(pid + 1, iid) for x in children[hid]
+                if x > iid and not is_ancestor(hid, iid)
+            )
+        else:
+            leftcross = sorted(
+                x for hid in range(iid + 1, pid) for x in children[hid]
+                if x < iid and not is_ancestor(hid, iid)
+            )
+            rightcross = [
+                x for x in range(iid + 1, pid) if tree[x] < iid and not is_ancestor(tree[x], iid)
+            ]
+        result[iid] = leftcross + rightcross
+    return result
@@ -2,7 +2,7 @@
 """Iterator functions for cabocha format."""
 
 import re
-from typing import Iterator, Optional, Union
+from typing import Iterable, Iterator, Optional, Union
 
 ATTR_NAMES = [
     "SEGMENT", "SEGMENT_S", "LINK", "GROUP", "GROUP_S"
@@ -37,33 +37,32 @@ def separate_information_from_excabocha(doc: list[str]) -> tuple[list[str], list
 
 
 def iterate_document(
-    lines: list[str], separate_info: bool=True, strip_end: bool=True,
+    lines: Iterable[str], separate_info: bool=True, strip_end: bool=True,
     default_doc_name: str="doc",
 ) -> Iterator[tuple[Optional[list[str]], list[str], Optional[list[str]]]]:
-    """Create iterate per document."""
-    doc: list[str] = []
-    if len(lines) == 0:
-        return
-    if strip_end and lines[-1] == "":  # 下に空行があるとエラーになるため空行を除く
-        pos = -1
-        while lines[pos] == "":
-            pos = pos - 1
-        lines = lines[:pos + 1]
+    """Create iterate per document.
 
+    `lines` は逐次読み込むため、ファイル全体をリストにしなくてもよい.
+    """
+    doc: list[str] = []
+    blank_lines: list[str] = []
     target_header: Optional[re.Pattern] = None
-    if lines[0].startswith("#! DOCID"):
-        target_header = re.compile(r"^#! DOCID\s+.*")
-    elif lines[0].startswith("#! DOC"):
-        target_header = re.compile(r"^#! DOC\s+.*")
-    else:
-        target_header = re.compile(r"^#! DOC\s+.*")
-        lines = [
-            "#! DOC 0",
-            f"#! DOCID\t1\t{default_doc_name}",
-            *lines,
-        ]
-
     for line in lines:
+        if target_header is None:
+            if line.startswith("#! DOCID"):
+                target_header = re.compile(r"^#! DOCID\s+.*")
+            elif line.startswith("#! DOC"):
+                target_header = re.compile(r"^#! DOC\s+.*")
+            else:
+                target_header = re.compile(r"^#! DOC\s+.*")
+                doc = ["#! DOC 0", f"#! DOCID\t1\t{default_doc_name}"]
+        if strip_end and line == "":
+            # 下に空行があるとエラーになるため、末尾の空行は除く
+            blank_lines.append(line)
+            continue
+        if len(blank_lines) > 0:
+            doc.extend(blank_lines)
+            blank_lines = []
         if target_header.match(line) and len(doc) > 0:
             if separate_info:
                 yield separate_information_from_excabocha(doc)
@@ -73,6 +72,7 @@ def iterate_document(
         else:
             doc.append(line)
     if len(doc) > 0:
+        assert target_header is not None
         if not target_header.match(doc[0]):
             msg = "parse Error: first line must be `#! DOC`"
             raise TypeError(msg)
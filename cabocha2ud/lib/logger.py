@@ -63,6 +63,9 @@ class Logger:
 
     def message(self, *args: *tuple[object,...], mode: LogLevel|None=LogLevel.INFO) -> None:
         """Logger message funciton."""
+        if not logger.isEnabledFor((mode or LogLevel.INFO).value):
+            # 出力されないメッセージは文字列にしない
+            return
         if isinstance(args[0], str) and is_printf_format_string(args[0]):
             fmt_msg = args[0] % args[1:]
         else:
@@ -76,3 +79,14 @@ class Logger:
                 LogLevel.INFO: logger.info,
                 LogLevel.ERROR: logger.error
             }[LogLevel(mode)](fmt_msg)
+
+
+_SHARED_LOGGER: Optional[Logger] = None
+
+
+def get_shared_logger() -> Logger:
+    """共有の Logger を返す（`Logger()` は作るたびにログレベルを設定し直すため）."""
+    global _SHARED_LOGGER  # noqa: PLW0603
+    if _SHARED_LOGGER is None:
+        _SHARED_LOGGER = Logger()
+    return _SHARED_LOGGER
@@ -0,0 +1,105 @@
+"""Cache of parsed rule files.
+
+ルールファイル（YAML, TOML）をパースした結果を、ファイルの内容の SHA-256 をキーとして
+キャッシュディレクトリに JSON で保存し、次からはそれを読む（ファイルが変われば読み直す）.
+パースした結果はそのままのデータ（dict, list, str, ...）で、ルールの検証やコンパイルは読み込み側で行う.
+JSON で同じデータに戻らないもの（文字列以外のキーなど）はキャッシュしない.
+
+キャッシュは環境変数 `CABOCHA2UD_CACHE_DIR` にディレクトリを指定したときのみ使う
+（指定がないか空文字列ならキャッシュしない）.
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Optional, TypeVar
+
+import tomli
+
+from cabocha2ud.lib.yaml_dict import YamlDict, YamlList
+
+CACHE_VERSION = 2
+CACHE_DIR_ENV = "CABOCHA2UD_CACHE_DIR"
+
+T = TypeVar("T")
+
+
+def get_cache_dir() -> Optional[Path]:
+    """Return cache directory (None: キャッシュしない)."""
+    cache_dir = os.environ.get(CACHE_DIR_ENV, "")
+    if cache_dir == "":
+        return None
+    return Path(cache_dir)
+
+
+def to_plain(obj: Any) -> Any:
+    """ruamel の型（CommentedMap など）をそのままの dict, list, str... に変換する."""
+    if isinstance(obj, dict):
+        return {to_plain(key): to_plain(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [to_plain(value) for value in obj]
+    if isinstance(obj, bool) or obj is None:
+        return obj
+    for base in (str, int, float):
+        if isinstance(obj, base):
+            return base(obj)
+    return obj
+
+
+def load_cached(file_name: str, parse_func: Callable[[str], T], kind: str) -> T:
+    """`parse_func(ファイルの内容)` の結果をキャッシュから返す（なければパースして保存する）."""
+    content = Path(file_name).read_bytes()
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return parse_func(content.decode("utf-8"))
+    key = hashlib.sha256(f"{kind}:{CACHE_VERSION}:".encode() + content).hexdigest()
+    cache_file = cache_dir / f"{kind}-{key}.json"
+    try:
+        with cache_file.open("r", encoding="utf-8") as rdr:
+            return json.load(rdr)
+    except (OSError, ValueError):
+        pass
+    data = parse_func(content.decode("utf-8"))
+    try:
+        dumped = json.dumps(data, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return data
+    if json.loads(dumped) != data:
+        return data
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(dumped, encoding="utf-8")
+        tmp_file.replace(cache_file)
+    except OSError:
+        pass
+    return data
+
+
+def _parse_yaml_dict(content: str) -> dict[str, Any]:
+    yobj = YamlDict(file_name=None)
+    yobj.loads(content)
+    return to_plain(dict(yobj))
+
+
+def _parse_yaml_list(content: str) -> list[Any]:
+    yobj = YamlList(file_name=None)
+    yobj.loads(content)
+    return to_plain(list(yobj))
+
+
+def load_yaml_dict(file_name: str) -> dict[str, Any]:
+    """Load YAML (dict) file with cache."""
+    return load_cached(file_name, _parse_yaml_dict, "yaml_dict")
+
+
+def load_yaml_list(file_name: str) -> list[Any]:
+    """Load YAML (list) file with cache."""
+    return load_cached(file_name, _parse_yaml_list, "yaml_list")
+
+
+def load_toml(file_name: str) -> dict[str, Any]:
+    """Load TOML file with cache."""
+    return load_cached(file_name, tomli.loads, "toml")
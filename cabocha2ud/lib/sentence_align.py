@@ -0,0 +1,170 @@
+"""Sentence alignment (cabocha/CoNLL-U sentences and SP data).
+
+1. 両方で一度しか出てこない文字列が完全一致する文を固定点（anchor）とする
+   （SP には余分な文があるだけなので、位置のずれ（SP の位置 - 文の位置）が減らない最長の組を使う）
+2. 固定点の間の文は、これまでと同じく前から順に類似度がしきい値以上の最初の SP の文と対応させる
+   （見つからなければ次の固定点を捨てて探し続ける）.
+   類似度（`SequenceMatcher.ratio`）の前に、長さと文字の頻度から求めた上限で候補を落とす
+   （上限なので、しきい値以上の候補を落とすことはない）
+"""
+
+import bisect
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from typing import NamedTuple, Optional
+
+from cabocha2ud.lib.logger import Logger, LogLevel
+
+
+def similarity(alst: str, blst: str) -> float:
+    """Caluclate similarity."""
+    if len(alst) < len(blst):
+        alst, blst = blst, alst
+    return SequenceMatcher(None, alst, blst).ratio()
+
+
+def _ratio(matches: int, length: int) -> float:
+    """`SequenceMatcher.ratio` と同じ計算."""
+    return 2.0 * matches / length if length else 1.0
+
+
+class SentenceAlignment(NamedTuple):
+    """Result of `align_sentences`.
+
+    Attributes:
+        pairs (list[tuple[int, int]]): (文の位置, SP の文の位置)
+        skipped (list[int]): 対応しなかった SP の文の位置
+        ambiguous (list[int]): 類似度で対応させたが、次の SP の文のほうが類似度が高い文の位置
+
+    """
+
+    pairs: list[tuple[int, int]]
+    skipped: list[int]
+    ambiguous: list[int]
+
+
+def _find_anchors(texts: list[str], sp_texts: list[str]) -> list[tuple[int, int]]:
+    """一意に完全一致する文の組のうち、位置のずれが減らない最長の組."""
+    positions: dict[str, list[int]] = defaultdict(list)
+    for spos, text in enumerate(sp_texts):
+        positions[text].append(spos)
+    counts = Counter(texts)
+    cands = [
+        (pos, positions[text][0]) for pos, text in enumerate(texts)
+        if text != "" and counts[text] == 1 and len(positions.get(text, [])) == 1
+    ]
+    # ずれの最長非減少部分列
+    tails: list[int] = []
+    tail_index: list[int] = []
+    prev: list[int] = [-1] * len(cands)
+    for cpos, (pos, spos) in enumerate(cands):
+        lpos = bisect.bisect_right(tails, spos - pos)
+        if lpos > 0:
+            prev[cpos] = tail_index[lpos - 1]
+        if lpos == len(tails):
+            tails.append(spos - pos)
+            tail_index.append(cpos)
+        else:
+            tails[lpos] = spos - pos
+            tail_index[lpos] = cpos
+    anchors: list[tuple[int, int]] = []
+    cpos = tail_index[-1] if tail_index else -1
+    while cpos >= 0:
+        anchors.append(cands[cpos])
+        cpos = prev[cpos]
+    return anchors[::-1]
+
+
+class _Matcher:
+    """類似度の判定（上限による足切りつき）."""
+
+    def __init__(self, sp_texts: list[str], threshold: float) -> None:
+        self.sp_texts = sp_texts
+        self.threshold = threshold
+        self._counters: dict[int, Counter[str]] = {}
+
+    def _counter(self, spos: int) -> Counter[str]:
+        if spos not in self._counters:
+            self._counters[spos] = Counter(self.sp_texts[spos])
+        return self._counters[spos]
+
+    def score(self, text: str, counter: Counter[str], spos: int) -> Optional[float]:
+        """類似度（しきい値未満なら None）."""
+        stext = self.sp_texts[spos]
+        if stext == text:
+            return 1.0
+        length = len(stext) + len(text)
+        if _ratio(min(len(stext), len(text)), length) < self.threshold:
+            return None
+        if _ratio(sum((counter & self._counter(spos)).values()), length) < self.threshold:
+            return None
+        sim = similarity(stext, text)
+        return sim if sim >= self.threshold else None
+
+
+def align_sentences(
+    texts: list[str], sp_texts: list[str], threshold: float=0.8
+) -> SentenceAlignment:
+    """文と SP の文を対応させる.
+
+    Args:
+        texts (list[str]): 文の文字列
+        sp_texts (list[str]): SP の文の文字列
+        threshold (float): 類似度のしきい値
+
+    Raises:
+        ValueError: 対応する SP の文がない文がある
+
+    """
+    if len(texts) == len(sp_texts):
+        return SentenceAlignment([(p, p) for p in range(len(texts))], [], [])
+    matcher = _Matcher(sp_texts, threshold)
+    anchors = _find_anchors(texts, sp_texts)
+    anchors.append((len(texts), len(sp_texts)))
+    pairs: list[tuple[int, int]] = []
+    ambiguous: list[int] = []
+    spos, aidx = 0, 0
+    for cpos, text in enumerate(texts):
+        if cpos == anchors[aidx][0]:
+            pairs.append(anchors[aidx])
+            spos = anchors[aidx][1] + 1
+            aidx += 1
+            continue
+        counter = Counter(text)
+        sim: Optional[float] = None
+        while True:
+            while spos < anchors[aidx][1]:
+                sim = matcher.score(text, counter, spos)
+                if sim is not None:
+                    break
+                spos += 1
+            if sim is not None:
+                break
+            if aidx == len(anchors) - 1:
+                msg = f"SP sentence is not found for sentence {cpos}: {text}"
+                raise ValueError(msg)
+            # 固定点が誤っているので捨てる
+            aidx += 1
+        if sim < 1.0 and spos + 1 < anchors[aidx][1]:
+            next_sim = matcher.score(text, counter, spos + 1)
+            if next_sim is not None and next_sim > sim:
+                ambiguous.append(cpos)
+        pairs.append((cpos, spos))
+        spos += 1
+    matched = {sp for _, sp in pairs}
+    skipped = [sp for sp in range(len(sp_texts)) if sp not in matched]
+    return SentenceAlignment(pairs, skipped, ambiguous)
+
+
+def report_alignment(alignment: SentenceAlignment, logger: Logger) -> None:
+    """対応しなかった SP の文（debug）と曖昧な文（warning）を出力する."""
+    logger.debug(
+        "aligned %d sentences, skipped %d SP sentences: %s",
+        len(alignment.pairs), len(alignment.skipped), alignment.skipped
+    )
+    sp_pos = dict(alignment.pairs)
+    for cpos in alignment.ambiguous:
+        logger.message(
+            "ambiguous SP sentence for sentence %d (SP: %d)", cpos, sp_pos[cpos],
+            mode=LogLevel.WARN
+        )
@@ -0,0 +1,119 @@
+"""SP (Dainagon) data.
+
+SP（大納言）の TSV から、使う列（`orthToken(S)`, `boundary(S)`, `SpaceAfter`）だけを
+1行ずつ読み込んで、文ごとの文字列と単語ごとの配列（文字列の終了位置、SpaceAfter）で持つ.
+文は `SPData[文の位置]` で `SPSentence` として取り出す.
+"""
+
+from array import array
+from collections.abc import Iterator
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+ORTH_COLUMN = "orthToken(S)"
+BOUNDARY_COLUMN = "boundary(S)"
+SPACE_AFTER_COLUMN = "SpaceAfter"
+
+
+class SPSentence(NamedTuple):
+    """SP sentence.
+
+    Attributes:
+        text (str): 文の文字列（単語の連結）
+        tokens (list[str]): 単語（`orthToken(S)`）
+        space_after (list[bool]): 単語の後ろにスペースがあるか（`SpaceAfter` が `YES`）
+
+    """
+
+    text: str
+    tokens: list[str]
+    space_after: list[bool]
+
+
+class SPData:
+    """SP data (columnar).
+
+    Attributes:
+        texts (list[str]): 文ごとの文字列
+
+    """
+
+    def __init__(self) -> None:
+        """Init."""
+        self.texts: list[str] = []
+        # 単語ごとの文字列の終了位置（文の中での位置）と SpaceAfter
+        self._token_ends: array[int] = array("I")
+        self._space_after: bytearray = bytearray()
+        # 文ごとの最初の単語の位置（最後は単語数）
+        self._offsets: array[int] = array("Q", [0])
+
+    def __len__(self) -> int:
+        """Return the number of sentences."""
+        return len(self.texts)
+
+    def __getitem__(self, spos: int) -> SPSentence:
+        """Return `spos`-th sentence."""
+        text = self.texts[spos]
+        start, end = self._offsets[spos], self._offsets[spos + 1]
+        tokens: list[str] = []
+        prev = 0
+        for tend in self._token_ends[start:end]:
+            tokens.append(text[prev:tend])
+            prev = tend
+        return SPSentence(text, tokens, [flag == 1 for flag in self._space_after[start:end]])
+
+    def __iter__(self) -> Iterator[SPSentence]:
+        """Iterate sentences."""
+        for spos in range(len(self)):
+            yield self[spos]
+
+    def append_sentence(self, tokens: list[str], space_after: list[bool]) -> None:
+        """Append sentence."""
+        assert len(tokens) == len(space_after)
+        tend = 0
+        for token in tokens:
+            tend += len(token)
+            self._token_ends.append(tend)
+        self._space_after.extend(1 if flag else 0 for flag in space_after)
+        self._offsets.append(len(self._token_ends))
+        self.texts.append("".join(tokens))
+
+    @classmethod
+    def load(cls, file_name: str) -> "SPData":
+        """Load SP data (TSV).
+
+        先頭行は列名. 1行目のデータは読み飛ばし、`boundary(S)` が `B` の単語から文を始める
+        （最初の `B` より前の単語は最初の文になる）
+        """
+        spdata = cls()
+        with Path(file_name).open("r", encoding="utf-8") as rdr:
+            header = next(rdr).rstrip("\r\n").split("\t")
+            for name in (ORTH_COLUMN, BOUNDARY_COLUMN, SPACE_AFTER_COLUMN):
+                if name not in header:
+                    msg = f"{name} is not found in {file_name}"
+                    raise KeyError(msg)
+            orth_pos = header.index(ORTH_COLUMN)
+            boundary_pos = header.index(BOUNDARY_COLUMN)
+            space_pos = header.index(SPACE_AFTER_COLUMN)
+            max_split = max(orth_pos, boundary_pos, space_pos) + 1
+            next(rdr, None)
+            tokens: list[str] = []
+            space_after: list[bool] = []
+            for line in rdr:
+                item = line.rstrip("\r\n").split("\t", max_split)
+                if item[boundary_pos] == "B":
+                    spdata.append_sentence(tokens, space_after)
+                    tokens, space_after = [], []
+                tokens.append("," if item[orth_pos] == '","' else item[orth_pos])
+                space_after.append(item[space_pos] == "YES")
+            # 最後の文は `B` から始まっている
+            assert len(tokens) > 0 and len(spdata) > 0
+            spdata.append_sentence(tokens, space_after)
+        return spdata
+
+
+def load_db_file(db_file: Optional[str]) -> SPData:
+    """Load SP data."""
+    if db_file is None:
+        return SPData()
+    return SPData.load(db_file)
@@ -5,14 +5,26 @@ import importlib
 import pathlib
 import re
 import tempfile
-from typing import Type
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional, Type, TypeVar
 
 from cabocha2ud.bd import BunsetsuDependencies
+from cabocha2ud.bd.document import Document
+from cabocha2ud.bd.util import enable_derive_stats, get_derive_stats
 from cabocha2ud.lib.logger import Logger
 from cabocha2ud.lib.yaml_dict import YamlDict
 from cabocha2ud.pipeline.component import PipeLineComponent
 from cabocha2ud.rule import dep, pos
-from cabocha2ud.ud import UniversalDependencies, fit
+from cabocha2ud.ud import (
+    StreamDocument,
+    UniversalDependencies,
+    fit,
+    fit_document,
+    iterate_newdoc_boundary,
+    remove_boundary_space_after,
+)
+from cabocha2ud.ud.sentence import Sentence
 
 MODULE_FILES = importlib.import_module("cabocha2ud.pipeline").__file__
 assert MODULE_FILES is not None
@@ -25,6 +37,8 @@ PIPE_FUNCS: list[Type[PipeLineComponent]] = [
 PIPE_FUNCS_NAMES = [f.name for f in PIPE_FUNCS]
 PIPE_FUNC_MAPS: dict[str, Type[PipeLineComponent]] = dict(zip(PIPE_FUNCS_NAMES, PIPE_FUNCS))
 
+T = TypeVar("T")
+
 
 class RunnerPipeline:
     """Pipeline class."""
@@ -45,6 +59,8 @@ class RunnerPipeline:
         self.pos_rule: list[tuple]
         self.dep_rule: list[tuple[list[dep.SubRule], str]]
         self.opts: YamlDict = options
+        if self.opts.get("debug"):
+            enable_derive_stats()
         self.pipe: list[str] = []
         if pipe is not None:
             self.pipe = pipe
@@ -63,7 +79,10 @@ class RunnerPipeline:
         self.pos_rule = pos.load_pos_rule(self.opts.get("pos_rule_file", None))
         self.logger.debug("loading dep_rule")
         assert self.opts.get("dep_rule_file", None) is not None
-        self.dep_rule = dep.load_dep_rule(self.opts.get("dep_rule_file", None))
+        self.dep_rule = dep.load_dep_rule(
+            self.opts.get("dep_rule_file", None),
+            verify=self.opts.get("verify_dep_rule", False)
+        )
         for cfunc in pipe_funcs:
             comp = PIPE_FUNC_MAPS[cfunc]
             if comp.mode == "bd":
@@ -101,6 +120,114 @@ class RunnerPipeline:
             step_count = step_count + 1
             if self.opts.get("temporary_file"):
                 self.save_temporary_file(step_count, post, temp_dir)
+        if self.opts.get("debug"):
+            for name, (hit, miss) in get_derive_stats().items():
+                self.logger.info("feature cache %s: hit=%d miss=%d", name, hit, miss)
+
+    def _check_streamable(self) -> None:
+        """文書ごとに実行できるか確認する."""
+        if self.opts.get("temporary_file"):
+            msg = "`temporary_file` is not supported in stream mode"
+            raise ValueError(msg)
+        not_streamable = [
+            comp.name for comp in self.components["pre"] + self.components["post"]
+            if not comp.streamable
+        ]
+        if len(not_streamable) > 0:
+            msg = f"{','.join(not_streamable)}: not supported in stream mode"
+            raise ValueError(msg)
+
+    def convert_document(
+        self, doc: Document, doc_id: int, prev_text: Optional[str], is_boundary: bool,
+        headers: Optional[list[str]]=None
+    ) -> tuple[list[Sentence], list[str]]:
+        """1文書についてパイプラインを実行する.
+
+        `self._bd` と `self._ud` の中身はこの文書のものに入れ替わる.
+        変換した文と、文がなかったときに次の文書へ持ち越す newdoc の文字列を返す.
+        """
+        self._bd.clear()
+        self._bd.append(doc)
+        for pre in self.components["pre"]:
+            pre()
+        rest_headers = fit_document(
+            self._ud, self._bd[0], self.pos_rule, self.dep_rule, doc_id, prev_text, headers
+        )
+        if is_boundary:
+            remove_boundary_space_after(self._ud)
+        for post in self.components["post"]:
+            post()
+        return list(self._ud.sentences()), rest_headers
+
+    def reconvert_document(
+        self, sdoc: StreamDocument, is_boundary: bool, headers: list[str]
+    ) -> tuple[list[Sentence], list[str]]:
+        """文書を読み直して、境界と持ち越した newdoc を指定して変換し直す."""
+        assert sdoc.doc.text is not None
+        doc = self._bd.build_document(sdoc.doc.text, sdoc.doc.prefix, sdoc.doc.suffix)
+        doc.parse()
+        return self.convert_document(doc, sdoc.doc_id, sdoc.prev_text, is_boundary, headers)
+
+    def iterate_pipeline(self, documents: Iterable[Document]) -> Iterator[Sentence]:
+        """文書ごとにパイプラインを実行して、変換した文を順番に返す（ストリーミング変換）.
+
+        メモリは最大の文書（と先読みする次の文書）の分で済む.
+
+        Args:
+            documents (Iterable[Document]): パース済みの文書
+
+        """
+        self._check_streamable()
+        results = (
+            (sdoc, *self.convert_document(sdoc.doc, sdoc.doc_id, sdoc.prev_text, sdoc.is_boundary))
+            for sdoc in iterate_newdoc_boundary(documents)
+        )
+        yield from settle_newdoc_boundary(results, self.reconvert_document)
+
+    def parallel_pipeline(self, documents: Iterable[Document], jobs: int) -> Iterator[str]:
+        """文書ごとにプロセスプールでパイプラインを実行し、変換した文を順番に返す.
+
+        ルールやコンポーネントはワーカーごとに一度だけ準備する.
+        ワーカーへは文書の行をそのまま渡し、パースもワーカー側で行う.
+
+        Args:
+            documents (Iterable[Document]): 属性のみパースした文書（`header_only`）
+            jobs (int): プロセス数
+
+        """
+        self._check_streamable()
+
+        def reconvert(
+            sdoc: StreamDocument, is_boundary: bool, headers: list[str]
+        ) -> tuple[list[str], list[str]]:
+            sents, rest_headers = self.reconvert_document(sdoc, is_boundary, headers)
+            return [str(sent) for sent in sents], rest_headers
+
+        yield from settle_newdoc_boundary(self._iterate_parallel(documents, jobs), reconvert)
+
+    def _iterate_parallel(
+        self, documents: Iterable[Document], jobs: int
+    ) -> Iterator[tuple[StreamDocument, list[str], list[str]]]:
+        """ワーカーで変換した文書を順番に返す."""
+        options = {key: val for key, val in self.opts.items() if key != "logger"}
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker,
+            initargs=(self.pipe, options, self._bd.file_name)
+        ) as executor:
+            futures: deque[tuple[StreamDocument, Future[tuple[list[str], list[str]]]]] = deque()
+            for sdoc in iterate_newdoc_boundary(documents):
+                assert sdoc.doc.text is not None
+                futures.append((sdoc, executor.submit(_convert_document, DocumentJob(
+                    sdoc.doc.text, sdoc.doc.prefix, sdoc.doc.suffix,
+                    sdoc.doc_id, sdoc.prev_text, sdoc.is_boundary
+                ))))
+                # 出力順を保ちつつ、先読みしすぎないようにする
+                if len(futures) >= jobs * 2:
+                    done_sdoc, future = futures.popleft()
+                    yield (done_sdoc, *future.result())
+            while len(futures) > 0:
+                done_sdoc, future = futures.popleft()
+                yield (done_sdoc, *future.result())
 
     def save_temporary_file(
         self, step: int, comp: PipeLineComponent|None,
@@ -126,6 +253,85 @@ class RunnerPipeline:
             self.logger.info("saved %s", wrt)
 
 
+def settle_newdoc_boundary(
+    results: Iterable[tuple[StreamDocument, list[T], list[str]]],
+    reconvert: Callable[[StreamDocument, bool, list[str]], tuple[list[T], list[str]]],
+) -> Iterator[T]:
+    """文書ごとの変換結果を、ファイル全体を変換した（`fit`）ときと同じ newdoc・SpaceAfter にする.
+
+    `results` は (文書, 変換した文, 持ち越す newdoc) で、各文書は次の文書に文があるとして
+    （`is_boundary`）、持ち越す newdoc なしで変換されたもの.
+    文のない文書があると、その newdoc は次の文のある文書の先頭の文に入り、
+    文書末の SpaceAfter を除くか（境界）も変わるので、その文書だけ `reconvert` で変換し直す.
+    変換し直すかが決まるまで、文のある最後の文書は返さずに持っておく.
+    """
+    held: Optional[tuple[StreamDocument, list[T], list[str]]] = None
+    pending: list[str] = []
+    has_newdoc = False
+    for sdoc, sents, rest_headers in results:
+        headers = pending
+        if len(headers) > 0:
+            sents, rest_headers = reconvert(sdoc, sdoc.is_boundary, headers)
+        has_newdoc = sdoc.has_newdoc
+        if len(sents) == 0:
+            pending = rest_headers
+            continue
+        pending = []
+        if held is not None:
+            yield from _settle_held(held, len(headers) > 0 or sdoc.add_newdoc, reconvert)
+        held = (sdoc, sents, headers)
+    if held is not None:
+        yield from _settle_held(held, has_newdoc, reconvert)
+
+
+def _settle_held(
+    held: tuple[StreamDocument, list[T], list[str]], is_boundary: bool,
+    reconvert: Callable[[StreamDocument, bool, list[str]], tuple[list[T], list[str]]],
+) -> list[T]:
+    """境界が決まった文書の文を返す（先読みで決めた境界と違えば変換し直す）."""
+    sdoc, sents, headers = held
+    if is_boundary != sdoc.is_boundary:
+        sents, _ = reconvert(sdoc, is_boundary, headers)
+    return sents
+
+
+_WORKER_RUNNER: Optional[RunnerPipeline] = None
+
+
+def _init_worker(pipe: list[str], options: dict, file_name: Optional[str]) -> None:
+    """プロセスプールのワーカーを準備する（ルールの読み込みはここで一度だけ）."""
+    global _WORKER_RUNNER  # noqa: PLW0603
+    opts = YamlDict(init=options)
+    opts["logger"] = Logger(debug=opts.get("debug", False))
+    bobj = BunsetsuDependencies(options=opts)
+    bobj.file_name = file_name
+    _WORKER_RUNNER = RunnerPipeline(
+        _bd=bobj, _ud=UniversalDependencies(options=opts), pipe=pipe, options=opts
+    )
+
+
+class DocumentJob(NamedTuple):
+    """ワーカーに渡す1文書（文書の行と `convert_document` の引数）."""
+
+    text: list[str]
+    prefix: Optional[list[str]]
+    suffix: Optional[list[str]]
+    doc_id: int
+    prev_text: Optional[str]
+    is_boundary: bool
+
+
+def _convert_document(job: DocumentJob) -> tuple[list[str], list[str]]:
+    """ワーカー側で1文書を変換する（変換した文と持ち越す newdoc を返す）."""
+    assert _WORKER_RUNNER is not None
+    doc = _WORKER_RUNNER.get_bd().build_document(job.text, job.prefix, job.suffix)
+    doc.parse()
+    sents, rest_headers = _WORKER_RUNNER.convert_document(
+        doc, job.doc_id, job.prev_text, job.is_boundary
+    )
+    return [str(sent) for sent in sents], rest_headers
+
+
 def _main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--debug", action="store_true")
@@ -14,6 +14,8 @@ class PipeLineComponent:
     name: str
     mode: str
     need_opt: ClassVar[list[str]] = []
+    # 文書ごとに実行しても結果が変わらないか（ストリーミング変換で使えるか）
+    streamable: ClassVar[bool] = True
 
     def __init__(
         self, target: BunsetsuDependencies|UniversalDependencies, opts: YamlDict
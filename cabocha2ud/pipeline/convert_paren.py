@@ -1,61 +1,83 @@
 """Modify dependencies regarding parenthesis in UD_Japanese-PUD."""
 
 import argparse
-from typing import Union
 
 from cabocha2ud.lib.logger import Logger, LogLevel
 from cabocha2ud.lib.yaml_dict import YamlDict
 from cabocha2ud.pipeline.component import UDPipeLine
 from cabocha2ud.ud import UniversalDependencies
+from cabocha2ud.ud.sentence import Sentence as UDSentence
 from cabocha2ud.ud.util import Field
+from cabocha2ud.ud.word import Word
 
 NEWLINE = "\n"
+PAREN_OPEN = ("（", "(")  # noqa: RUF001
+PAREN_CLOSE = ("）", ")")  # noqa: RUF001
+
+
+def _word_property(field: Field) -> property:
+    def getter(self: "Token") -> str:
+        return self.word.get_value(field)
+
+    def setter(self: "Token", value: str) -> None:
+        self.word.set(field, value)
+
+    return property(getter, setter, doc=f"{field.name} of the word")
+
 
-# Token class (copied from ud2lw.py)
 class Token:
-    """Token object."""
-
-    def __init__(self, line: list[str]):
-        self.id_: int = int(line[0])
-        self.form_: str = line[1]
-        self.lemma_: str = line[2]
-        self.upos_: str = line[3]
-        self.xpos_: str = line[4]
-        self.feat_: str = line[5]
-        self.head_: int = int(line[6])
-        self.deprel_: str = line[7]
-        self.deps_: str = line[8]
-        self.misc_: str = line[9]
-
-        self.line_: list[str] = line
+    """Token object.
+
+    UD の `Word` の view（読み書きはそのまま `Word` に対して行う）
+    """
+
+    __slots__ = ("id_", "word")
+
+    form_ = _word_property(Field.FORM)
+    lemma_ = _word_property(Field.LEMMA)
+    upos_ = _word_property(Field.UPOS)
+    xpos_ = _word_property(Field.XPOS)
+    deprel_ = _word_property(Field.DEPREL)
+
+    def __init__(self, word: Word):
+        self.id_: int = int(word.get_value(Field.ID))
+        self.word: Word = word
+
+    @property
+    def head_(self) -> int:
+        """HEAD of the word."""
+        return int(self.word.get_value(Field.HEAD))
+
+    @head_.setter
+    def head_(self, head: int) -> None:
+        self.word.set(Field.HEAD, head)
 
     def __repr__(self) -> str:
         return str(self.id_) + self.form_ + str(self.head_)
 
     def to_conllu(self) -> str:
         """ to conllu """
-        rtn_line = self.line_
-        rtn_line[0] = str(self.id_)
-        rtn_line[1] = self.form_
-        rtn_line[2] = self.lemma_
-        rtn_line[3] = self.upos_
-        rtn_line[4] = self.xpos_
-        rtn_line[5] = self.feat_
-        rtn_line[6] = str(self.head_)
-        rtn_line[7] = self.deprel_
-        rtn_line[8] = self.deps_
-        rtn_line[9] = self.misc_
-        return "\t".join(rtn_line).strip()
-
-
-# Sentence class (copied from ud2lw.py)
+        return "\t".join(self.word.get_value_str_list()).strip()
+
+
 class Sentence:
-    """Sentence object."""
+    """Sentence object (UD の `Sentence` の view)."""
 
-    def __init__(self):
+    def __init__(self, ud_sent: UDSentence):
         self.sent_id_: str = ""
         self.text_: str = ""
-        self.tokens_: list[Token] = []
+        header = ud_sent.get_header("sent_id")
+        if header is not None:
+            self.sent_id_ = header.get_value()
+        header = ud_sent.get_header("text")
+        if header is not None:
+            self.text_ = header.get_value()
+        self.tokens_: list[Token] = [Token(uwrd) for uwrd in ud_sent]
+
+
+def has_paren(ud_sent: UDSentence) -> bool:
+    """開きかっこ（`（`, `(`）を含むか."""
+    return any(uwrd.get_value(Field.FORM) in PAREN_OPEN for uwrd in ud_sent)
 
 
 def conv_paren(sentences: list[Sentence], logger: Logger) -> None:
@@ -66,10 +88,10 @@ def conv_paren(sentences: list[Sentence], logger: Logger) -> None:
     paren_num, success_num = 0, 0
     for sent in sentences:
         for ttok in sent.tokens_:
-            if ttok.form_ not in ["（" ,"("]:  # noqa: RUF001
+            if ttok.form_ not in PAREN_OPEN:
                 continue
             for tt1 in sent.tokens_[ttok.id_:]:
-                if tt1.form_ not in ["）", ")"]:  # noqa: RUF001
+                if tt1.form_ not in PAREN_CLOSE:
                     continue
                 paren_num += 1
                 ret = convparen_sub(sent, ttok, tt1, logger)
@@ -377,35 +399,11 @@ def convparen_sub(sentence: Sentence, open_t: Token, close_t: Token, logger: Log
 
 
 def convert_ud_to_pud(_ud: UniversalDependencies) -> list[Sentence]:
-    """ UD to PUD sentence """
-    plist: list[Sentence] = []
-    for ud_sent in _ud.sentences():
-        pud_sent = Sentence()
-        header = ud_sent.get_header("sent_id")
-        if header is not None:
-            pud_sent.sent_id_ = header.get_value()
-        header = ud_sent.get_header("text")
-        if header is not None:
-            pud_sent.text_ = header.get_value()
-        for uwrd in ud_sent.words():
-            pud_sent.tokens_.append(Token(uwrd.get_value_str_list()))
-        plist.append(pud_sent)
-    return plist
-
-
-def update_result_for_pud(pud_ss: list[Sentence], _ud: UniversalDependencies) -> None:
-    """ update result for PUD """
-    for psent, usent in zip(pud_ss, _ud.sentences()):
-        assert len(psent.tokens_) == len(usent.words())
-        for pwrd, uwrd in zip(psent.tokens_, usent.words()):
-            pairs: list[tuple[Field, Union[str, int]]] = [
-                (Field.ID, pwrd.id_), (Field.FORM, pwrd.form_), (Field.LEMMA, pwrd.lemma_),
-                (Field.UPOS, pwrd.upos_), (Field.XPOS, pwrd.xpos_), (Field.FEATS, pwrd.feat_),
-                (Field.HEAD, pwrd.head_), (Field.DEPREL, pwrd.deprel_),
-                (Field.FEATS, pwrd.feat_), (Field.DEPS, pwrd.deps_), (Field.MISC, pwrd.misc_)
-            ]
-            for www, pww in pairs:
-                uwrd.set(www, pww)
+    """UD to PUD sentence.
+
+    かっこを含む文だけを、UD の文の view（`Sentence`）にする
+    """
+    return [Sentence(ud_sent) for ud_sent in _ud.sentences() if has_paren(ud_sent)]
 
 
 class ConvertParenComponent(UDPipeLine):
@@ -422,7 +420,6 @@ class ConvertParenComponent(UDPipeLine):
         self.logger.message(f"do {self.name}", mode=LogLevel.DEBUG)
         pud_ss = convert_ud_to_pud(self.target)
         conv_paren(pud_ss, logger=self.logger)
-        update_result_for_pud(pud_ss, self.target)
 
 
 COMPONENT = ConvertParenComponent
@@ -24,10 +24,10 @@ class FixStuttersComponent(UDPipeLine):
         self.logger.debug("do %s", self.name)
         for sent in self.target.sentences():
             hlst: list[int] = [-1] + [
-                int(wrd.get(Field.HEAD).get_content()) for wrd in sent.words()
+                int(wrd.get_value(Field.HEAD)) for wrd in sent.words()
             ]
             mlst: list[str] = ["dummy"] +  [
-                wrd.get(Field.DEPREL).get_content() for wrd in sent.words()
+                wrd.get_value(Field.DEPREL) for wrd in sent.words()
             ]
             res = [
                 (p, int(c), mlst[p], mlst[int(c)]) for p, c in enumerate(hlst)
@@ -42,10 +42,10 @@ class FixStuttersComponent(UDPipeLine):
                 cwrd = sent[cpos-1]
                 pwrd = sent[ppos-1]
                 if plabel in ["case", "aux"]:
-                    cwrd.set(Field.HEAD, pwrd.get(Field.HEAD).get_content())
-                    pwrd.set(Field.HEAD, str(cwrd.get(Field.ID)))
+                    cwrd.set(Field.HEAD, pwrd.get_value(Field.HEAD))
+                    pwrd.set(Field.HEAD, cwrd.get_value(Field.ID))
                 elif plabel in ["mark", "cc"]:
-                    cwrd.set(Field.HEAD, pwrd.get(Field.HEAD).get_content())
+                    cwrd.set(Field.HEAD, pwrd.get_value(Field.HEAD))
 
 
 COMPONENT = FixStuttersComponent
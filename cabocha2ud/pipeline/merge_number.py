@@ -133,7 +133,7 @@ class MergeNumberComponent(BDPipeLine):
             for sent in doc.sentences():
                 for bunsetu in sent.bunsetues():
                     check_bunsetu_merge_number(bunsetu, sent)
-            sent.update_word_pos()
+                sent.update_word_pos()
             doc.detect_ud_dependencies()
 
     def prepare(self) -> None:
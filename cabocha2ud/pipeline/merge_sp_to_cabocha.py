@@ -2,58 +2,26 @@
 
 import argparse
 from difflib import SequenceMatcher
-from pathlib import Path
 from typing import ClassVar, Optional
 
 from cabocha2ud.bd import BunsetsuDependencies
 from cabocha2ud.bd.sentence import Sentence
 from cabocha2ud.lib.logger import Logger
+from cabocha2ud.lib.sentence_align import align_sentences, report_alignment
+from cabocha2ud.lib.sp_data import SPData, SPSentence, load_db_file
 from cabocha2ud.lib.yaml_dict import YamlDict
 from cabocha2ud.pipeline.component import BDPipeLine
 
 
-def load_db_file(db_file: Optional[str]) -> list[list[dict[str, str]]]:
-    """Load SP data."""
-    if db_file is None:
-        return []
-    full_data: list[dict[str, str]] = []
-    target_column: str = "boundary(S)"
-    nfull: list[list[dict[str, str]]] = []
-    stack: list[dict[str, str]] = []
-    with Path(db_file).open("r", encoding="utf-8") as db_data:
-        header = next(db_data).rstrip("\r\n").split("\t")
-        for line in db_data:
-            item: dict[str, str] = dict(list(zip(header, line.rstrip("\r\n").split("\t"))))
-            if item["orthToken(S)"] == '","':
-                item["orthToken(S)"] = ","
-            full_data.append(item)
-        for item in full_data[1:]:
-            if item[target_column] == "B":
-                nfull.append(stack)
-                stack = []
-            stack.append(item)
-        assert stack[0][target_column] == "B"
-        if len(stack) > 0:
-            nfull.append(stack)
-    return nfull
-
-
-def similarity(alst: str, blst: str) -> float:
-    """Caluclate similarity."""
-    if len(alst) < len(blst):
-        alst, blst = blst, alst
-    return SequenceMatcher(None, alst, blst).ratio()
-
-
-def matching_from_spd(snt: Sentence, spd: list[dict[str, str]]) -> list[tuple[int, tuple[int,...]]]:
+def matching_from_spd(snt: Sentence, spd: SPSentence) -> list[tuple[int, tuple[int,...]]]:
     """Diff using by SequenceMatcher.
 
     return [(conll_wrd_pos, spd_wrd_pos_tuple), ....]
 
     """
-    assert len(snt.words()) <= len(spd)
+    assert len(snt.words()) <= len(spd.tokens)
     cwrds = [w.get_surface() for w in snt.words()]
-    swrds = [c["orthToken(S)"] for c in spd]
+    swrds = spd.tokens
     if len(cwrds) == len(swrds):
         return [(p, (p, )) for p in range(len(cwrds))]
     snt.logger.debug("cwrds: %s swrds: %s", cwrds, swrds)
@@ -74,16 +42,16 @@ def matching_from_spd(snt: Sentence, spd: list[dict[str, str]]) -> list[tuple[in
     return pos_lst
 
 
-def adapt_spafter_to_cabocha(sentence: Sentence, spd: list[dict[str, str]]) -> None:
+def adapt_spafter_to_cabocha(sentence: Sentence, spd: SPSentence) -> None:
     """Adapt spafter to Cabocha Data."""
-    if all(s["SpaceAfter"] != "YES" for s in spd):
+    if not any(spd.space_after):
         return
-    assert len(sentence.words()) <= len(spd)
+    assert len(sentence.words()) <= len(spd.tokens)
     result_pos = matching_from_spd(sentence, spd)
     for bpos, sp_pos in result_pos:
         assert isinstance(sp_pos, tuple)
         if len(sp_pos) == 1:  # 1対1
-            if spd[sp_pos[0]]["SpaceAfter"] == "YES":
+            if spd.space_after[sp_pos[0]]:
                 wrd = sentence.words()[bpos]
                 pos = sentence.get_pos_from_word(wrd)
                 assert sentence.annotation_list is not None
@@ -93,39 +61,33 @@ def adapt_spafter_to_cabocha(sentence: Sentence, spd: list[dict[str, str]]) -> N
                 ]
                 sentence.annotation_list.append_segment([s.split(" ") for s in seg_s])
         elif len(sp_pos) > 1:
-            assert all(spd[spos]["SpaceAfter"] != "YES" for spos in sp_pos)
+            assert not any(spd.space_after[spos] for spos in sp_pos)
 
 
 def get_merged_poslist(
-    _bd: BunsetsuDependencies, sp_data: list[list[dict[str, str]]]
+    _bd: BunsetsuDependencies, sp_data: SPData,
+    logger: Optional[Logger]=None
 ) -> list[tuple[int, int]]:
     """SPデータと統合する.
 
-    cabochaデータとSPデータをマッチングする
+    cabochaデータとSPデータをマッチングする（`align_sentences` を参照）
 
     Args:
         _bd (BunsetsuDependencies): Bunsetsu Dependencies
-        sp_data (list[list[dict[str, str]]]): [description]
+        sp_data (SPData): SPデータ
+        logger (Optional[Logger]): 対応しなかった・曖昧なSPの文を出力する
 
     Returns:
-        list[tuple[int, int]]: [description]
+        list[tuple[int, int]]: (cabochaの文の位置, SPの文の位置)
 
     """
-    if len(_bd.sentences()) == len(sp_data):
-        return [(p, p) for p in range(len(_bd.sentences()))]
-    sp_it = iter(enumerate(sp_data))
-    pos_list: list[tuple[int, int]] = []
-    sim_threshold = 0.8
-    for bpos, sentence in enumerate(_bd.sentences()):
-        spos, cand_sp = next(sp_it)
-        stext = "".join([c["orthToken(S)"] for c in cand_sp])
-        ctext = sentence.get_text()
-        while similarity(stext, ctext) < sim_threshold:
-            spos, cand_sp = next(sp_it)
-            stext = "".join([c["orthToken(S)"] for c in cand_sp])
-        pos_list.append((bpos, spos))
-    assert len(pos_list) == len(_bd.sentences())
-    return pos_list
+    alignment = align_sentences(
+        [sentence.get_text() for sentence in _bd.sentences()], sp_data.texts
+    )
+    if logger is not None:
+        report_alignment(alignment, logger)
+    assert len(alignment.pairs) == len(_bd.sentences())
+    return alignment.pairs
 
 
 class MergeSPtoCabochaComponent(BDPipeLine):
@@ -138,10 +100,12 @@ class MergeSPtoCabochaComponent(BDPipeLine):
 
     name = "merge_sp_to_cabocha"
     need_opt: ClassVar[list[str]] = ["sp_file"]
+    # SPデータとの対応づけをファイル全体で行うため
+    streamable: ClassVar[bool] = False
 
     def __init__(self, target: BunsetsuDependencies, opts: YamlDict) -> None:
         """Init."""
-        self.sp_data: list[list[dict[str, str]]]
+        self.sp_data: SPData
         super().__init__(target, opts)
 
     def prepare(self) -> None:
@@ -155,7 +119,7 @@ class MergeSPtoCabochaComponent(BDPipeLine):
         self.logger.debug("do %s", self.name)
         for doc in self.target.documents():
             doc.detect_ud_dependencies()
-        pos_list = get_merged_poslist(self.target, self.sp_data)
+        pos_list = get_merged_poslist(self.target, self.sp_data, logger=self.logger)
         for bpos, spos in pos_list:
             adapt_spafter_to_cabocha(self.target.get_sentence(bpos), self.sp_data[spos])
 
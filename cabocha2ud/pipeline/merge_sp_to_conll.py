@@ -11,82 +11,48 @@ from typing import Optional, Union, cast
 from difflib import SequenceMatcher
 
 from cabocha2ud.lib.logger import Logger
+from cabocha2ud.lib.sentence_align import align_sentences, report_alignment
+from cabocha2ud.lib.sp_data import SPData, SPSentence, load_db_file
 from cabocha2ud.ud import UniversalDependencies
 from cabocha2ud.ud.sentence import Sentence
 from cabocha2ud.ud.word import Word, Misc
 from cabocha2ud.ud.util import FORM, MISC
 
 
-def load_db_file(db_file: Optional[str]) -> list[list[dict[str, str]]]:
-    """
-        load dainagon data
-    """
-    if db_file is None:
-        return []
-    full_data: list[dict[str, str]] = []
-    target_column: str = "boundary(S)"
-    nfull: list[list[dict[str, str]]] = []
-    stack: list[dict[str, str]] = []
-    with open(db_file) as db_data:
-        header = next(db_data).rstrip("\r\n").split("\t")
-        for line in db_data:
-            item: dict[str, str] = dict(list(zip(header, line.rstrip("\r\n").split("\t"))))
-            if item["orthToken(S)"] == '","':
-                item["orthToken(S)"] = ','
-            full_data.append(item)
-        for item in full_data[1:]:
-            if item[target_column] == "B":
-                nfull.append(stack)
-                stack = []
-            stack.append(item)
-        assert stack[0][target_column] == "B"
-        if len(stack) > 0:
-            nfull.append(stack)
-    return nfull
-
-
-def similarity(alst: str, blst: str) -> float:
-    if len(alst) < len(blst):
-        alst, blst = blst, alst
-    return SequenceMatcher(None, alst, blst).ratio()
-
-
-def get_merged_poslist(ud: UniversalDependencies, sp_data: list[list[dict[str, str]]]) -> list[tuple[int, int]]:
+def get_merged_poslist(
+    ud: UniversalDependencies, sp_data: SPData,
+    logger: Optional[Logger]=None
+) -> list[tuple[int, int]]:
     """ SPデータと統合する
-     conllデータとSPデータをマッチングする
+     conllデータとSPデータをマッチングする（`align_sentences` を参照）
     Args:
-        conll_data ([type]): [description]
-        sp_data ([type]): [description]
+        ud (UniversalDependencies): conllデータ
+        sp_data (SPData): SPデータ
+        logger (Optional[Logger]): 対応しなかった・曖昧なSPの文を出力する
 
     Returns:
-        [type]: [description]
+        list[tuple[int, int]]: (conllの文の位置, SPの文の位置)
     """
-    if len(ud.sentences()) == len(sp_data):
-        return [(p, p) for p in range(len(ud.sentences()))]
-    sp_it = iter(enumerate(sp_data))
-    pos_list: list[tuple[int, int]] = []
+    texts: list[str] = []
     for cpos in range(len(ud.sentences())):
-        spos, cand_sp = next(sp_it)
-        stext = "".join([c["orthToken(S)"] for c in cand_sp])
         txt = ud.get_sentence(cpos).get_header("text")
         assert txt is not None
-        ctext = txt.get_value()
-        while similarity(stext, ctext) < 0.8:
-            spos, cand_sp = next(sp_it)
-            stext = "".join([c["orthToken(S)"] for c in cand_sp])
-        pos_list.append((cpos, spos))
-    assert len(pos_list) == len(ud.sentences())
-    return pos_list
+        texts.append(txt.get_value())
+    alignment = align_sentences(texts, sp_data.texts)
+    if logger is not None:
+        report_alignment(alignment, logger)
+    assert len(alignment.pairs) == len(ud.sentences())
+    return alignment.pairs
 
 
-def matching_from_seqmath(sentence: Sentence, spd: list[dict[str, str]]) -> list[ tuple[Union[int, tuple[int, int]], tuple[int,...]] ]:
+def matching_from_seqmath(sentence: Sentence, spd: SPSentence) -> list[ tuple[Union[int, tuple[int, int]], tuple[int,...]] ]:
     """
         diff using by SequenceMatcher
          return [(conll_wrd_pos, spd_wrd_pos_tuple), ....]
     """
-    assert len(sentence.words()) <= len(spd)
+    assert len(sentence.words()) <= len(spd.tokens)
     cwrds = [cast(str, c[FORM].get_content()) for c in sentence.words()]
-    swrds = [c["orthToken(S)"] for c in spd]
+    swrds = spd.tokens
     if len(cwrds) == len(swrds):
         return [(p, (p, )) for p in range(len(cwrds))]
     sentence.logger.debug("cwrds: ", cwrds, "swrds: ", swrds)
@@ -121,18 +87,18 @@ def accent(text: str) -> str:
     return text
 
 
-def adapt_spafter_to_conll(sentence: Sentence, spd: list[dict[str, str]]) -> None:
+def adapt_spafter_to_conll(sentence: Sentence, spd: SPSentence) -> None:
     """ adapt spafter to CoNLL line
 
     Args:
         conll (list[list[str]]): SpaceAfter=を書き換えるCoNLL文
-        spd (list[dict[str, str]]): SpaceAfterデータ
+        spd (SPSentence): SpaceAfterデータ
     Return
         なし、ただしsentenceはアップデートされている
     """
-    if all([s["SpaceAfter"] != "YES" for s in spd]):
+    if not any(spd.space_after):
         return
-    assert len(sentence.words()) <= len(spd)
+    assert len(sentence.words()) <= len(spd.tokens)
     result_pos = matching_from_seqmath(sentence, spd)
     # assert [p for p, _ in result_pos] == list(range(len(conll[hpos:])))
     for cpos, sp_pos in result_pos:
@@ -140,20 +106,18 @@ def adapt_spafter_to_conll(sentence: Sentence, spd: list[dict[str, str]]) -> Non
         # sp_posをみて、SpaceAfterがいるか確認する
         if len(sp_pos) == 1:  # 1対1
             if isinstance(cpos, int):
-                if spd[sp_pos[0]]["SpaceAfter"] == "YES":
+                if spd.space_after[sp_pos[0]]:
                     misc = sentence[cpos][MISC]
                     assert isinstance(misc, Misc)
                     misc.update("SpaceAfter", "Yes")
         elif len(sp_pos) > 1:
-            if all([spd[spos]["SpaceAfter"] != "YES" for spos in sp_pos]):
+            if not any(spd.space_after[spos] for spos in sp_pos):
                 continue
             if isinstance(cpos, int):
                 form = sentence[cpos][FORM].get_content()
                 assert isinstance(form, str)
                 ccc = accent(form)  # conll[hpos:][cpos][1])
-                sss = "".join([
-                    spd[spos]["orthToken(S)"] for spos in sp_pos
-                ])
+                sss = "".join([spd.tokens[spos] for spos in sp_pos])
                 assert ccc == sss, "{} != {}".format(ccc, sss)
             else:
                 assert isinstance(cpos, tuple) and len(cpos) == 2
@@ -163,11 +127,11 @@ def adapt_spafter_to_conll(sentence: Sentence, spd: list[dict[str, str]]) -> Non
             raise ValueError
 
 
-def do(ud: UniversalDependencies, sp_data: list[list[dict[str, str]]], logger: Optional[Logger]=None) -> None:
+def do(ud: UniversalDependencies, sp_data: SPData, logger: Optional[Logger]=None) -> None:
     if logger is None:
         logger = Logger()
     logger.debug("do merge sp to conll")
-    pos_list = get_merged_poslist(ud, sp_data)
+    pos_list = get_merged_poslist(ud, sp_data, logger=logger)
     for cpos, spos in pos_list:
         sentence = ud.get_sentence(cpos)
         adapt_spafter_to_conll(sentence, sp_data[spos])
@@ -198,7 +162,6 @@ def main() -> None:
     args = parser.parse_args()
     logger = Logger(debug=args.debug)
     ud = UniversalDependencies(file_name=args.conll_file)
-    sp_data: list[list[dict[str, str]]] = []
     sp_data = load_db_file(args.sp_file)
     do(ud, sp_data, logger=logger)
     ud.write_ud_file(args.writer)
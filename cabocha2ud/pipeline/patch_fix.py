@@ -4,7 +4,8 @@ import argparse
 from typing import ClassVar, Optional, TypedDict, Union, cast
 
 from cabocha2ud.lib.logger import Logger
-from cabocha2ud.lib.yaml_dict import YamlDict, YamlList
+from cabocha2ud.lib.rule_cache import load_yaml_list
+from cabocha2ud.lib.yaml_dict import YamlDict
 from cabocha2ud.pipeline.component import UDPipeLine
 from cabocha2ud.ud import UniversalDependencies
 from cabocha2ud.ud.util import Field
@@ -24,7 +25,7 @@ def load_path_file(patch_file_name: Optional[str]) -> dict[str, list[Rule]]:
         return {}
     rule_list: list[dict[str, Union[str, list[Rule]]]] = cast(
         list[dict[str, Union[str, list[Rule]]]],
-        list(YamlList(file_name=patch_file_name, auto_load=True))
+        load_yaml_list(patch_file_name)
     )
     return {
         cast(str, rule["sent_id"]): cast(list[Rule], rule["rules"]) for rule in rule_list
@@ -58,15 +59,13 @@ class PatchFixComponent(UDPipeLine):
         self.logger.debug("do %s", self.name)
         if len(self.rule_list) == 0:
             return
-        for sent in self.target.sentences():
-            header_keys = sent.get_header_keys()
-            if "sent_id" not in header_keys:
+        # 対象の文だけを取り出す（索引つきで読み込んだ場合、ほかの文はパースしない）
+        for spos, sent_id in enumerate(self.target.sentence_ids):
+            if sent_id not in self.rule_list:
                 continue
+            sent = self.target.get_sentence(spos)
             sent_id_header = sent.get_header("sent_id")
-            if sent_id_header is None:
-                continue
-            sent_id = sent_id_header.get_value()
-            if sent_id not in self.rule_list:
+            if sent_id_header is None or sent_id_header.get_value() != sent_id:
                 continue
             for rule in self.rule_list[sent_id]:
                 # ルールに従い埋めていく
@@ -95,7 +94,7 @@ def _main() -> None:
     options = YamlDict(
         init={"logger": Logger(debug=args.debug), "patch_file": args.patch_file}
     )
-    _ud = UniversalDependencies(file_name=args.conll_file, options=options)
+    _ud = UniversalDependencies(file_name=args.conll_file, options=options, indexed=True)
     COMPONENT(_ud,  opts=options)()
     _ud.write_ud_file(args.writer)
 
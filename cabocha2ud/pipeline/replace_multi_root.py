@@ -1,105 +1,143 @@
 """マルチルートを係り先を変更してシングルにするプログラム."""
 
 import argparse
+from dataclasses import dataclass
 from typing import ClassVar, cast
 
-from cabocha2ud.lib.dependency import get_caused_nonprojectivities
+from cabocha2ud.lib.dependency import get_all_caused_nonprojectivities
 from cabocha2ud.lib.logger import Logger
 from cabocha2ud.lib.yaml_dict import YamlDict
 from cabocha2ud.pipeline.component import UDPipeLine
 from cabocha2ud.ud import UniversalDependencies
 from cabocha2ud.ud.sentence import Sentence
-from cabocha2ud.ud.util import DEPREL, HEAD, ID, UPOS, XPOS, Field
+from cabocha2ud.ud.util import Field
 
 
-def fix_projectivity_rule_to_punct(data: list[list[str]]) -> list[list[str]]:
+@dataclass
+class TreeView:
+    """文の係り受けの配列 (単語の ID を位置とし、位置 0 は使わない).
+
+    `heads` は `get_all_caused_nonprojectivities` の `tree` と同じ形式.
+    修正関数はこの配列を書き換え、`apply` で文に書き戻す.
+    """
+
+    heads: list[int]
+    deprels: list[str]
+    upos: list[str]
+    xpos: list[str]
+
+    def __len__(self) -> int:
+        """Return the number of words + 1."""
+        return len(self.heads)
+
+    @classmethod
+    def from_sentence(cls, sentence: Sentence) -> "TreeView":
+        """Build view of `sentence`."""
+        words = sentence.words()
+        return cls(
+            [-1] + [int(wrd.get_value(Field.HEAD)) for wrd in words],
+            [""] + [wrd.get_value(Field.DEPREL) for wrd in words],
+            [""] + [wrd.get_value(Field.UPOS) for wrd in words],
+            [""] + [wrd.get_value(Field.XPOS) for wrd in words],
+        )
+
+    def apply(self, sentence: Sentence) -> None:
+        """変更した HEAD, DEPREL を `sentence` に書き戻す."""
+        for num, wrd in enumerate(sentence.words(), start=1):
+            if wrd.get_value(Field.HEAD) != str(self.heads[num]):
+                wrd.set(Field.HEAD, self.heads[num])
+            if wrd.get_value(Field.DEPREL) != self.deprels[num]:
+                wrd.set(Field.DEPREL, self.deprels[num])
+
+
+def _word_pos(num: int) -> int:
+    """単語 `num` の位置 (これまでの `data[num-1]` と同じく、0 は最後の単語を指す).
+
+    head 0 (root) で最後の単語を読み書きするのは既知のバグで、出力を変えないために残している.
+    """
+    return num if num > 0 else num - 1
+
+
+def fix_projectivity_rule_to_punct(tree: TreeView) -> None:
     """punctの非交差を直す."""
-    nonproj_list: dict[int, list[int]] = {}
-    for line in data:
-        # 再び非交差を確認する
-        if line[DEPREL] == "punct":
-            num = int(line[ID])
-            tree = [-1] + [int(line[HEAD]) for line in data]
-            nonprojnodes = get_caused_nonprojectivities(num, tree)
-            if len(nonprojnodes) > 0:
-                nonproj_list[num] = nonprojnodes
-    if len(nonproj_list) > 0:
-        for fix_target in nonproj_list:
-            kakko_pos = data[fix_target-1][XPOS]
-            if kakko_pos == "補助記号-括弧開":
-                # 外にあるのが問題なので括弧開直後の単語にかける
-                data[fix_target-1][HEAD] = str(int(data[fix_target-1][ID]) + 1)
-            else:
-                # 下括弧と上の方の掛かり先を、下括弧がかけていた最下の単語へと入れ替える
-                #  対象文: A240n_OY14_03106-10, OC09_04679-5
-                save_head = int(data[fix_target-1][HEAD])
-                conf_pos_l = nonproj_list[fix_target]
-                assert len(conf_pos_l) == 1
-                conf_pos = conf_pos_l[0]
-                new_fix_pos = fix_target - 1
-                while conf_pos < new_fix_pos and int(data[new_fix_pos-1][HEAD]) != save_head:
-                    new_fix_pos = new_fix_pos - 1
-                if conf_pos < new_fix_pos:
-                    data[conf_pos-1][HEAD] = str(new_fix_pos)
-                    data[fix_target-1][HEAD] = str(new_fix_pos)
-    return data
-
-
-def fix_leafpunct_rule_to_punct(data: list[list[str]]) -> list[list[str]]:
+    # 再び非交差を確認する
+    punct_nums = [num for num in range(1, len(tree)) if tree.deprels[num] == "punct"]
+    nonproj_list: dict[int, list[int]] = {
+        num: nonprojnodes
+        for num, nonprojnodes in get_all_caused_nonprojectivities(tree.heads, punct_nums).items()
+        if len(nonprojnodes) > 0
+    }
+    for fix_target in nonproj_list:
+        if tree.xpos[fix_target] == "補助記号-括弧開":
+            # 外にあるのが問題なので括弧開直後の単語にかける
+            tree.heads[fix_target] = fix_target + 1
+        else:
+            # 下括弧と上の方の掛かり先を、下括弧がかけていた最下の単語へと入れ替える
+            #  対象文: A240n_OY14_03106-10, OC09_04679-5
+            save_head = tree.heads[fix_target]
+            conf_pos_l = nonproj_list[fix_target]
+            assert len(conf_pos_l) == 1
+            conf_pos = conf_pos_l[0]
+            new_fix_pos = fix_target - 1
+            while conf_pos < new_fix_pos and tree.heads[new_fix_pos] != save_head:
+                new_fix_pos = new_fix_pos - 1
+            if conf_pos < new_fix_pos:
+                tree.heads[conf_pos] = new_fix_pos
+                tree.heads[fix_target] = new_fix_pos
+
+
+def fix_leafpunct_rule_to_punct(tree: TreeView) -> None:
     """Fix left punct."""
     errors = []
-    for line in data:
-        num, parent_num = int(line[ID]), int(line[HEAD])
-        if line[DEPREL] != "punct" and data[parent_num-1][XPOS] == "補助記号-括弧開":
+    for num in range(1, len(tree)):
+        parent_num = tree.heads[num]
+        if tree.deprels[num] != "punct" and tree.xpos[_word_pos(parent_num)] == "補助記号-括弧開":
             errors.append([num, parent_num])
     if len(errors) == 0:
-        return data
+        return
     if len({parent_num for _, parent_num in errors}) != 1:
         # おなじ親がふさわしい
-        return data
+        return
     parent_num = next(parent_num for _, parent_num in errors)
-    cand_parent = int(parent_num) + 1
-    if cand_parent > len(data) or data[cand_parent-1][DEPREL] == "punct":
-        return data
-    assert int(data[cand_parent-1][HEAD]) == parent_num
-    data[cand_parent-1][HEAD] = data[parent_num-1][HEAD]
-    data[parent_num-1][HEAD] = str(cand_parent)
-    if data[cand_parent-1][HEAD] == "0":
-        data[cand_parent-1][DEPREL] = "root"
-        data[parent_num-1][DEPREL] = "punct"
+    cand_parent = parent_num + 1
+    if cand_parent > len(tree) - 1 or tree.deprels[cand_parent] == "punct":
+        return
+    assert tree.heads[cand_parent] == parent_num
+    tree.heads[cand_parent] = tree.heads[_word_pos(parent_num)]
+    tree.heads[_word_pos(parent_num)] = cand_parent
+    if tree.heads[cand_parent] == 0:
+        tree.deprels[cand_parent] = "root"
+        tree.deprels[_word_pos(parent_num)] = "punct"
     for enum, _ in errors:
         if enum == cand_parent:
             continue
-        data[int(enum)-1][HEAD] = str(cand_parent)
-    for line in data:
-        num, aparent_num = int(line[ID]), int(line[HEAD])
-        if line[DEPREL] == "punct" and aparent_num == parent_num:
-            line[HEAD] = str(cand_parent)
-    return data
-
-
-def __restore_rel(line: list[str]) -> None:
-    if line[UPOS] == "PUNCT":
-        line[DEPREL] = "punct"
-    if line[UPOS] == "CCONJ":
-        line[DEPREL] = "cc"
+        tree.heads[enum] = cand_parent
+    for num in range(1, len(tree)):
+        if tree.deprels[num] == "punct" and tree.heads[num] == parent_num:
+            tree.heads[num] = cand_parent
+
+
+def __restore_rel(tree: TreeView, num: int) -> None:
+    if tree.upos[num] == "PUNCT":
+        tree.deprels[num] = "punct"
+    if tree.upos[num] == "CCONJ":
+        tree.deprels[num] = "cc"
     # FOR CEJC
-    if line[XPOS] == "言いよどみ":
-        line[DEPREL] = "reparandum"
-    if line[XPOS] == "感動詞-フィラー":
-        line[DEPREL] = "discourse"
+    if tree.xpos[num] == "言いよどみ":
+        tree.deprels[num] = "reparandum"
+    if tree.xpos[num] == "感動詞-フィラー":
+        tree.deprels[num] = "discourse"
 
 
-def detect_true_root(data: list[list[str]], numlst: list[int]) -> tuple[list[int], int]:
+def detect_true_root(tree: TreeView, numlst: list[int]) -> tuple[list[int], int]:
     """ひとまずひとつの root を決める関数."""
     target_pos = 1
     true_root = numlst[len(numlst)-1]
-    num_line = {int(line[0]): line for line in data}
-    true_root_pos = num_line[true_root][UPOS]
+    true_root_pos = tree.upos[true_root]
     while len(numlst)-target_pos >= 0 and true_root_pos == "PUNCT":
         target_pos += 1
         true_root = numlst[len(numlst)-target_pos]
-        true_root_pos = num_line[true_root][UPOS]
+        true_root_pos = tree.upos[true_root]
     if len(numlst)-target_pos == -1:
         # どれもpunctの場合は最後のを選び直す
         true_root = numlst[-1]
@@ -107,27 +145,14 @@ def detect_true_root(data: list[list[str]], numlst: list[int]) -> tuple[list[int
     return frmpos, true_root
 
 
-def convert_to_single_root(data: list[list[str]]) -> list[list[str]]:
+def convert_to_single_root(tree: TreeView) -> None:
     """複数あるルートの中で基本のルートを決める."""
-    nsent_st: list[list[str]] = []
-    tree: dict[int, set[int]] = {}
-    for pos, dnum in [(int(line[ID]), int(line[HEAD])) for line in data]:
-        if dnum not in tree:
-            tree[dnum] = set()
-        tree[dnum].add(pos)
-    numlst = sorted(tree[0])
-    frmpos, true_root = detect_true_root(data, numlst)
-    for line in data:
-        num, dnum = int(line[ID]), int(line[HEAD])
-        if num not in frmpos:
-            nsent_st.append(line)
-            continue
-        assert dnum == 0
-        dnum = true_root
-        line[DEPREL] = "dep"
-        __restore_rel(line)
-        nsent_st.append([str(num)] + line[1:6] + [str(dnum)] + line[7:])
-    return nsent_st
+    numlst = [num for num in range(1, len(tree)) if tree.heads[num] == 0]
+    frmpos, true_root = detect_true_root(tree, numlst)
+    for num in frmpos:
+        tree.heads[num] = true_root
+        tree.deprels[num] = "dep"
+        __restore_rel(tree, num)
 
 
 class ReplaceMultiRootComponent(UDPipeLine):
@@ -144,15 +169,12 @@ class ReplaceMultiRootComponent(UDPipeLine):
     def __init__(self, target: UniversalDependencies, opts: YamlDict) -> None:
         """Init."""
         self.rep_multi_root_mode: str = ""
-        self.space_marker: str = " "
         super().__init__(target, opts)
 
     def prepare(self) -> None:
         """Prepare func."""
         if self.opts.get("rep_multi_root_mode") is not None:
             self.rep_multi_root_mode = cast(str, self.opts.get("rep_multi_root_mode"))
-        if self.opts.get("space_marker") is not None:
-            self.space_marker = cast(str, self.opts.get("space_marker"))
         assert self.rep_multi_root_mode in ["convert", "remove"]
 
     def __call__(self) -> None:
@@ -160,28 +182,24 @@ class ReplaceMultiRootComponent(UDPipeLine):
         assert isinstance(self.target, UniversalDependencies)
         self.logger.debug(self.name)
         if self.rep_multi_root_mode == "convert":
-            for pos, ud_sent in enumerate(self.target.sentences()):
-                heads_size = sum(c.get_content() == "0" for c in ud_sent.get_colmuns(Field.HEAD))
+            for ud_sent in self.target.sentences():
+                heads_size = sum(wrd.get_value(Field.HEAD) == "0" for wrd in ud_sent)
                 assert heads_size > 0, "`root` must be rather one in sentence, but Zero root"
                 if heads_size == 1:
                     continue
-                header = ud_sent.get_str_list(mode="header")
-                data = [
-                    line.rstrip("\n").split("\t")
-                    for line in ud_sent.get_str_list(mode="full")[len(header):]
-                ]
-                data = convert_to_single_root(data)
+                tree = TreeView.from_sentence(ud_sent)
+                convert_to_single_root(tree)
                 # ここに非交差修正ルール
-                data = fix_projectivity_rule_to_punct(data)
+                fix_projectivity_rule_to_punct(tree)
                 # ここにpunct修正ルール
-                data = fix_leafpunct_rule_to_punct(data)
-                sent = header + ["\t".join(ll) for ll in data]
-                nsent = Sentence.load_from_list(sent, spt=self.space_marker)
-                self.target.update_sentence_of_index(pos, nsent)
+                fix_leafpunct_rule_to_punct(tree)
+                # 文を作り直さずに書き換える
+                tree.apply(ud_sent)
+                ud_sent.update_sentence()
         elif self.rep_multi_root_mode == "remove":
             rm_sent_lst: list[int] = []
             for pos, ud_sent in enumerate(self.target.sentences()):
-                heads_size = sum(c.get_content() == "0" for c in ud_sent.get_colmuns(Field.HEAD))
+                heads_size = sum(wrd.get_value(Field.HEAD) == "0" for wrd in ud_sent)
                 assert heads_size > 0, "`root` must be rather one in sentence, but Zero root"
                 if heads_size == 1:
                     continue
@@ -210,8 +228,6 @@ def _main() -> None:
         init={"logger": Logger(debug=args.debug), "rep_multi_root_mode": args.mode}
     )
     _ud = UniversalDependencies(file_name=args.conll_file, options=options)
-    if options.get("space_marker") is None:
-        options["space_marker"] = _ud.get_sp()
     COMPONENT(_ud,  opts=options)()
     _ud.write_ud_file(args.writer)
 
@@ -1,6 +1,7 @@
 """BCCWJ DepParaPAS rule function: for bunsetu."""
 
 import re
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Optional, cast
 
 if TYPE_CHECKING:
@@ -26,7 +27,7 @@ BUNSETU_NO_POS_SUBJ_MATCH_RE = re.compile(
 )
 
 
-def _get_features(features: list[str]) -> str:
+def _get_features(features: Sequence[str]) -> str:
     """素性をすべて,区切りに（フォーマット統一のため）."""
     nfes = []
     for fff in features:
@@ -5,18 +5,19 @@ BCCWJ DepParaPAS rule function
 """
 
 import functools
-from collections.abc import Callable
-from typing import Generator, NamedTuple, Optional, TypedDict, Union, cast
+import re
+from collections.abc import Callable, Iterable
+from typing import NamedTuple, Optional, TypedDict, Union, cast
 
 from cabocha2ud.bd.word import Word
-from cabocha2ud.lib.yaml_dict import YamlDict
+from cabocha2ud.lib.rule_cache import load_yaml_dict
 from cabocha2ud.rule import dep_rule_func
 
 
 class Rule(NamedTuple):
     """ Rule """
     func_name: str
-    elem_arg: Union[int, str, list, set]
+    elem_arg: Union[int, str, list, set, re.Pattern[str]]
 
 
 class SubRule(NamedTuple):
@@ -52,6 +53,75 @@ SELECT_TRGT_POSIT: dict[str, Callable[[Optional[Word]], Union[None, list[Word]]]
 }
 
 
+class DepRuleSet(list[tuple[list[SubRule], str]]):
+    """ Dependency rule list with dispatch index
+
+    `order_rule` の順番はそのままに、単語自身の文節タイプ(bpos)とUD品詞(upos)で
+    当てはまりうるルールだけを候補として引けるようにしたもの.
+    (`include_word_bpos`, `match_word_bpos`, `include_word_upos` の条件を使う)
+
+    Attributes:
+        verify (bool): 候補から求めたラベルを全ルールを順に調べた結果と照合する
+    """
+
+    def __init__(
+        self, rules: Optional[list[tuple[list[SubRule], str]]]=None, verify: bool=False
+    ) -> None:
+        super().__init__(rules if rules is not None else [])
+        self.verify: bool = verify
+        self._constraints: list[tuple[Optional[set[str]], Optional[set[str]]]] = [
+            _get_rule_constraint(rule_list) for rule_list, _ in self
+        ]
+        self._candidates: dict[
+            tuple[str, str], list[tuple[int, tuple[list[SubRule], str]]]
+        ] = {}
+
+    def get_candidates(
+        self, word: Word
+    ) -> Optional[list[tuple[int, tuple[list[SubRule], str]]]]:
+        """
+            get candidate rules (with rule position) for the word
+            bpos, upos が決まっていない場合は None
+        """
+        bpos = word.ud_misc.get("BunsetuPositionType")
+        if bpos is None or len(word.en_pos) == 0:
+            return None
+        key = (bpos, word.get_ud_pos())
+        if key not in self._candidates:
+            self._candidates[key] = [
+                (rule_pos, rule_data)
+                for rule_pos, (rule_data, (bpos_set, upos_set))
+                in enumerate(zip(self, self._constraints))
+                if (bpos_set is None or key[0] in bpos_set)
+                and (upos_set is None or key[1] in upos_set)
+            ]
+        return self._candidates[key]
+
+
+def _intersect(base: Optional[set[str]], target: set[str]) -> set[str]:
+    return set(target) if base is None else base & target
+
+
+def _get_rule_constraint(
+    rule_list: list[SubRule]
+) -> tuple[Optional[set[str]], Optional[set[str]]]:
+    """
+        get (bpos, upos) the word must have to match the rule (None: no constraint)
+    """
+    bpos_set: Optional[set[str]] = None
+    upos_set: Optional[set[str]] = None
+    for ifunc, iargs, _ in rule_list:
+        if iargs is not SELECT_TRGT_POSIT["word"]:
+            continue
+        if ifunc.func is dep_rule_func.DEP_RULE_FUNC_LIST[("include", "bpos")]:
+            bpos_set = _intersect(bpos_set, set(ifunc.keywords["bpos"]))
+        elif ifunc.func is dep_rule_func.DEP_RULE_FUNC_LIST[("match", "bpos")]:
+            bpos_set = _intersect(bpos_set, {ifunc.keywords["bpos"]})
+        elif ifunc.func is dep_rule_func.DEP_RULE_FUNC_LIST[("include", "upos")]:
+            upos_set = _intersect(upos_set, set(ifunc.keywords["upos"]))
+    return bpos_set, upos_set
+
+
 def check_funcname(func_name: str, rule_set: RuleBase) -> list[str]:
     """
         check valid function name
@@ -68,11 +138,12 @@ def check_funcname(func_name: str, rule_set: RuleBase) -> list[str]:
     return _func_name
 
 
-def load_dep_rule(file_name: str) -> list[tuple[list[SubRule], str]]:
+def load_dep_rule(file_name: str, verify: bool=False) -> DepRuleSet:
     """
         load rule file
+        verify: 候補の絞り込みの結果を全ルールを調べた結果と照合する (デバッグ用)
     """
-    rule_set: RuleBase = cast(RuleBase, dict(YamlDict(file_name=file_name, auto_load=True)))
+    rule_set: RuleBase = cast(RuleBase, load_yaml_dict(file_name))
     full_rule_set: list[tuple[list[SubRule], str]] = []
     for rule_pair in rule_set["order_rule"]:
         sub_rules: list[SubRule] = []
@@ -83,14 +154,30 @@ def load_dep_rule(file_name: str) -> list[tuple[list[SubRule], str]]:
             if func == "include":
                 assert isinstance(elem_arg, list)
                 elem_arg = set(elem_arg)
+            str_func = "_".join([func, args, elements]) + "(" + str(elem_arg) + ")"
+            if func == "regex":
+                # 評価のたびに `re.match` でパターンを引かないよう、ここでコンパイルする
+                assert isinstance(elem_arg, str)
+                elem_arg = re.compile(elem_arg)
             ifunc: functools.partial[bool] = functools.partial(
                 dep_rule_func.DEP_RULE_FUNC_LIST[(func, elements)], **{elements: elem_arg}
             )
             iargs: Callable[[Optional[Word]], Union[None, list[Word]]] = SELECT_TRGT_POSIT[args]
-            str_func = "_".join([func, args, elements]) + "(" + str(elem_arg) + ")"
             sub_rules.append(SubRule(ifunc, iargs, str_func))
         full_rule_set.append((sub_rules, rule_pair["res"]))
-    return full_rule_set
+    return DepRuleSet(full_rule_set, verify=verify)
+
+
+def _match_rule(
+    word: Word, candidates: Iterable[tuple[int, tuple[list[SubRule], str]]]
+) -> Optional[tuple[int, list[SubRule], str]]:
+    """
+        return first matched rule
+    """
+    for rule_pos, (rule_list, en_rel) in candidates:
+        if all(ifunc(self=word, word=iargs(word)) for ifunc, iargs, _ in rule_list):
+            return rule_pos, rule_list, en_rel
+    return None
 
 
 def detect_ud_label(word: Word, target_dep_rule: list[tuple[list[SubRule], str]]) -> None:
@@ -104,21 +191,30 @@ def detect_ud_label(word: Word, target_dep_rule: list[tuple[list[SubRule], str]]
     word.child_words = word.get_child_words()
     word.sem_head_word = word.get_bunsetu_position_word("SEM_HEAD")
     word.syn_head_word = word.get_bunsetu_position_word("SYN_HEAD")
-    for rule_pos, rule_data in enumerate(target_dep_rule):
-        rule_list, en_rel = rule_data
-        flag_lst: Generator[bool, None, None] = (
-            functools.partial(ifunc, self=word, word=iargs(word))()
-            for ifunc, iargs, _ in rule_list
-        )
-        if all(flag_lst):
-            word.dep_label = en_rel
-            if word.debug:
-                rule_name_str: list[str] = [
-                    str_func for _, _, str_func in rule_list
-                ]
-                word.logger.debug("{}\n".format(str(word)))
-                word.logger.debug("{}:{} -> {}\n".format(rule_pos, rule_name_str, en_rel))
-                word.logger.debug("\n")
-            break
+    candidates: Optional[list[tuple[int, tuple[list[SubRule], str]]]] = None
+    if isinstance(target_dep_rule, DepRuleSet):
+        candidates = target_dep_rule.get_candidates(word)
+    if candidates is None:
+        matched = _match_rule(word, enumerate(target_dep_rule))
+    else:
+        matched = _match_rule(word, candidates)
+        if cast(DepRuleSet, target_dep_rule).verify:
+            linear = _match_rule(word, enumerate(target_dep_rule))
+            matched_pos = None if matched is None else matched[0]
+            linear_pos = None if linear is None else linear[0]
+            if matched_pos != linear_pos:
+                raise ValueError("different rule matched: {} (indexed) != {} (linear)\n{}".format(
+                    matched_pos, linear_pos, str(word)
+                ))
+    if matched is not None:
+        rule_pos, rule_list, en_rel = matched
+        word.dep_label = en_rel
+        if word.debug:
+            rule_name_str: list[str] = [
+                str_func for _, _, str_func in rule_list
+            ]
+            word.logger.debug("{}\n".format(str(word)))
+            word.logger.debug("{}:{} -> {}\n".format(rule_pos, rule_name_str, en_rel))
+            word.logger.debug("\n")
     if word.dep_label == "_undef_":
         word.dep_label = "dep"
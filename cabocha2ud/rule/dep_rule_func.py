@@ -18,7 +18,7 @@ FUNCTION_NAME_SIZE = 2
 
 """
 (include|match|regex)(word|parent|child|semhead|synhead)(pos|xpos|lemma|...)
-include=複数候補のどれかに一致、match=完全一致、regex=正規表現
+include=複数候補のどれかに一致、match=完全一致、regex=正規表現（`load_dep_rule` でコンパイル済み）
 word... はターゲットの語からみてどの単語の情報を見るか
 pos... は属性名
 """
@@ -89,7 +89,7 @@ def match_depnum(self: Word, word: Optional[List[Word]], depnum: int) -> bool:
 
 
 @register_function
-def regex_katuyo(self: Word, word: Optional[List[Word]], katuyo: str) -> bool:
+def regex_katuyo(self: Word, word: Optional[List[Word]], katuyo: re.Pattern[str]) -> bool:
     """その単語はその活用形を持つ   match_word_katuyou(target_katuyo)."""
     assert word is None or isinstance(word, list)
     if word is None:
@@ -97,13 +97,13 @@ def regex_katuyo(self: Word, word: Optional[List[Word]], katuyo: str) -> bool:
     for wrd in word:
         if wrd is None:
             return False
-        if re.match(katuyo, wrd.get_katuyo()):
+        if katuyo.match(wrd.get_katuyo()):
             return True
     return False
 
 
 @register_function
-def regex_xpos(self: Word, word: Optional[List[Word]], xpos: str) -> bool:
+def regex_xpos(self: Word, word: Optional[List[Word]], xpos: re.Pattern[str]) -> bool:
     """その単語はXPOSを持っている   regex_word_xpos(xpos)."""
     assert word is None or isinstance(word, list)
     if word is None:
@@ -111,7 +111,7 @@ def regex_xpos(self: Word, word: Optional[List[Word]], xpos: str) -> bool:
     for wrd in word:
         if wrd is None:
             return False
-        if re.match(xpos, wrd.get_xpos()):
+        if xpos.match(wrd.get_xpos()):
             return True
     return False
 
@@ -131,7 +131,7 @@ def match_luwpos(self: Word, word: Optional[list[Word]], luwpos: str) -> bool:
 
 
 @register_function
-def regex_luwpos(self: Word, word: Optional[List[Word]], luwpos: str) -> bool:
+def regex_luwpos(self: Word, word: Optional[List[Word]], luwpos: re.Pattern[str]) -> bool:
     """その単語は長単位品詞を持っている   regex_word_luwpos(target_xpos)."""
     assert word is None or isinstance(word, list)
     if word is None:
@@ -139,7 +139,7 @@ def regex_luwpos(self: Word, word: Optional[List[Word]], luwpos: str) -> bool:
     for wrd in word:
         if wrd is None:
             return False
-        if re.match(luwpos, wrd.get_luw_pos()):
+        if luwpos.match(wrd.get_luw_pos()):
             return True
     return False
 
@@ -187,7 +187,9 @@ def include_upos(self: Word, word: Optional[list[Word]], upos: list[str]) -> boo
 
 
 @register_function
-def regex_suffixstring(self: Word, word: Optional[list[Word]], suffixstring: str) -> bool:
+def regex_suffixstring(
+    self: Word, word: Optional[list[Word]], suffixstring: re.Pattern[str]
+) -> bool:
     """その単語からの末尾がre_str表現である."""
     assert word is None or isinstance(word, list)
     if word is None:
@@ -198,7 +200,7 @@ def regex_suffixstring(self: Word, word: Optional[list[Word]], suffixstring: str
         bunmatu_str = "".join([
             w.get_surface() for w in wrd.bunsetu[wrd.word_pos+1:]
         ])
-        if re.match(suffixstring, bunmatu_str):
+        if suffixstring.match(bunmatu_str):
             return True
     return False
 
@@ -226,7 +228,7 @@ def match_lemma(self: Word, word: Optional[List[Word]], lemma: str) -> bool:
 
 
 @register_function
-def regex_lemma(self: Word, word: Optional[List[Word]], lemma: str) -> bool:
+def regex_lemma(self: Word, word: Optional[List[Word]], lemma: re.Pattern[str]) -> bool:
     """その単語の日本語原型はjp_origin_listにある  regex_word_lemma()."""
     assert word is None or isinstance(word, list)
     if word is None:
@@ -234,7 +236,7 @@ def regex_lemma(self: Word, word: Optional[List[Word]], lemma: str) -> bool:
     for wrd in word:
         if wrd is None:
             return False
-        if re.match(lemma, wrd.get_origin()):
+        if lemma.match(wrd.get_origin()):
             return True
     return False
 
@@ -4,7 +4,7 @@
 import re
 from typing import TYPE_CHECKING, Generator, NamedTuple, TypedDict, cast
 
-from cabocha2ud.lib.yaml_dict import YamlDict
+from cabocha2ud.lib.rule_cache import load_yaml_dict
 
 if TYPE_CHECKING:
     from cabocha2ud.bd.word import Word
@@ -46,9 +46,83 @@ class POSRuleBase(TypedDict):
     rule: list[POSRule]
 
 
-def load_pos_rule(file_name: str=POS_RULE_FILE) -> list[tuple]:
+INSTANCE_KEYS = ("pos", "base_lexeme", "luw", "bpos", "parent_upos")
+REGEX_META_CHARS = set(".^$*+?{}[]\\|()")
+REGEX_OPTIONAL_CHARS = set("*?{")
+
+
+def get_literal_prefix(pattern: str) -> str:
+    """`re.match` でマッチする文字列が必ず持つ先頭の固定文字列を返す（なければ空文字列）."""
+    if "|" in pattern:
+        return ""
+    pattern = pattern.removeprefix("^")
+    for pos, char in enumerate(pattern):
+        if char not in REGEX_META_CHARS:
+            continue
+        if char in REGEX_OPTIONAL_CHARS:
+            # 直前の文字は省略されうる
+            return pattern[:max(pos - 1, 0)]
+        return pattern[:pos]
+    return pattern
+
+
+class POSRuleSet(list[tuple]):
+    """POS rule list with index.
+
+    ルールの順番はそのままに、`pos` の正規表現の先頭の固定文字列と `bpos` で
+    当てはまりうるルールを絞り込み、同じ `get_instance_for_pos` の結果はメモしておく.
+    """
+
+    def __init__(self, rules: list[tuple] | None=None) -> None:
+        """Init."""
+        super().__init__(rules if rules is not None else [])
+        self._constraints: list[tuple[str, str | None]] = [
+            (
+                get_literal_prefix(rule["pos"].pattern) if "pos" in rule else "",
+                rule.get("bpos")
+            )
+            for rule, _ in self
+        ]
+        self._candidates: dict[tuple[str, str], list[tuple]] = {}
+        self._memo: dict[tuple[str, ...], list[str]] = {}
+
+    def get_candidates(self, pos: str, bpos: str) -> list[tuple]:
+        """`pos` と `bpos` で当てはまりうるルールを返す（順番は元のまま）."""
+        key = (pos, bpos)
+        if key not in self._candidates:
+            self._candidates[key] = [
+                rule_data for rule_data, (prefix, rule_bpos) in zip(self, self._constraints)
+                if pos.startswith(prefix) and (rule_bpos is None or rule_bpos == bpos)
+            ]
+        return self._candidates[key]
+
+    def detect(self, inst: dict[str, str]) -> list[str]:
+        """最初に当てはまったルールのUD品詞を返す（なければ空）."""
+        key = tuple(inst[name] for name in INSTANCE_KEYS)
+        if key not in self._memo:
+            self._memo[key] = match_pos_rule(
+                inst, self.get_candidates(inst["pos"], inst["bpos"])
+            )
+        return self._memo[key]
+
+
+def match_pos_rule(inst: dict[str, str], target_pos_rule: list[tuple]) -> list[str]:
+    """最初に当てはまったルールのUD品詞を返す（なければ空）."""
+    for rule, en_pos in target_pos_rule:
+        flag_lst: Generator[bool, None, None] = (
+            rule[name].match(inst[name]) is not None
+            if isinstance(rule[name], REGEX_TYPE)
+            else rule[name] == inst[name]
+            for name in rule
+        )
+        if all(flag_lst):
+            return list(en_pos)
+    return []
+
+
+def load_pos_rule(file_name: str=POS_RULE_FILE) -> POSRuleSet:
     """Load rule file."""
-    rule_set: POSRuleBase = cast(POSRuleBase, dict(YamlDict(file_name=file_name, auto_load=True)))
+    rule_set: POSRuleBase = cast(POSRuleBase, load_yaml_dict(file_name))
     full_rule_set: list[tuple] = []
     for rule_pair in rule_set["rule"]:
         rule, result = rule_pair
@@ -57,7 +131,7 @@ def load_pos_rule(file_name: str=POS_RULE_FILE) -> list[tuple]:
             if name != "__comment":
                 nrule[name] = POS_RULE_FUNC[name](value)
         full_rule_set.append((nrule, result))
-    return full_rule_set
+    return POSRuleSet(full_rule_set)
 
 
 NEG_EXP = ["非", "不", "無", "未", "反", "異"]
@@ -91,16 +165,10 @@ def detect_ud_pos(word: "Word", target_pos_rule: list) -> None:
     inst = word.get_instance_for_pos()
     word.logger.debug(inst)
     word.logger.debug(target_pos_rule)
-    for rule, en_pos in list(target_pos_rule):
-        flag_lst: Generator[bool, None, None] = (
-            rule[name].match(inst[name]) is not None
-            if isinstance(rule[name], REGEX_TYPE)
-            else rule[name] == inst[name]
-            for name in rule
-        )
-        if all(flag_lst):
-            word.en_pos.extend(en_pos)
-            break
+    if isinstance(target_pos_rule, POSRuleSet):
+        word.en_pos.extend(target_pos_rule.detect(inst))
+    else:
+        word.en_pos.extend(match_pos_rule(inst, target_pos_rule))
 
 
 if __name__ == "__main__":
@@ -8,10 +8,9 @@ import argparse
 from dataclasses import dataclass
 from typing import TypedDict, cast
 
-import tomli
-
 from cabocha2ud.bd.sentence import Sentence
 from cabocha2ud.bd.word import Word
+from cabocha2ud.lib.rule_cache import load_toml
 
 REPLACE_OBJ_RULE_FILE = "conf/rule_objcase_list.toml"
 
@@ -83,9 +82,9 @@ class Rule:
         return True
 
 
-REP_OBJ_RULES: list[Rule] = []
-with open(REPLACE_OBJ_RULE_FILE, "r", encoding="utf-8") as rdr:
-    REP_OBJ_RULES = [Rule.to_obj(jdict) for jdict in tomli.loads(rdr.read())["rule"]]
+REP_OBJ_RULES: list[Rule] = [
+    Rule.to_obj(jdict) for jdict in load_toml(REPLACE_OBJ_RULE_FILE)["rule"]
+]
 
 
 def is_case(toks: list[Word], tpos: int, case_lst: list[str]) -> bool:
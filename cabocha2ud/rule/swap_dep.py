@@ -55,7 +55,7 @@ def swap_dep_without_child_from_sent(sent: "Sentence"):
     for word in sent.words():
         if word.dep_label in UDEP_LABEL_WITHOUT_CHILD:
             chrd = [
-                d for d in sent.get_ud_children(word, is_reconst=True)
+                d for d in sent.get_ud_children(word)
                 if cast("Word", sent.get_word_from_tokpos(d-1)).dep_label not in ["punct", "fixed"]
             ]
             if len(chrd) == 0:
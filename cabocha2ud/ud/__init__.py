@@ -1,13 +1,15 @@
 """Universal Dependency class."""
 
-from typing import Iterator, Optional, Union, cast
+from typing import Iterable, Iterator, NamedTuple, Optional, Union, cast
 
 from cabocha2ud.bd import BunsetsuDependencies
+from cabocha2ud.bd.document import Document
 from cabocha2ud.lib.iterate_function import iterate_ud_sentence
 from cabocha2ud.lib.logger import Logger
 from cabocha2ud.lib.text_object import TextObject
 from cabocha2ud.lib.yaml_dict import YamlDict
 from cabocha2ud.rule import dep
+from cabocha2ud.ud.index import ConllIndex, ConllSentenceEntry
 from cabocha2ud.ud.sentence import Header, Sentence
 from cabocha2ud.ud.util import Field as UField
 from cabocha2ud.ud.word import Misc
@@ -21,13 +23,14 @@ class UniversalDependencies:
         file_obj (:obj:`TextObject`): file object class.
         sentences (:obj:`list[Sentence]`) list of `list[Sentence]`
         options (:obj:`YamlDict`): options
+        indexed (bool): 索引（`ConllIndex`）を作り、文はアクセスされたときにパースする
 
     """
 
     def __init__(
         self, file_name: Optional[str]=None, sentences: Optional[list[Sentence]]=None,
         logger: Optional[Logger]=None,
-        options: YamlDict|None=None
+        options: YamlDict|None=None, indexed: bool=False
     ) -> None:
         """Init."""
         self.file_name: Optional[str] = file_name
@@ -38,8 +41,15 @@ class UniversalDependencies:
         self._sp = None
         if self.options.get("space_marker") is not None:
             self._sp = self.options.get("space_marker")
-        self._sentences: list[Sentence] = []
-        self.sentence_ids: list[str] = []
+        # `indexed` の場合、まだパースしていない文は `ConllSentenceEntry` のまま
+        self._sentences: list[Union[Sentence, ConllSentenceEntry]] = []
+        self._sentence_ids: list[str] = []
+        # sent_id -> 最初の位置（削除した位置は `_removed` に入れておき、まとめて詰める）
+        self._sent_id_index: dict[str, int] = {}
+        self._removed: set[int] = set()
+        # 2回以上出てくる sent_id（削除・更新のときだけ後ろを探す）
+        self._dup_sent_ids: set[str] = set()
+        self.index: Optional[ConllIndex] = None
         self.logger: Logger
         if logger:
             self.logger = logger
@@ -47,77 +57,177 @@ class UniversalDependencies:
             self.logger = self.options.get("logger") or Logger()
         if self.file_name is not None:
             self.file_obj = TextObject(file_name=self.file_name)
-            self.read_ud_file()
+            if indexed:
+                self.read_indexed_ud_file()
+            else:
+                self.read_ud_file()
         elif sentences is not None:
-            self._sentences = sentences
+            self.set_sentences(sentences)
 
     def __len__(self) -> int:
         """Length."""
-        return len(self._sentences)
+        return len(self._sentences) - len(self._removed)
 
     def __str__(self) -> str:
         """Get string."""
-        return "\n".join([str(s) for s in self._sentences])
+        self._compact()
+        return "\n".join([self._get_str(s) for s in self._sentences])
 
     def get_sp(self) -> str:
         """Get sp marker."""
         assert isinstance(self._sp, str)
         return self._sp
 
+    @property
+    def sentence_ids(self) -> list[str]:
+        """Return sent_id list (文と同じ順番)."""
+        self._compact()
+        return self._sentence_ids
+
+    @sentence_ids.setter
+    def sentence_ids(self, sent_ids: list[str]) -> None:
+        self._sentence_ids = list(sent_ids)
+        self._removed = set()
+        self._rebuild_sent_id_index()
+
+    def _rebuild_sent_id_index(self) -> None:
+        """Rebuild `sent_id` -> position dict."""
+        self._sent_id_index = {}
+        self._dup_sent_ids = set()
+        for spos, sent_id in enumerate(self._sentence_ids):
+            if sent_id in self._sent_id_index:
+                self._dup_sent_ids.add(sent_id)
+            else:
+                self._sent_id_index[sent_id] = spos
+
+    def _compact(self) -> None:
+        """削除した文を詰める."""
+        if len(self._removed) == 0:
+            return
+        removed = self._removed
+        self._sentences = [
+            sent for spos, sent in enumerate(self._sentences) if spos not in removed
+        ]
+        self._sentence_ids = [
+            sent_id for spos, sent_id in enumerate(self._sentence_ids) if spos not in removed
+        ]
+        self._removed = set()
+        self._rebuild_sent_id_index()
+        assert len(self._sentence_ids) == len(self._sentences)
+
+    def get_sentence_index(self, sent_id: str) -> int:
+        """Return position of `sent_id` (同じ `sent_id` があれば最初の位置)."""
+        self._compact()
+        return self._find_position(sent_id)
+
+    def _find_position(self, sent_id: str) -> int:
+        """Return position of `sent_id` (詰める前の位置)."""
+        if sent_id not in self._sent_id_index:
+            msg = f"sent_id `{sent_id}` is not found"
+            raise ValueError(msg)
+        return self._sent_id_index[sent_id]
+
     def sentences(self) -> list[Sentence]:
-        """Return sentences list."""
-        return self._sentences
+        """Return sentences list (`indexed` の場合はすべての文をパースする)."""
+        self._compact()
+        for spos, sent in enumerate(self._sentences):
+            if isinstance(sent, ConllSentenceEntry):
+                self._sentences[spos] = self._read_sentence(sent)
+        return cast(list[Sentence], self._sentences)
 
     def set_sentences(self, sents: list[Sentence]) -> None:
-        """Return sentences list."""
+        """Set sentences list (sent_id も更新する)."""
         self._sentences = list(sents)
+        sent_ids: list[str] = []
+        for cpos, cont in enumerate(self._sentences):
+            assert isinstance(cont, Sentence)
+            sent_id = cont.get_header("sent_id")
+            sent_ids.append(sent_id.get_value() if sent_id is not None else f"sent-{cpos:02}")
+        self.sentence_ids = sent_ids
 
     def get_sentence(self, index: int) -> Sentence:
         """Return one sentence for index."""
-        return self._sentences[index]
+        self._compact()
+        sent = self._sentences[index]
+        if isinstance(sent, ConllSentenceEntry):
+            sent = self._read_sentence(sent)
+            self._sentences[index] = sent
+        return sent
+
+    def _read_sentence(self, entry: ConllSentenceEntry) -> Sentence:
+        """Parse the sentence of index."""
+        assert self.index is not None
+        return self.index.read_sentence(entry, spt=self._sp, logger=self.logger)
+
+    def _get_str(self, sent: Union[Sentence, ConllSentenceEntry]) -> str:
+        """パースしていない文はファイルの内容をそのまま返す."""
+        if isinstance(sent, ConllSentenceEntry):
+            assert self.index is not None
+            return self.index.read_text(sent)
+        return str(sent)
+
+    def _unset_sent_id_index(self, spos: int) -> None:
+        """`spos` の文を `sent_id` の索引から外す（同じ sent_id の文が後ろにあればそちらを指す）."""
+        sent_id = self._sentence_ids[spos]
+        if self._sent_id_index.get(sent_id) != spos:
+            return
+        del self._sent_id_index[sent_id]
+        if sent_id not in self._dup_sent_ids:
+            return
+        for npos in range(spos + 1, len(self._sentence_ids)):
+            if npos not in self._removed and self._sentence_ids[npos] == sent_id:
+                self._sent_id_index[sent_id] = npos
+                break
+
+    def _remove_position(self, spos: int) -> None:
+        """`spos`（詰める前の位置）の文を削除済みにする."""
+        if spos in self._removed:
+            return
+        self._removed.add(spos)
+        self._unset_sent_id_index(spos)
 
     def remove_sentence_from_index(self, index: list[int]) -> None:
-        """Remove sentence by index list."""
-        ncontent: list[Sentence] = []
-        sids: list[str] = []
-        for spos, nsent in enumerate(self._sentences):
-            if spos not in index:
-                ncontent.append(nsent)
-                sent_id = nsent.get_header("sent_id")
-                assert sent_id is not None
-                sids.append(sent_id.get_value())
-        self._sentences = list(ncontent)
-        self.sentence_ids = list(sids)
-        assert len(self.sentence_ids) == len(self._sentences)
+        """Remove sentence by index list (実際に詰めるのは次に位置で参照するとき)."""
+        self._compact()
+        for spos in set(index):
+            if 0 <= spos < len(self._sentences):
+                self._remove_position(spos)
 
     def remove_sentence_from_sentid(self, sent_id_list: list[str]) -> None:
         """Remove sentence by sent_id's list."""
-        self.remove_sentence_from_index([
-            self.sentence_ids.index(sent_id) for sent_id in sent_id_list
-        ])
+        positions = [self._find_position(sent_id) for sent_id in sent_id_list]
+        for spos in positions:
+            self._remove_position(spos)
 
     def update_sentence_of_index(self, index: int, sent: Sentence) -> None:
         """Update sentence by index."""
         if index < 0:
             assert KeyError("`index` must be greater than or equal to 0")
-        sent_id = sent.get_header("sent_id")
+        self._compact()
         if len(self._sentences) < index:
             self._sentences.append(sent)
-            if sent_id is not None:
-                self.sentence_ids.append(sent_id.get_value())
-            else:
-                self.sentence_ids.append(f"sent-{len(self._sentences):02}")
+            self._sentence_ids.append("")
+            self._update_position(len(self._sentences) - 1, sent)
         else:
-            self._sentences[index] = sent
-            if sent_id is not None:
-                self.sentence_ids[index] = sent_id.get_value()
-            else:
-                self.sentence_ids[index] = f"sent-{len(self._sentences):02}"
-        assert len(self.sentence_ids) == len(self._sentences)
+            self._update_position(index, sent)
+
+    def _update_position(self, spos: int, sent: Sentence) -> None:
+        """`spos`（詰める前の位置）の文を置き換える."""
+        self._sentences[spos] = sent
+        self._unset_sent_id_index(spos)
+        sent_id = sent.get_header("sent_id")
+        size = len(self._sentences) - len(self._removed)
+        new_id = sent_id.get_value() if sent_id is not None else f"sent-{size:02}"
+        self._sentence_ids[spos] = new_id
+        if new_id in self._sent_id_index:
+            self._dup_sent_ids.add(new_id)
+        if self._sent_id_index.get(new_id, spos) >= spos:
+            self._sent_id_index[new_id] = spos
+        assert len(self._sentence_ids) == len(self._sentences)
 
     def update_sentence_of_sentid(self, sent_id: str, sent: Sentence) -> None:
         """Update sentence of sent_id."""
-        self.update_sentence_of_index(self.sentence_ids.index(sent_id), sent)
+        self._update_position(self._find_position(sent_id), sent)
 
     def read_ud_file(self, file_name: Optional[str]=None) -> None:
         """Read UD file."""
@@ -129,6 +239,20 @@ class UniversalDependencies:
             raise KeyError(msg)
         self.load(self.file_obj.read(), spt=self._sp)
 
+    def read_indexed_ud_file(self, file_name: Optional[str]=None) -> None:
+        """Read UD file with index (文はアクセスされたときにパースする)."""
+        if file_name is not None:
+            self.file_name = file_name
+            self.file_obj = TextObject(file_name=self.file_name)
+        if self.file_obj is None or self.file_name is None:
+            msg = "must give file-like content"
+            raise KeyError(msg)
+        self.index = ConllIndex.build(self.file_name)
+        if self._sp is None:
+            self._sp = self.index.space_marker
+        self._sentences = list(self.index.sentences)
+        self.sentence_ids = [entry.sent_id for entry in self.index.sentences]
+
     def load(self, str_content: Union[list[str], Iterator[str]], spt: Optional[str]=None) -> None:
         """Load UD from str list."""
         sent_datas = list(enumerate(iterate_ud_sentence(str_content)))
@@ -145,31 +269,34 @@ class UniversalDependencies:
                 spt = " "
             self._sp = spt
         assert self._sp is not None
+        self._compact()
         for sent_pos, sent in sent_datas:
             sent_obj = Sentence.load_from_list(sent, spt=self._sp, logger=self.logger)
             self._sentences.append(sent_obj)
             sent_id = sent_obj.get_header("sent_id")
             if sent_id is not None:
-                self.sentence_ids.append(sent_id.get_value())
+                self._sentence_ids.append(sent_id.get_value())
             else:
-                self.sentence_ids.append(f"sent-{sent_pos:02}")
-        assert len(self.sentence_ids) == len(self._sentences)
+                self._sentence_ids.append(f"sent-{sent_pos:02}")
+        self._rebuild_sent_id_index()
+        assert len(self._sentence_ids) == len(self._sentences)
 
     def write_ud_file(self, file_name: str) -> None:
         """Write UD file to `file_name`."""
         writer = TextObject(file_name=file_name, mode="w")
-        writer.write([str(s) for s in self._sentences])
+        self._compact()
+        writer.write([self._get_str(s) for s in self._sentences])
 
 def _generate_sentences(
-    doc, pos_rule: list, dep_rule: list[tuple[list[dep.SubRule], str]], skip_space: bool
+    doc: Document, pos_rule: list, dep_rule: list[tuple[list[dep.SubRule], str]], skip_space: bool
 ) -> Iterator[Sentence]:
     """BunsetsuDependencies から Sentence を生成する。"""
-    sentences = doc.convert_ud(pos_rule, dep_rule, skip_space=skip_space)
-    for sent in sentences:
-        yield Sentence.load_from_string(sent, spt=doc.space_marker)
+    doc.prepare_ud(pos_rule, dep_rule, skip_space=skip_space)
+    for sent in doc.sentences():
+        yield Sentence.load_from_bd(sent, spt=doc.space_marker)
 
 
-def _get_newdoc_text(doc) -> Optional[str]:
+def _get_newdoc_text(doc: Document) -> Optional[str]:
     """doc から newdoc のテキストを取得する。"""
     if doc.doc_attrib_xml is None:
         return None
@@ -201,8 +328,11 @@ def _iter_doc_contents(
 
 def _merge_newdoc_and_sentences(
     items: Iterator[Union[str, Sentence]]
-) -> tuple[list[Sentence], bool]:
-    """newdoc の文字列を直後の Sentence に統合する。"""
+) -> tuple[list[Sentence], list[str], bool]:
+    """newdoc の文字列を直後の Sentence に統合する。
+
+    文に統合されずに残った newdoc の文字列も返す.
+    """
     headers: list[str] = []
     sentences: list[Sentence] = []
     has_newdoc = False
@@ -215,7 +345,7 @@ def _merge_newdoc_and_sentences(
             item.set_header(0, Header(cont=head))
         headers = []
         sentences.append(item)
-    return sentences, has_newdoc
+    return sentences, headers, has_newdoc
 
 
 def _remove_space_after(uobj: UniversalDependencies) -> None:
@@ -230,10 +360,14 @@ def _remove_space_after(uobj: UniversalDependencies) -> None:
         if spos > 0:
             spos_lst.append(spos - 1)
     for spos in spos_lst:
-        sent = uobj.sentences()[spos]
-        misc = cast(Misc, sent.words()[-1][UField.MISC])
-        if "SpaceAfter" in misc:
-            misc.remove("SpaceAfter")
+        _remove_last_space_after(uobj.sentences()[spos])
+
+
+def _remove_last_space_after(sent: Sentence) -> None:
+    """文末の単語の SpaceAfter を除く."""
+    misc = cast(Misc, sent.words()[-1][UField.MISC])
+    if "SpaceAfter" in misc:
+        misc.remove("SpaceAfter")
 
 
 def fit(
@@ -245,14 +379,96 @@ def fit(
     """Convert BD to UD."""
     skip_space = uobj.options.get("skip_space", False)
     items = _iter_doc_contents(bobj, pos_rule, dep_rule, skip_space)
-    sentences, has_newdoc = _merge_newdoc_and_sentences(items)
+    sentences, _, has_newdoc = _merge_newdoc_and_sentences(items)
     uobj.set_sentences(sentences)
-    for cpos, cont in enumerate(uobj.sentences()):
-        sent_id = cont.get_header("sent_id")
-        if sent_id is not None:
-            uobj.sentence_ids.append(sent_id.get_value())
-        else:
-            uobj.sentence_ids.append(f"sent-{cpos:02}")
-    assert len(uobj.sentence_ids) == len(uobj.sentences())
     if has_newdoc:
         _remove_space_after(uobj)
+
+
+def fit_document(
+    uobj: UniversalDependencies,
+    doc: Document,
+    pos_rule: list,
+    dep_rule: list[tuple[list[dep.SubRule], str]],
+    doc_id: int,
+    prev_text: Optional[str],
+    headers: Optional[list[str]]=None,
+) -> list[str]:
+    """Convert one BD document to UD (for stream mode).
+
+    `uobj` の文は変換した文書の文で置き換えられる.
+    `headers` は前の文書（文がなかった文書）から持ち越した newdoc の文字列で、
+    文がなければ（この文書の newdoc を加えて）そのまま返すので次の文書に渡す.
+    newdoc 境界の SpaceAfter は次の文書を見ないと決まらないため、
+    `iterate_newdoc_boundary` の結果をみて呼び出し側で `remove_boundary_space_after` を使う.
+    """
+    skip_space = uobj.options.get("skip_space", False)
+    items: list[Union[str, Sentence]] = list(headers or [])
+    newdoc_text = _get_newdoc_text(doc)
+    if _should_add_newdoc(doc_id, newdoc_text, prev_text):
+        assert newdoc_text is not None
+        items.append(newdoc_text)
+    items.extend(_generate_sentences(doc, pos_rule, dep_rule, skip_space))
+    sentences, rest_headers, _ = _merge_newdoc_and_sentences(iter(items))
+    uobj.set_sentences(sentences)
+    return rest_headers
+
+
+class StreamDocument(NamedTuple):
+    """`iterate_newdoc_boundary` が返す文書の情報.
+
+    Attributes:
+        doc_id (int): 文書の位置
+        doc (Document): 文書
+        prev_text (Optional[str]): 直前の newdoc テキスト
+        is_boundary (bool): 文書末が newdoc 境界（またはファイル末尾）か
+            （次の文書に文があるとしたときの判定）
+        add_newdoc (bool): この文書の先頭に newdoc が入るか
+        has_newdoc (bool): この文書までに newdoc が入ったか
+
+    """
+
+    doc_id: int
+    doc: Document
+    prev_text: Optional[str]
+    is_boundary: bool
+    add_newdoc: bool
+    has_newdoc: bool
+
+
+def iterate_newdoc_boundary(
+    documents: Iterable[Document]
+) -> Iterator[StreamDocument]:
+    """文書ごとに `fit_document` に渡す情報と newdoc 境界かどうかを返す.
+
+    次の文書の先頭に newdoc が入るか（最後の文書ならファイル中に newdoc があるか）で
+    文書末の SpaceAfter を除くかが決まるため、1文書先読みする.
+    次の文書が（変換した結果）文のない文書なら境界は変わるので、呼び出し側で直す.
+    `Document` は `doc_attrib_xml` さえあればよい（`parse_header` のみでも可）.
+    """
+    prev_text: Optional[str] = None
+    has_newdoc = False
+    doc_iter = iter(documents)
+    doc: Optional[Document] = next(doc_iter, None)
+    doc_id = 0
+    while doc is not None:
+        next_doc: Optional[Document] = next(doc_iter, None)
+        cur_text = prev_text
+        newdoc_text = _get_newdoc_text(doc)
+        add_newdoc = _should_add_newdoc(doc_id, newdoc_text, prev_text)
+        if add_newdoc:
+            prev_text = newdoc_text
+            has_newdoc = True
+        if next_doc is None:
+            is_boundary = has_newdoc
+        else:
+            is_boundary = _should_add_newdoc(doc_id + 1, _get_newdoc_text(next_doc), prev_text)
+        yield StreamDocument(doc_id, doc, cur_text, is_boundary, add_newdoc, has_newdoc)
+        doc, doc_id = next_doc, doc_id + 1
+
+
+def remove_boundary_space_after(uobj: UniversalDependencies) -> None:
+    """newdoc 境界（または全体の末尾）にあたる最後の文の SpaceAfter を除く."""
+    if len(uobj) == 0:
+        return
+    _remove_last_space_after(uobj.sentences()[-1])
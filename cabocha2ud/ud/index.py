@@ -0,0 +1,110 @@
+"""Offset index of CoNLL-U file (random access to sentences).
+
+ファイルを一度だけ（mmapで）走査して、文（空行区切り）のバイト位置と `sent_id` を記録する.
+文は必要になったときだけパースする（`UniversalDependencies(indexed=True)` を参照）.
+"""
+
+import mmap
+import re
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from cabocha2ud.lib.logger import Logger
+from cabocha2ud.ud.sentence import Sentence
+
+ENCODING = "utf-8"
+
+# 空行（文の区切り）と文の属性（`sent_id`, `text`）. 改行は LF と CRLF のどちらでもよい
+BOUNDARY_RE = re.compile(
+    rb"^(?:(?P<blank>\r?\n)|# sent_id = (?P<sent_id>[^\r\n]*)\r?$"
+    rb"|# text = (?P<text>[^\r\n]*)\r?$)",
+    re.MULTILINE
+)
+
+
+def _is_zenkaku_text(text: str) -> bool:
+    """`UniversalDependencies.load` と同じく `# text` に全角スペースがあるか."""
+    return "　" in ("# text = " + text).split("=")[1].strip(" ")
+
+
+class ConllSentenceEntry(NamedTuple):
+    """文の位置（最後の行の改行まで、区切りの空行は含まない）と文ID."""
+
+    start: int
+    end: int
+    sent_id: str
+
+
+class ConllIndex:
+    """CoNLL-U file index.
+
+    Attributes:
+        file_name (str): CoNLL-U file name
+        sentences (list[ConllSentenceEntry]): 文ごとの位置
+        space_marker (str): `# text` から判定したスペース（`UniversalDependencies.load` と同じ）
+
+    """
+
+    def __init__(
+        self, file_name: str, sentences: list[ConllSentenceEntry], space_marker: str
+    ) -> None:
+        """Init."""
+        self.file_name: str = file_name
+        self.sentences: list[ConllSentenceEntry] = sentences
+        self.space_marker: str = space_marker
+        self._sent_ids: Optional[dict[str, int]] = None
+
+    def __len__(self) -> int:
+        """Return the number of sentences."""
+        return len(self.sentences)
+
+    @classmethod
+    def build(cls, file_name: str) -> "ConllIndex":
+        """Build index by scanning `file_name` once."""
+        sentences: list[ConllSentenceEntry] = []
+        space_marker = " "
+        if Path(file_name).stat().st_size == 0:
+            return cls(file_name, sentences, space_marker)
+        with Path(file_name).open("rb") as rdr, \
+                mmap.mmap(rdr.fileno(), 0, access=mmap.ACCESS_READ) as mem:
+            start = 0
+            sent_id: Optional[str] = None
+            for mobj in BOUNDARY_RE.finditer(mem):
+                if mobj.group("blank") is not None:
+                    if sent_id is None:
+                        sent_id = f"sent-{len(sentences):02}"
+                    sentences.append(ConllSentenceEntry(start, mobj.start(), sent_id))
+                    start, sent_id = mobj.end(), None
+                elif mobj.group("sent_id") is not None:
+                    if sent_id is None:
+                        sent_id = mobj.group("sent_id").decode(ENCODING)
+                elif _is_zenkaku_text(mobj.group("text").decode(ENCODING)):
+                    space_marker = "　"
+        return cls(file_name, sentences, space_marker)
+
+    def find_sent_id(self, sent_id: str) -> int:
+        """Return sentence position of `sent_id`."""
+        if self._sent_ids is None:
+            self._sent_ids = {}
+            for pos, sent in enumerate(self.sentences):
+                self._sent_ids.setdefault(sent.sent_id, pos)
+        if sent_id not in self._sent_ids:
+            msg = f"sent_id `{sent_id}` is not found in {self.file_name}"
+            raise KeyError(msg)
+        return self._sent_ids[sent_id]
+
+    def read_text(self, entry: ConllSentenceEntry) -> str:
+        """Read text of the sentence (最後の改行を含む, CRLF は LF にする)."""
+        with Path(self.file_name).open("rb") as rdr:
+            rdr.seek(entry.start)
+            return rdr.read(entry.end - entry.start).decode(ENCODING).replace("\r\n", "\n")
+
+    def read_sentence(
+        self, entry: ConllSentenceEntry, spt: Optional[str]=None, logger: Optional[Logger]=None
+    ) -> Sentence:
+        """Read and parse the sentence."""
+        text = self.read_text(entry)
+        lines = text[:-1].split("\n") if text != "" else []
+        return Sentence.load_from_list(
+            lines, spt=spt if spt is not None else self.space_marker, logger=logger
+        )
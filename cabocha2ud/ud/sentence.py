@@ -6,13 +6,16 @@ Universal Dependencies sentence class
 
 from __future__ import annotations
 
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 
 from cabocha2ud.lib.list_based_key import ListBasedKey
 from cabocha2ud.lib.logger import Logger
 from cabocha2ud.ud.util import Field
 from cabocha2ud.ud.word import Content, Misc, Word
 
+if TYPE_CHECKING:
+    from cabocha2ud.bd.sentence import Sentence as BDSentence
+
 
 class Header:
     """ Header class for Universal Dependencies
@@ -92,7 +95,7 @@ class Sentence:
         if self._sp is None:
             raise ValueError("space marker is not set")
         self.sentence_text = "".join([
-            wrd.get(Field.FORM).get_content() + (
+            wrd.get_value(Field.FORM) + (
                 self._sp if wrd.is_spaceafter() else ""
             )
         for wrd in self
@@ -199,6 +202,25 @@ class Sentence:
             spt=spt
         )
 
+    @staticmethod
+    def load_from_bd(bd_sent: BDSentence, spt: str=" ") -> Sentence:
+        """ build Sentence object from bd.Sentence (without CoNLL-U text round-trip)
+
+        `bd.Sentence.convert` と同じく単語（``update ud_misc``）、ヘッダの順で値を取る
+        """
+        bd_sent.update_word_pos()
+        sent = Sentence(spt=spt)
+        for wrd in bd_sent.words():
+            columns, misc_items = wrd.get_ud_columns()
+            sent.append(Word(contents=[
+                *[Content(id_, cont) for id_, cont in enumerate(columns)],
+                Misc.load_from_items(Field.MISC, misc_items)
+            ]))
+        for pos, (key, value) in enumerate(bd_sent.get_ud_header_items()):
+            sent.set_header(pos, Header(key=key, value=value))
+        sent.update_sentence()
+        return sent
+
     @staticmethod
     def load_from_list(
         sent_lst: list[str], spt: str=" ", logger: Optional[Logger]=None
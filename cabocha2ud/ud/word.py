@@ -7,7 +7,6 @@ Word class for UD
 """
 
 
-import bisect
 from typing import Optional, Union, cast
 
 from cabocha2ud.ud.util import Field
@@ -18,15 +17,21 @@ class Content:
         UD content class
     """
 
+    __slots__ = ("content", "id_")
+
     def __init__(self, id_: int, content: Optional[str]):
         self.id_: int = id_
-        self.field: int = Field(self.id_)
         self.content: str = content if content is not None else "_"
 
+    @property
+    def field(self) -> Field:
+        """ field of the content """
+        return Field(self.id_)
+
     def __eq__(self, __value: object) -> bool:
         if not isinstance(__value, Content):
             return NotImplemented
-        return self.id_ == __value.id_ and self.content == __value.content
+        return self.id_ == __value.id_ and self.get_content() == __value.get_content()
 
     def __str__(self) -> str:
         return self.get_content()
@@ -47,20 +52,42 @@ class Content:
 class Misc(Content):
     """
         Misc content class
+
+        `k=v|...` の文字列はキーが参照されるまで分割せず、
+        変更後の文字列は `str()` / `get_content()` で必要になるまで作らない
     """
 
+    __slots__ = ("_dcont", "_rendered")
+
     def __init__(self, id_: int, content: Optional[str]):
         super().__init__(id_, content)
-        self.keys: list[str] = []
-        self.dcont: dict[str, str] = {}
-        if content is not None:
-            self._load(content.split("|"))
+        # None: 未パース（content をそのまま使う）
+        self._dcont: Optional[dict[str, str]] = None
+        # False: 変更があり content を作り直す必要がある
+        self._rendered: bool = True
+        if content is None:
+            self._dcont = {}
+        elif "SpacesAfter" in content:
+            # SpacesAfter=Yes の正規化は読み込み時に行う
+            self._parse()
 
     def __str__(self) -> str:
         return self.get_content()
 
     def __contains__(self, key: str) -> bool:
-        return key in self.keys
+        return key in self.dcont
+
+    @property
+    def keys(self) -> list[str]:
+        """ sorted keys """
+        return sorted(self.dcont)
+
+    @property
+    def dcont(self) -> dict[str, str]:
+        """ key to value dict (parse content at first access) """
+        if self._dcont is None:
+            self._parse()
+        return cast(dict[str, str], self._dcont)
 
     @staticmethod
     def split_data(content: str):
@@ -68,45 +95,70 @@ class Misc(Content):
         data = content.split("=")
         return data[0], "=".join(data[1:])
 
-    def _load(self, content: list[str]) -> None:
-        _content = sorted([Misc.split_data(c) for c in content])
-        self.keys = [k for k, _ in _content]
-        self.dcont = dict((k, v) for k, v in _content)
-        if "SpacesAfter" in self.dcont and self.dcont["SpacesAfter"] == "Yes":
-            if "SpaceAfter" in self.dcont and self.dcont["SpaceAfter"] == "No":
-                self.remove("SpaceAfter")
-            self.remove("SpacesAfter")
+    @staticmethod
+    def find_value(content: str, key: str) -> Optional[str]:
+        """ find the value of key from `k=v|...` str without building dict """
+        for item in content.split("|"):
+            ckey, _, value = item.partition("=")
+            if ckey == key:
+                return value
+        return None
+
+    @staticmethod
+    def load_from_items(id_: int, items: list[tuple[str, str]]) -> "Misc":
+        """ load Misc object from (key, value) list (without splitting str) """
+        misc = Misc(id_, None)
+        misc._load_items(items)
+        misc._rendered = False
+        return misc
+
+    def _parse(self) -> None:
+        self._load_items([Misc.split_data(c) for c in self.content.split("|")])
+
+    def _load_items(self, items: list[tuple[str, str]]) -> None:
+        self._dcont = dict(sorted(items))
+        if self._dcont.get("SpacesAfter") == "Yes":
+            if self._dcont.get("SpaceAfter") == "No":
+                del self._dcont["SpaceAfter"]
+            del self._dcont["SpacesAfter"]
+            self._rendered = False
 
     def get_content_from_key(self, key: str) -> str:
         """ Get from key """
-        if key in self.dcont:
-            return self.dcont[key]
+        if self._dcont is None:
+            value = Misc.find_value(self.content, key)
+            return value if value is not None else "_"
+        if key in self._dcont:
+            return self._dcont[key]
         return "_"
 
     def remove(self, key: str) -> None:
         """ remove by str """
-        if key not in self.keys:
+        if key not in self.dcont:
             msg = f"cant't remove {key} because {key} not contained in MISC"
             raise KeyError(msg)
-        self.keys.remove(key)
         del self.dcont[key]
-        super().set_content("|".join(["{}={}".format(k, self.dcont[k]) for k in self.keys]))
+        self._rendered = False
 
     def update(self, key: str, value: str) -> None:
         """ update the value by key """
-        if key not in self.keys:
-            bisect.insort_left(self.keys, key)
         self.dcont[key] = value
-        super().set_content("|".join(["{}={}".format(k, self.dcont[k]) for k in self.keys]))
+        self._rendered = False
 
     def get_content(self) -> str:
         """ get content """
+        if not self._rendered:
+            self.content = "|".join(["{}={}".format(k, v) for k, v in sorted(self.dcont.items())])
+            self._rendered = True
         return self.content
 
     def set_content(self, content: str) -> None:
-        if content is not None:
-            self._load(content.split("|"))
-        super().set_content(content)
+        """ set content (parse at first key access) """
+        self.content = content if content is not None else "_"
+        self._dcont = None
+        self._rendered = True
+        if "SpacesAfter" in self.content:
+            self._parse()
 
 
 class Word:
@@ -131,26 +183,38 @@ class Word:
 
     """
 
-    def __init__(self, content: Optional[Union[str, list[str]]]=None):
-        self._contents: list[Content] = []
-        if content is not None:
+    __slots__ = ("_values", )
+
+    def __init__(
+        self, content: Optional[Union[str, list[str]]]=None,
+        contents: Optional[list[Content]]=None
+    ):
+        # MISC 以外は文字列のまま持ち、MISC は `Misc` として取り出されるまで文字列で持つ
+        self._values: list[Union[str, Misc]] = []
+        if contents is not None:
+            if len(contents) != len(Field):
+                raise ValueError("must set filed size " + str(len(Field)))
+            self.extend(contents)
+        elif content is not None:
             if isinstance(content, str):
                 self.set_by_str(content)
             else:
                 self.set_by_list(content)
         else:
-            for id_ in range(len(Field)):
-                self.append(Content(id_, "_"))
+            self._values = ["_"] * len(Field)
 
     def __str__(self):
-        return "\t".join([c.get_content() for c in self])
+        return "\t".join([str(v) for v in self._values])
 
     def is_spaceafter(self) -> bool:
         """ 
             if MISC SpaceAfter="Yes" or not include return True 
         """
-        misc = cast(Misc, self.get(Field.MISC))
-        res = misc.get_content_from_key("SpaceAfter")
+        misc = self._values[Field.MISC]
+        if isinstance(misc, str) and "SpacesAfter" not in misc:
+            # Misc を作らずに文字列のまま調べる
+            return Misc.find_value(misc, "SpaceAfter") is None
+        res = cast(Misc, self.get(Field.MISC)).get_content_from_key("SpaceAfter")
         return res == "_"
 
     def set_by_str(self, content: str):
@@ -161,11 +225,7 @@ class Word:
         """ set by str list """
         if len(content) != len(Field):
             raise ValueError("must set filed size " + str(len(Field)))
-        self.clear()
-        self.extend([
-            Misc(id_, cont) if id_ == Field.MISC else Content(id_, cont)
-            for id_, cont in enumerate(content)
-        ])
+        self._values = [cont if cont is not None else "_" for cont in content]
 
     def get(self, position: Union[Field, str, int]) -> Content:
         """ get content by position """
@@ -173,17 +233,18 @@ class Word:
             return self[Field[position]]
         return self[position]
 
+    def get_value(self, position: Union[Field, int]) -> str:
+        """ get content str by position (without creating `Content`) """
+        return str(self._values[position])
+
     def set(self, pos: Union[Field, str, int], content: Union[str, int]):
         """ set content by position """
         pos = Field[pos].value if isinstance(pos, str) else pos
-        if pos == Field.MISC:
-            self[pos] = Misc(pos, str(content))
-        else:
-            self[pos] = Content(pos, str(content))
+        self._values[pos] = str(content)
 
     def get_value_str_list(self) -> list[str]:
         """ get value """
-        return [str(content) for content in self]
+        return [str(v) for v in self._values]
 
     def __eq__(self, __value: object) -> bool:
         if not isinstance(__value, Word):
@@ -192,22 +253,52 @@ class Word:
 
     # --- list like interface ---
     def __iter__(self):
-        return iter(self._contents)
+        return (self[pos] for pos in range(len(self._values)))
 
     def __len__(self) -> int:
-        return len(self._contents)
+        return len(self._values)
 
     def __getitem__(self, index: int) -> Content:
-        return self._contents[index]
+        """ MISC 以外は列に紐づいた `Content` を返す（`set` 後の値が見える、値だけなら `get_value`） """
+        value = self._values[index]
+        if isinstance(value, Misc):
+            return value
+        if index == Field.MISC or index == -1:
+            misc = Misc(Field.MISC, value)
+            self._values[index] = misc
+            return misc
+        return _ColumnContent(self, index)
 
     def __setitem__(self, index: int, value: Content) -> None:
-        self._contents[index] = value
+        self._values[index] = value if isinstance(value, Misc) else value.get_content()
 
     def append(self, value: Content) -> None:
-        self._contents.append(value)
+        self._values.append(value if isinstance(value, Misc) else value.get_content())
 
     def extend(self, values: list[Content]) -> None:
-        self._contents.extend(values)
+        for value in values:
+            self.append(value)
 
     def clear(self) -> None:
-        self._contents.clear()
+        self._values.clear()
+
+
+class _ColumnContent(Content):
+    """
+        Content bound to a column of `Word` (`set_content` updates the word)
+    """
+
+    __slots__ = ("_word", )
+
+    def __init__(self, word: Word, id_: int):  # pylint: disable=super-init-not-called
+        self.id_ = id_
+        self._word = word
+
+    @property
+    def content(self) -> str:  # type: ignore[override]
+        """ content of the word's column """
+        return cast(str, self._word._values[self.id_])
+
+    @content.setter
+    def content(self, content: str) -> None:
+        self._word._values[self.id_] = content
@@ -0,0 +1,41 @@
+"""
+UD label（dep_rule）の判定のベンチマーク
+
+cabocha ファイルを読み込んで UD に変換したあと、すべての単語に対して
+`detect_ud_label` をやり直す時間を測る（`--linear` は候補の絞り込みをせず全ルールを順に調べる）
+"""
+
+import argparse
+import time
+
+from cabocha2ud.bd import BunsetsuDependencies
+from cabocha2ud.rule.dep import detect_ud_label, load_dep_rule
+from cabocha2ud.rule.pos import load_pos_rule
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("cabocha_file")
+    parser.add_argument("--dep-rule-file", default="conf/dep_suw_rule.yaml")
+    parser.add_argument("--pos-rule-file", default="conf/pos_suw_rule.yaml")
+    parser.add_argument("-r", "--repeat", type=int, default=3)
+    parser.add_argument("--linear", action="store_true")
+    args = parser.parse_args()
+    pos_rule = load_pos_rule(args.pos_rule_file)
+    dep_rule = load_dep_rule(args.dep_rule_file)
+    bobj = BunsetsuDependencies(file_name=args.cabocha_file)
+    for doc in bobj:
+        doc.prepare_ud(pos_rule, dep_rule)
+    words = [wrd for sent in bobj.sentences() for wrd in sent.words()]
+    target_rule = list(dep_rule) if args.linear else dep_rule
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for wrd in words:
+            detect_ud_label(wrd, target_rule)
+    sec = time.perf_counter() - start
+    total = len(words) * args.repeat
+    print(f"words: {len(words):,} x {args.repeat}: {sec:.3f} sec ({total / sec:,.0f} words/sec)")
+
+
+if __name__ == "__main__":
+    main()
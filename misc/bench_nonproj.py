@@ -0,0 +1,53 @@
+"""
+非交差（non-projective）の判定のベンチマーク
+
+`-n` 単語の木を `-t` 個作り（`-c` の割合の単語はランダムな単語にかける）、
+全単語について `get_caused_nonprojectivities` を呼ぶ場合と
+`get_all_caused_nonprojectivities` でまとめて求める場合の時間を比べる
+"""
+
+import argparse
+import random
+import time
+
+from cabocha2ud.lib.dependency import (
+    get_all_caused_nonprojectivities,
+    get_caused_nonprojectivities,
+)
+
+
+def _build(size: int, cross: float, rnd: random.Random) -> list[int]:
+    """ほとんどの単語が右隣の近くにかかる木（根は最後の単語）."""
+    tree = [-1] + [min(size, nid + rnd.randint(1, 3)) for nid in range(1, size + 1)]
+    tree[size] = 0
+    for nid in range(1, size):
+        if rnd.random() < cross:
+            # 子孫にかけるとループになるので、右側の単語にかける
+            tree[nid] = rnd.randint(nid + 1, size)
+    return tree
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--size", type=int, default=500)
+    parser.add_argument("-t", "--trees", type=int, default=20)
+    parser.add_argument("-c", "--cross", type=float, default=0.05)
+    args = parser.parse_args()
+    rnd = random.Random(0)
+    trees = [_build(args.size, args.cross, rnd) for _ in range(args.trees)]
+    start = time.perf_counter()
+    expected = [
+        {nid: get_caused_nonprojectivities(nid, tree) for nid in range(1, len(tree))}
+        for tree in trees
+    ]
+    print(f"get_caused_nonprojectivities: {time.perf_counter() - start:.3f} sec")
+    start = time.perf_counter()
+    result = [get_all_caused_nonprojectivities(tree) for tree in trees]
+    print(f"get_all_caused_nonprojectivities: {time.perf_counter() - start:.3f} sec")
+    assert result == expected
+    crossing = sum(len(nodes) for res in result for nodes in res.values())
+    print(f"trees: {args.trees} x {args.size} words, crossing: {crossing:,}")
+
+
+if __name__ == "__main__":
+    main()
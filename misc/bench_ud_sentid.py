@@ -0,0 +1,52 @@
+"""
+UniversalDependencies の sent_id による更新・削除のベンチマーク
+
+`-n` 文の `UniversalDependencies` を作り、
+`-r` 文を `update_sentence_of_sentid` で置き換えたあと、`remove_sentence_from_sentid` で
+1文ずつ削除する場合とまとめて削除する場合の時間を表示する
+"""
+
+import argparse
+import random
+import time
+
+from cabocha2ud.ud import UniversalDependencies
+
+
+def _build(size: int) -> UniversalDependencies:
+    uobj = UniversalDependencies()
+    uobj.load([
+        line for spos in range(size) for line in [
+            f"# sent_id = s{spos:06}", "# text = 猫",
+            "1\t猫\t猫\tNOUN\t名詞-普通名詞-一般\t_\t0\troot\t_\tSpaceAfter=No", ""
+        ]
+    ])
+    return uobj
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--size", type=int, default=100000)
+    parser.add_argument("-r", "--remove", type=int, default=10000)
+    args = parser.parse_args()
+    uobj = _build(args.size)
+    targets = [f"s{spos:06}" for spos in random.Random(0).sample(range(args.size), args.remove)]
+    start = time.perf_counter()
+    for sent_id in targets:
+        uobj.update_sentence_of_sentid(sent_id, uobj.get_sentence(0))
+    print(f"update {args.remove:,} / {args.size:,}: {time.perf_counter() - start:.3f} sec")
+    uobj = _build(args.size)
+    start = time.perf_counter()
+    for sent_id in targets:
+        uobj.remove_sentence_from_sentid([sent_id])
+    assert len(uobj.sentence_ids) == args.size - args.remove
+    print(f"remove {args.remove:,} / {args.size:,} (one by one): {time.perf_counter() - start:.3f} sec")
+    uobj = _build(args.size)
+    start = time.perf_counter()
+    uobj.remove_sentence_from_sentid(targets)
+    assert len(uobj.sentence_ids) == args.size - args.remove
+    print(f"remove {args.remove:,} / {args.size:,} (bulk): {time.perf_counter() - start:.3f} sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ from typing import cast
 
 from cabocha2ud.lib.yaml_dict import YamlDict
 from cabocha2ud.bd import BunsetsuDependencies
+from cabocha2ud.bd.index import CabochaIndex
 from cabocha2ud.bd.word import Word
 
 
@@ -22,6 +23,10 @@ def _get_argparser() -> configargparse.ArgumentParser:
     parser.add_argument("-s", "--skip-space", default=False, action="store_true")
     parser.add_argument("-m", "--space-marker",
                         choices=["zenkaku", "hankaku"], default="zenkaku", help="スペースに何を使うか")
+    parser.add_argument("--doc-id", type=str, default=None, help="指定した文書IDの文書のみ読む（索引を使う）")
+    parser.add_argument("--sent-id", type=str, default=None, help="指定した文IDを含む文書のみ読む（索引を使う）")
+    parser.add_argument("--save-index", action="store_true",
+                        help="--doc-id/--sent-id の索引を[FILE].idxに保存して次から使う")
     parser.add_argument("--debug", action="store_true")
     parser.add_argument("-w", "--writer", type=configargparse.FileType("w"), default="-")
     return parser
@@ -39,7 +44,15 @@ def main() -> None:
         "space_marker": args.space_marker, "bunsetu_func": args.bunsetu_func,
         "debug": args.debug, "is_skip_space": args.skip_space
     })
-    bobj = BunsetsuDependencies(file_name=args.base_file, options=options)
+    if args.doc_id is not None or args.sent_id is not None:
+        index = CabochaIndex.load(args.base_file, save=args.save_index)
+        bobj = BunsetsuDependencies(options=options)
+        bobj.read_indexed_document(index, (
+            index.find_doc_id(args.doc_id) if args.doc_id is not None
+            else index.find_sent_id(args.sent_id)
+        ))
+    else:
+        bobj = BunsetsuDependencies(file_name=args.base_file, options=options)
     for doc in bobj.documents():
         doc.detect_ud_dependencies()
         sss = 0